@@ -21,20 +21,28 @@ import re
 import os
 import html
 import copy
+import hashlib
+import base64
+import io
 import ipaddress
 import socket
 import webbrowser
 import shutil
 import subprocess
-from functools import partial
+import tempfile
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import quote
 from datetime import datetime, timedelta
 from pathlib import Path
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog, colorchooser
-from PIL import Image, ImageTk
+from tkinter import ttk, messagebox, scrolledtext, colorchooser, filedialog, simpledialog
+from PIL import Image, ImageDraw, ImageTk
 import threading
+import queue
 
 # 파일 경로 설정
 SCRIPT_DIR = Path(__file__).parent
@@ -51,6 +59,8 @@ HOME_DATA_JSON = SCRIPT_DIR / "home_data.json"
 IMAGES_DIR = SCRIPT_DIR / "images"
 HOME_IMAGES_DIR = IMAGES_DIR / "home"
 BACKUP_DIR = SCRIPT_DIR / "backups"
+THUMB_CACHE_DIR = IMAGES_DIR / ".thumbcache"  # UI 썸네일 디스크 캐시 (배포 대상 아님)
+THUMB_CACHE_MAX_AGE_DAYS = 30
 BACKUP_METADATA_FILES = {"VERSION.txt", "CHANGELOG.md", "SELECTED.txt"}
 DEFAULT_GITHUB_REPO_URL = "https://github.com/jeonhyerin97/jeonhyerin-portfolio"
 
@@ -91,9 +101,126 @@ MAIN_MAX_SIZE = 2000       # 메인 이미지 (상세페이지 첫 이미지)
 SUB_MAX_SIZE = 2000        # 서브 이미지 최대 크기
 MODEL_MAX_SIZE = 1200      # 모델 이미지 최대 크기
 SLIDE_MAX_SIZE = 1600      # 슬라이드 이미지 최대 크기
+HOME_PREVIEW_MAX_SIZE = 1600  # 홈 편집기 미리보기용 원본 축소 크기
+POS_PREVIEW_CACHE_SIZE = 8  # 커버 위치 편집기에서 크기별로 보관할 확대 미리보기 수
 WEBP_QUALITY = 80          # WebP 품질 (75-85 권장)
+WEBP_METHOD_INTERACTIVE = 4  # WebP 인코딩 속도/압축 (업로드 시, 0=빠름 ~ 6=최대 압축)
+WEBP_METHOD_ARCHIVE = 6      # WebP 최대 압축 (느림)
 JPEG_QUALITY = 80          # JPEG 품질 (fallback)
 USE_WEBP = True            # WebP 포맷 사용 여부
+WEBP_PASSTHROUGH_MAX_BYTES = 500_000  # 이보다 작고 이미 규격에 맞는 WebP 는 재인코딩하지 않음
+_EXIF_ORIENTATION_TAG = 0x0112             # EXIF Orientation 태그 (274)
+_EXIF_ROTATIONS = {3: 180, 6: 270, 8: 90}  # Orientation 값 -> 회전 각도
+_VALID_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.webp'})  # 카테고리에 표시/집계하는 이미지 확장자
+_RE_INDEXED_NAME = re.compile(r'^(\d+)\.')  # 01.webp, 3.jpg 같은 순번 파일명
+_RE_SUB_IMAGE_NAME = re.compile(r'^\d{2}\.')  # 서브 이미지 파일명 (01.webp ~ 99.webp)
+_RE_DIGITS = re.compile(r'\d+')
+_RE_COVER_POS_PERCENT = re.compile(r'(-?\d+(?:\.\d+)?)%')  # cover_position 의 백분율 값 (30%, 12.5%)
+_COVER_POS_KEYWORDS = {'left': 0, 'center': 50, 'right': 100, 'top': 0, 'bottom': 100}
+_LINK_STYLES = ('highlight', 'underline')  # 링크 마크업의 스타일 값 (팝업 라디오버튼 순서)
+# 대표 이미지 파일명 (우선순위 순)
+_IMAGE_EXT_PRIORITY = ('.jpg', '.jpeg', '.png', '.webp')
+_THUMB_IMAGE_NAMES = tuple(f"{stem}{ext}" for stem in ('thumb', 'cover') for ext in _IMAGE_EXT_PRIORITY)
+_MAIN_IMAGE_NAMES = tuple(f"main{ext}" for ext in _IMAGE_EXT_PRIORITY)
+
+
+def _next_index(folder, exts=None, pattern=_RE_INDEXED_NAME):
+    """
+    폴더 안 순번 파일명의 최댓값 + 1
+    
+    개수가 아닌 최댓값을 쓰므로 중간 번호가 비어 있어도 기존 파일을 덮어쓰지 않음
+    """
+    max_n = 0
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                m = pattern.match(entry.name)
+                if not m:
+                    continue
+                if exts is not None and os.path.splitext(entry.name)[1].lower() not in exts:
+                    continue
+                max_n = max(max_n, int(m.group(1)))
+    except FileNotFoundError:
+        pass
+    return max_n + 1
+
+
+def _file_stamp(path):
+    """(mtime_ns, size) 로 파일이 디스크에서 바뀌었는지 비교 (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _write_text_atomic(path, text):
+    """임시 파일에 쓴 뒤 os.replace 로 교체해 중간에 끊긴 파일이 남지 않게 한다."""
+    # 같은 경로를 동시에 쓰더라도 서로의 임시 파일을 덮어쓰지 않도록 매번 고유한 이름 사용
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp",
+                                    dir=os.path.dirname(os.fspath(path)) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        # mkstemp 는 0600 으로 만들므로 기존 파일 권한(없으면 0644)을 유지
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _parse_cover_position(value):
+    """
+    cover_position 문자열 ("center center", "30% 70%" 등)을 (x, y) 백분율로 변환
+    
+    빠졌거나 알 수 없는 값은 50 (가운데)
+    """
+    coords = []
+    for part in value.split()[:2]:
+        m = _RE_COVER_POS_PERCENT.fullmatch(part)
+        coords.append(float(m.group(1)) if m else _COVER_POS_KEYWORDS.get(part, 50))
+    coords.extend([50] * (2 - len(coords)))
+    return coords[0], coords[1]
+
+
+def _make_markdown_link(text, url, style):
+    """사이트에서 쓰는 링크 마크업 [텍스트](URL|스타일) 생성 (style: 'highlight' / 'underline')"""
+    return f"[{text}]({url}|{style})"
+
+
+def _dispatch_wheel(event):
+    """
+    전역 <MouseWheel> 핸들러 - 포인터 아래에서 가장 가까운 스크롤 영역의 핸들러만 호출
+    
+    포커스가 아닌 포인터 위치로 찾으므로 다른 탭/창의 canvas 는 스크롤되지 않음
+    """
+    try:
+        widget = event.widget.winfo_containing(event.x_root, event.y_root)
+    except (AttributeError, KeyError, tk.TclError):
+        widget = None
+    while widget is not None and not hasattr(widget, '_wheel_handler'):
+        widget = widget.master
+    if widget is not None:
+        return widget._wheel_handler(event)
+
+
+def _register_wheel_area(canvas, handler):
+    """
+    canvas 를 휠 스크롤 영역으로 등록 (포인터가 canvas 나 그 안의 위젯 위에 있으면 handler 호출)
+    
+    전역 바인딩은 처음 등록할 때 _dispatch_wheel 하나만 걸고, 각 영역은 handler 만 보관
+    """
+    canvas._wheel_handler = handler
+    if not canvas.bind_all("<MouseWheel>"):
+        canvas.bind_all("<MouseWheel>", _dispatch_wheel)
 
 
 class ModernStyle:
@@ -112,7 +239,12 @@ class ModernStyle:
     DANGER = "#cc3333"
     SUCCESS = "#28a745"
     
+    # 토글 버튼(비율 선택 등)의 선택/비선택 색상
+    SELECTED_STYLE = {'bg': ACCENT, 'fg': 'white'}
+    UNSELECTED_STYLE = {'bg': BG_WHITE, 'fg': TEXT_PRIMARY}
+    
     @classmethod
+    @lru_cache(maxsize=32)
     def get_font(cls, size=11, weight="normal"):
         return ("Segoe UI", size, weight)
 
@@ -129,7 +261,8 @@ class ImageOptimizer:
     """
     
     @staticmethod
-    def optimize_for_web(image_path, max_size, quality=None, use_webp=None):
+    def optimize_for_web(image_path, max_size, quality=None, use_webp=None, output_path=None,
+                         method=WEBP_METHOD_INTERACTIVE):
         """
         웹용 이미지 최적화
         
@@ -138,6 +271,9 @@ class ImageOptimizer:
             max_size: 최대 크기 (px)
             quality: 품질 (75-85 권장)
             use_webp: WebP 포맷 사용 여부
+            output_path: 저장 경로 (확장자는 포맷에 맞게 변경됨).
+                지정하면 원본을 그대로 두고 이 경로에 바로 저장
+            method: WebP 인코더 method (기본값 4, 최대 압축은 WEBP_METHOD_ARCHIVE)
         
         Returns:
             (output_path, reduction_percent)
@@ -148,37 +284,78 @@ class ImageOptimizer:
             use_webp = USE_WEBP
             
         try:
-            img = Image.open(image_path)
             original_size = os.path.getsize(image_path)
             
-            # 1. EXIF 회전 처리
-            img = ImageOptimizer._fix_orientation(img)
-            
-            # 2. 리사이즈 (비율 유지)
-            if max(img.size) > max_size:
-                ratio = max_size / max(img.size)
-                new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+            # 이미 최적화된 WebP 는 헤더만 읽고 그대로 사용 (재인코딩하면 오히려 커질 수 있음)
+            if use_webp and original_size < WEBP_PASSTHROUGH_MAX_BYTES:
+                with Image.open(image_path) as probe:
+                    passthrough = (
+                        probe.format == 'WEBP'
+                        and probe.mode == 'RGB'
+                        and max(probe.size) <= max_size
+                        and not ImageOptimizer._orientation_angle(probe)
+                    )
+                if passthrough:
+                    target = Path(output_path if output_path is not None else image_path).with_suffix('.webp')
+                    if output_path is not None:
+                        shutil.copyfile(image_path, target)
+                    elif Path(image_path) != target:
+                        os.replace(image_path, target)
+                    return target, 0
+            
+            # 디코딩은 with 블록 안에서 끝내고 파일 핸들을 바로 반환
+            # (배치 처리 중 열린 파일/디코딩 버퍼가 GC 전까지 쌓이지 않도록)
+            with Image.open(image_path) as src:
+                # 0. 큰 JPEG 는 디코딩 단계에서 1/2~1/8 로 축소 (JPEG 외 포맷은 무시됨)
+                if max(src.size) > max_size * 2:
+                    src.draft('RGB', (max_size, max_size))
+                src.load()
+                img = src
+                
+                # 팔레트(P) 이미지는 먼저 풀어야 LANCZOS 로 축소됨 (P 모드 resize 는 NEAREST 로 고정)
+                # 투명색이 있으면 RGBA 로 풀어 아래 흰 배경 합성을 거치게 함
+                if img.mode == 'P':
+                    img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+                
+                # 1. 리사이즈 (비율 유지) - 회전해도 긴 변은 같으므로 원본 방향 그대로 먼저 축소
+                if max(img.size) > max_size:
+                    ratio = max_size / max(img.size)
+                    new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
+                    img = img.resize(new_size, Image.Resampling.LANCZOS)
+                
+                # 2. EXIF 회전 처리 (축소된 이미지에서 수행해 전체 해상도 회전을 피함)
+                angle = ImageOptimizer._orientation_angle(src)
+                if angle:
+                    img = img.rotate(angle, expand=True)
+                
+                # 변환이 없었으면 닫히는 원본 대신 사본을 사용
+                if img is src:
+                    img = src.copy()
             
             # 3. 색상 모드 변환
-            if img.mode == 'RGBA':
-                # 투명 배경을 흰색으로 변환
+            if img.mode == 'RGBA' and img.getextrema()[3][0] < 255:
+                # 투명 배경을 흰색으로 변환 (완전 불투명이면 아래 convert 로 충분)
                 background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])
+                background.paste(img, mask=img.getchannel('A'))
                 img = background
+                del background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
             
             # 4. WebP 또는 JPEG로 저장
+            keep_source = output_path is not None
+            target = Path(output_path) if keep_source else image_path
             if use_webp:
-                output_path = image_path.with_suffix('.webp')
-                img.save(output_path, 'WEBP', quality=quality, method=6)
+                output_path = target.with_suffix('.webp')
+                img.save(output_path, 'WEBP', quality=quality, method=method)
             else:
-                output_path = image_path.with_suffix('.jpg')
-                img.save(output_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+                output_path = target.with_suffix('.jpg')
+                # 4:2:0 크로마 서브샘플링을 명시 (quality 값과 무관하게 일정한 결과)
+                img.save(output_path, 'JPEG', quality=quality, optimize=True, progressive=True,
+                         subsampling=2)
             
-            # 5. 원본이 다른 확장자였으면 삭제
-            if image_path != output_path and image_path.exists():
+            # 5. 원본이 다른 확장자였으면 삭제 (별도 저장 경로를 받은 경우는 원본 유지)
+            if not keep_source and image_path != output_path and image_path.exists():
                 os.remove(str(image_path))
             
             # 6. 용량 감소율 계산
@@ -192,38 +369,151 @@ class ImageOptimizer:
             return image_path, 0
     
     @staticmethod
-    def _fix_orientation(img):
-        """EXIF 회전 정보에 따라 이미지 회전"""
+    def is_web_ready(image_path, max_size, use_webp=None):
+        """
+        이미 웹용 포맷/크기인지 헤더만 읽어 확인 (픽셀은 디코딩하지 않음)
+        
+        이미지로 열 수 없는 파일은 다시 최적화해도 소용없으므로 True 로 취급
+        """
+        if use_webp is None:
+            use_webp = USE_WEBP
         try:
-            from PIL import ExifTags
-            for orientation in ExifTags.TAGS.keys():
-                if ExifTags.TAGS[orientation] == 'Orientation':
-                    break
-            exif = img._getexif()
-            if exif:
-                orientation_value = exif.get(orientation)
-                if orientation_value == 3:
-                    img = img.rotate(180, expand=True)
-                elif orientation_value == 6:
-                    img = img.rotate(270, expand=True)
-                elif orientation_value == 8:
-                    img = img.rotate(90, expand=True)
+            with Image.open(image_path) as probe:
+                return (probe.format == ('WEBP' if use_webp else 'JPEG')
+                        and max(probe.size) <= max_size)
+        except Exception:
+            return True
+    
+    @staticmethod
+    def _orientation_angle(img):
+        """EXIF Orientation 에 해당하는 회전 각도 (회전이 필요 없으면 None)"""
+        try:
+            return _EXIF_ROTATIONS.get(img.getexif().get(_EXIF_ORIENTATION_TAG))
+        except Exception:
+            return None
+    
+    @staticmethod
+    def create_thumbnail(image_path, size=THUMBNAIL_SIZE, resample=Image.Resampling.BILINEAR):
+        """
+        썸네일 생성 (UI 표시용)
+        
+        작은 미리보기에는 BILINEAR 로 충분하고, 화질이 중요한 곳만 resample 로 LANCZOS 지정
+        """
+        try:
+            data = ImageOptimizer._thumbnail_png(image_path, size, resample)
+            if data is None:
+                return None
+            try:
+                return tk.PhotoImage(data=data)
+            except tk.TclError:
+                # 깨진 캐시가 계속 재사용되지 않도록 지움
+                ImageOptimizer._discard_thumbnail_cache(image_path, size, resample)
+                return None
         except:
+            return None
+    
+    _thumb_cache_pruned = False
+    
+    @staticmethod
+    def _thumbnail_cache_file(image_path, size, resample=Image.Resampling.BILINEAR):
+        """
+        파일 식별자/수정시각/파일크기/썸네일 크기로 캐시 파일 경로 계산
+        
+        경로 대신 inode(Windows 는 file ID)를 쓰므로 순서 변경/카테고리 이동처럼
+        이름만 바뀐 파일도 캐시를 그대로 재사용함
+        """
+        stat = os.stat(image_path)
+        identity = stat.st_ino or Path(image_path).resolve()
+        key = f"{identity}:{stat.st_mtime_ns}:{stat.st_size}:{size[0]}x{size[1]}:{int(resample)}"
+        return THUMB_CACHE_DIR / f"{hashlib.blake2s(key.encode()).hexdigest()[:16]}.png"
+    
+    @staticmethod
+    def _prune_thumbnail_cache():
+        """오래된 썸네일 캐시 정리 (백그라운드 스레드)"""
+        cutoff = (datetime.now() - timedelta(days=THUMB_CACHE_MAX_AGE_DAYS)).timestamp()
+        try:
+            with os.scandir(THUMB_CACHE_DIR) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
             pass
-        return img
     
     @staticmethod
-    def create_thumbnail(image_path, size=THUMBNAIL_SIZE):
-        """썸네일 생성 (UI 표시용)"""
+    def _thumbnail_png(image_path, size, resample=Image.Resampling.BILINEAR):
+        """
+        썸네일을 base64 PNG 로 반환 (워커 스레드에서 실행, Tk 객체는 만들지 않음)
+        
+        tk.PhotoImage(data=...) 에 바로 넘길 수 있어 ImageTk 변환이 필요 없고,
+        디스크 캐시가 있으면 디코딩 없이 파일 내용만 읽음
+        """
+        # 이미 썸네일 크기 이하인 PNG 는 Tk 가 바로 읽을 수 있으므로 파일을 그대로 넘김
+        if Path(image_path).suffix.lower() == '.png':
+            try:
+                with Image.open(image_path) as probe:
+                    fits = probe.format == 'PNG' and probe.width <= size[0] and probe.height <= size[1]
+                if fits:
+                    return base64.b64encode(Path(image_path).read_bytes())
+            except Exception:
+                pass
+        
+        try:
+            cache_file = ImageOptimizer._thumbnail_cache_file(image_path, size, resample)
+        except OSError:
+            cache_file = None
+        
+        if cache_file is not None:
+            if not ImageOptimizer._thumb_cache_pruned:
+                ImageOptimizer._thumb_cache_pruned = True
+                threading.Thread(target=ImageOptimizer._prune_thumbnail_cache, daemon=True).start()
+            try:
+                return base64.b64encode(cache_file.read_bytes())
+            except OSError:
+                pass
+        
         try:
             img = Image.open(image_path)
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except:
+            # JPEG 는 목표 크기의 2배까지만 디코딩해 전체 IDCT 를 피함
+            img.draft('RGB', (size[0] * 2, size[1] * 2))
+            # draft 가 없는 WebP/PNG 는 reducing_gap 으로 먼저 정수배 reduce() 후 리샘플링
+            img.thumbnail(size, resample, reducing_gap=2.0)
+            # CMYK 등 PNG 로 저장할 수 없는 모드는 RGB(A) 로 변환
+            if img.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+                img = img.convert('RGBA' if 'A' in img.mode else 'RGB')
+            buf = io.BytesIO()
+            img.save(buf, 'PNG', optimize=False, compress_level=1)
+        except Exception:
             return None
+        
+        data = buf.getvalue()
+        if cache_file is not None:
+            # 임시 파일에 쓴 뒤 교체해 쓰는 도중의 파일을 다른 스레드가 읽지 않게 함
+            # (같은 키를 동시에 쓸 수 있으므로 임시 파일명은 스레드별로)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            try:
+                THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_bytes(data)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+        return base64.b64encode(data)
+    
+    @staticmethod
+    def _discard_thumbnail_cache(image_path, size, resample=Image.Resampling.BILINEAR):
+        """Tk 가 읽지 못한 썸네일 캐시 파일 삭제"""
+        try:
+            os.remove(ImageOptimizer._thumbnail_cache_file(image_path, size, resample))
+        except OSError:
+            pass
     
     @staticmethod
-    def process_batch(file_paths, target_folder, image_type='sub'):
+    def process_batch(file_paths, target_folder, image_type='sub', on_progress=None, cancel_event=None):
         """
         배치 이미지 처리 파이프라인
         
@@ -236,6 +526,9 @@ class ImageOptimizer:
             file_paths: 이미지 파일 경로 리스트
             target_folder: 저장할 폴더
             image_type: 'thumb', 'main', 'sub', 'model', 'slide'
+            on_progress: 이미지 하나가 끝날 때마다 (done, total, reduction) 로 호출
+                (워커 스레드에서 호출되므로 Tk 위젯을 직접 건드리면 안 됨)
+            cancel_event: set 되면 아직 시작하지 않은 이미지는 건너뜀
         
         Returns:
             (processed_files, total_reduction)
@@ -261,13 +554,13 @@ class ImageOptimizer:
             target_folder = target_folder / "slide_images"
             target_folder.mkdir(exist_ok=True)
         
-        processed_files = []
-        total_reduction = 0
         ext = '.webp' if USE_WEBP else '.jpg'
         
+        # 순번 이미지는 기존 파일 뒤에 이어서 번호를 붙임
+        first_num = _next_index(target_folder) if image_type in ('sub', 'model', 'slide') else 1
+        
+        jobs = []
         for i, file_path in enumerate(file_paths):
-            src = Path(file_path)
-            
             # 파일명 결정
             if image_type == 'thumb':
                 new_name = f"thumb{ext}"
@@ -275,22 +568,99 @@ class ImageOptimizer:
                 new_name = f"main{ext}"
             elif image_type == 'sub':
                 # 01, 02, 03... 형식
-                new_name = f"{str(i + 1).zfill(2)}{ext}"
+                new_name = f"{str(first_num + i).zfill(2)}{ext}"
             else:
                 # 1, 2, 3... 형식
-                new_name = f"{i + 1}{ext}"
-            
-            # 파일 복사
-            dst = target_folder / new_name
-            shutil.copy(str(src), str(dst))
-            
-            # 최적화
-            optimized_path, reduction = ImageOptimizer.optimize_for_web(dst, max_size)
-            processed_files.append(optimized_path)
-            total_reduction += reduction
+                new_name = f"{first_num + i}{ext}"
+            jobs.append((Path(file_path), target_folder / new_name))
+        
+        progress_lock = threading.Lock()
+        done = [0]
+        
+        def process_one(job):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            src, dst = job
+            # 복사본을 만들지 않고 원본에서 바로 타겟 경로로 최적화
+            optimized_path, reduction = ImageOptimizer.optimize_for_web(src, max_size, output_path=dst)
+            if optimized_path == src:
+                # 최적화 실패 시 원본을 원래 확장자 그대로 복사
+                optimized_path = dst.with_suffix(src.suffix.lower())
+                shutil.copyfile(str(src), str(optimized_path))
+            if on_progress:
+                with progress_lock:
+                    done[0] += 1
+                    on_progress(done[0], len(jobs), reduction)
+            return optimized_path, reduction
+        
+        # 이미지마다 독립적이므로 병렬 처리 (Pillow 인코더는 GIL 을 해제함)
+        # thumb/main 처럼 같은 파일명을 덮어쓰는 경우는 순서를 지키도록 순차 처리
+        targets = [dst for _, dst in jobs]
+        if len(jobs) > 1 and len(set(targets)) == len(targets):
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+                results = list(pool.map(process_one, jobs))
+        else:
+            results = [process_one(job) for job in jobs]
+        results = [r for r in results if r is not None]
         
-        avg_reduction = total_reduction / len(file_paths) if file_paths else 0
+        processed_files = [optimized_path for optimized_path, _ in results]
+        total_reduction = sum(reduction for _, reduction in results)
+        avg_reduction = total_reduction / len(results) if results else 0
         return processed_files, avg_reduction
+    
+    @staticmethod
+    def process_batch_async(widget, file_paths, target_folder, image_type='sub',
+                            on_progress=None, on_done=None):
+        """
+        process_batch 를 백그라운드 스레드에서 실행 (Tk 메인 루프를 막지 않음)
+        
+        진행 상황은 queue 로 넘겨 widget.after(50) 루프에서 메인 스레드로 전달
+        
+        Args:
+            widget: after() 를 호출할 Tk 위젯
+            on_progress: 메인 스레드에서 (done, total, reduction) 로 호출
+            on_done: 메인 스레드에서 (processed_files, avg_reduction) 로 호출
+        
+        Returns:
+            cancel_event (set() 하면 남은 이미지 처리를 중단)
+        """
+        events = queue.Queue()
+        cancel_event = threading.Event()
+        
+        def worker():
+            try:
+                result = ImageOptimizer.process_batch(
+                    file_paths, target_folder, image_type,
+                    on_progress=lambda *args: events.put(('progress', args)),
+                    cancel_event=cancel_event,
+                )
+            except Exception as e:
+                print(f"Batch error: {e}")
+                result = ([], 0)
+            events.put(('done', result))
+        
+        def drain():
+            try:
+                while True:
+                    kind, args = events.get_nowait()
+                    if kind == 'progress':
+                        if on_progress:
+                            on_progress(*args)
+                    else:
+                        if on_done:
+                            on_done(*args)
+                        return
+            except queue.Empty:
+                pass
+            try:
+                widget.after(50, drain)
+            except tk.TclError:
+                # 위젯이 닫혔으면 작업만 중단
+                cancel_event.set()
+        
+        threading.Thread(target=worker, daemon=True).start()
+        widget.after(50, drain)
+        return cancel_event
 
 
 class GitAutomation:
@@ -313,6 +683,9 @@ class GitAutomation:
         "git"  # PATH에 등록된 경우
     ]
     
+    # 한 번 찾은 Git 경로는 프로세스 전체에서 재사용 (매번 git --version 실행 방지)
+    _GIT_EXE_CACHE = None
+    
     def __init__(self, repo_path):
         """
         Args:
@@ -323,6 +696,8 @@ class GitAutomation:
     
     def _find_git(self):
         """Git 실행 파일 경로 찾기"""
+        if GitAutomation._GIT_EXE_CACHE:
+            return GitAutomation._GIT_EXE_CACHE
         for git_path in self.GIT_PATHS:
             if Path(git_path).exists() or git_path == "git":
                 try:
@@ -333,8 +708,9 @@ class GitAutomation:
                         encoding='utf-8'
                     )
                     if result.returncode == 0:
+                        GitAutomation._GIT_EXE_CACHE = git_path
                         return git_path
-                except:
+                except (OSError, subprocess.SubprocessError):
                     continue
         return None
     
@@ -402,6 +778,36 @@ class GitAutomation:
             return len(stdout.strip()) > 0
         return False
     
+    def get_full_status(self):
+        """
+        git status --porcelain=v2 --branch 한 번으로 저장소/변경사항/브랜치 확인
+        
+        Returns:
+            {'is_repo': bool, 'is_dirty': bool, 'has_untracked': bool, 'branch': str}
+        """
+        status = {'is_repo': False, 'is_dirty': False, 'has_untracked': False, 'branch': "unknown"}
+        # 상위 폴더의 저장소를 찾아 올라가지 않도록 repo_path/.git 을 직접 지정
+        # (저장소가 아니면 git 이 실패하므로 별도 확인 없이 프로세스 하나로 끝남)
+        success, stdout, _ = self._run_git(
+            '--git-dir', str(self.repo_path / ".git"), '--work-tree', str(self.repo_path),
+            'status', '--porcelain=v2', '--branch',
+        )
+        if not success:
+            # 실패 원인이 저장소가 아니어서인지는 .git 존재 여부로만 구분 (파일 확인, 프로세스 없음)
+            status['is_repo'] = self.is_git_repo()
+            return status
+        status['is_repo'] = True
+        for line in stdout.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                if head != "(detached)":
+                    status['branch'] = head
+            elif line and not line.startswith('#'):
+                status['is_dirty'] = True
+                if line.startswith('? '):
+                    status['has_untracked'] = True
+        return status
+    
     def get_status(self):
         """현재 상태 반환"""
         success, stdout, stderr = self._run_git('status', '--short')
@@ -414,9 +820,10 @@ class GitAutomation:
         success, stdout, stderr = self._run_git('add', '-A')
         return success, stdout or stderr
     
-    def commit(self, message):
-        """커밋 생성"""
-        success, stdout, stderr = self._run_git('commit', '-m', message)
+    def commit(self, message, all_tracked=False):
+        """커밋 생성 (all_tracked=True 면 추적 중인 파일의 변경/삭제를 함께 스테이징)"""
+        args = ('commit', '-a', '-m', message) if all_tracked else ('commit', '-m', message)
+        success, stdout, stderr = self._run_git(*args)
         return success, stdout or stderr
 
     @staticmethod
@@ -520,12 +927,13 @@ class GitAutomation:
         Returns:
             (success, message)
         """
-        # Git 저장소 확인
-        if not self.is_git_repo():
+        # 저장소/변경사항/브랜치를 status 한 번으로 확인
+        status = self.get_full_status()
+        if not status['is_repo']:
             return False, "❌ Git 저장소가 아닙니다."
         
         # 변경사항 확인
-        if not self.has_changes():
+        if not status['is_dirty']:
             return True, "ℹ️ 변경사항이 없습니다."
         
         # 커밋 메시지 생성
@@ -537,13 +945,15 @@ class GitAutomation:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
             commit_msg = f"Update portfolio content: {timestamp}"
         
-        # git add
-        success, msg = self.add_all()
-        if not success:
-            return False, f"❌ git add 실패: {msg}"
-        
-        # git commit
-        success, msg = self.commit(commit_msg)
+        # git add + commit
+        # 새 파일이 없으면 commit -a 한 번으로 스테이징까지 처리 (새 파일은 -a 로 잡히지 않음)
+        if status['has_untracked']:
+            success, msg = self.add_all()
+            if not success:
+                return False, f"❌ git add 실패: {msg}"
+            success, msg = self.commit(commit_msg)
+        else:
+            success, msg = self.commit(commit_msg, all_tracked=True)
         if not success:
             return False, f"❌ git commit 실패: {msg}"
         
@@ -552,7 +962,8 @@ class GitAutomation:
         if not success:
             return False, f"❌ git push 실패: {msg}"
         
-        branch = self.get_current_branch()
+        # commit/push 로 브랜치가 바뀌지 않으므로 처음 확인한 값을 사용
+        branch = status['branch']
         return True, f"✅ 배포 완료!\n\n브랜치: {branch}\n커밋: {commit_msg}\n\nNetlify 자동 배포가 시작됩니다."
 
 
@@ -679,6 +1090,9 @@ class DragDropManager:
     
     def _move_image(self, source_zone, target_zone, image_path):
         """이미지를 소스 카테고리에서 타겟 카테고리로 이동"""
+        # 어느 한쪽이라도 백그라운드 처리 중이면 번호가 엇갈리므로 옮기지 않음
+        if source_zone._refuse_if_busy() or target_zone._refuse_if_busy():
+            return
         try:
             image_path = Path(image_path)
             if not image_path.exists():
@@ -698,29 +1112,27 @@ class DragDropManager:
             elif target_type == 'sub':
                 target_folder = project_folder
                 # 다음 번호 찾기
-                existing = list(project_folder.glob("[0-9][0-9].*"))
-                next_num = len(existing) + 1
+                next_num = _next_index(project_folder)
                 new_name = f"{str(next_num).zfill(2)}{image_path.suffix}"
             elif target_type == 'model':
                 target_folder = project_folder / "model_images"
                 target_folder.mkdir(exist_ok=True)
-                existing = list(target_folder.glob("*.*"))
-                valid_existing = [f for f in existing if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']]
-                next_num = len(valid_existing) + 1
+                next_num = _next_index(target_folder, _VALID_IMAGE_EXTS)
                 new_name = f"{next_num}{image_path.suffix}"
             elif target_type == 'slide':
                 target_folder = project_folder / "slide_images"
                 target_folder.mkdir(exist_ok=True)
-                existing = list(target_folder.glob("*.*"))
-                valid_existing = [f for f in existing if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']]
-                next_num = len(valid_existing) + 1
+                next_num = _next_index(target_folder, _VALID_IMAGE_EXTS)
                 new_name = f"{next_num}{image_path.suffix}"
             else:
                 return
             
-            # 파일 이동
+            # 파일 이동 (같은 디스크면 rename 한 번으로 끝남, 다른 디스크면 복사 후 삭제)
             target_path = target_folder / new_name
-            shutil.move(str(image_path), str(target_path))
+            try:
+                os.replace(image_path, target_path)
+            except OSError:
+                shutil.move(str(image_path), str(target_path))
             
             # 양쪽 카테고리 새로고침
             source_zone.load_images()
@@ -748,26 +1160,100 @@ class CaptionManager:
     """이미지 캡션 관리"""
     
     CAPTION_FILE = "captions.json"
+    FLUSH_DELAY = 1.0  # 연속 편집을 모아서 한 번에 쓰기 위한 지연 (초)
+    
+    # 폴더별 캡션 캐시 (write-behind)
+    # _cache[folder] = (captions, 마지막으로 읽거나 쓴 파일의 mtime_ns)
+    _cache = {}
+    _dirty = set()
+    _flush_timers = {}
+    _lock = threading.RLock()
+    
+    @staticmethod
+    def _file_mtime(caption_file):
+        try:
+            return caption_file.stat().st_mtime_ns
+        except OSError:
+            return None
     
     @staticmethod
     def load_captions(project_folder):
         """캡션 데이터 로드"""
-        caption_file = Path(project_folder) / CaptionManager.CAPTION_FILE
+        folder = Path(project_folder)
+        caption_file = folder / CaptionManager.CAPTION_FILE
+        with CaptionManager._lock:
+            cached = CaptionManager._cache.get(folder)
+            # 아직 기록되지 않은 변경이 있거나 파일이 그대로면 캐시 사용
+            if cached and (folder in CaptionManager._dirty
+                           or cached[1] == CaptionManager._file_mtime(caption_file)):
+                return dict(cached[0])
+        
+        captions = {}
         if caption_file.exists():
             try:
                 with open(caption_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    captions = json.load(f)
             except:
                 return {}
-        return {}
+        with CaptionManager._lock:
+            if folder not in CaptionManager._dirty:
+                CaptionManager._cache[folder] = (captions, CaptionManager._file_mtime(caption_file))
+        return dict(captions)
     
     @staticmethod
     def save_captions(project_folder, captions):
-        """캡션 데이터 저장"""
-        caption_file = Path(project_folder) / CaptionManager.CAPTION_FILE
-        Path(project_folder).mkdir(parents=True, exist_ok=True)
-        with open(caption_file, 'w', encoding='utf-8') as f:
-            json.dump(captions, f, ensure_ascii=False, indent=2)
+        """캡션 데이터 저장 (잠시 모았다가 파일에 기록)"""
+        folder = Path(project_folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        with CaptionManager._lock:
+            CaptionManager._cache[folder] = (dict(captions), None)
+            CaptionManager._dirty.add(folder)
+            timer = CaptionManager._flush_timers.pop(folder, None)
+            if timer:
+                timer.cancel()
+            timer = threading.Timer(CaptionManager.FLUSH_DELAY, CaptionManager._flush, args=(folder,))
+            timer.daemon = True
+            CaptionManager._flush_timers[folder] = timer
+            timer.start()
+    
+    @staticmethod
+    def _flush(folder):
+        """대기 중인 캡션을 captions.json 에 원자적으로 기록"""
+        with CaptionManager._lock:
+            CaptionManager._flush_timers.pop(folder, None)
+            if folder not in CaptionManager._dirty:
+                return
+            CaptionManager._dirty.discard(folder)
+            captions = CaptionManager._cache[folder][0]
+            # 그 사이 프로젝트 폴더가 삭제됐으면 다시 만들지 않음
+            if not folder.exists():
+                CaptionManager._cache.pop(folder, None)
+                return
+            caption_file = folder / CaptionManager.CAPTION_FILE
+            try:
+                _write_text_atomic(caption_file, json.dumps(captions, ensure_ascii=False, indent=2))
+            except OSError as e:
+                print(f"캡션 저장 오류 ({folder}): {e}")
+                CaptionManager._cache.pop(folder, None)
+                return
+            CaptionManager._cache[folder] = (captions, CaptionManager._file_mtime(caption_file))
+    
+    @staticmethod
+    def flush(project_folder):
+        """이 폴더의 대기 중인 캡션을 즉시 기록"""
+        folder = Path(project_folder)
+        with CaptionManager._lock:
+            timer = CaptionManager._flush_timers.pop(folder, None)
+            if timer:
+                timer.cancel()
+            CaptionManager._flush(folder)
+    
+    @staticmethod
+    def flush_all():
+        """대기 중인 모든 캡션을 즉시 기록 (배포 전/종료 시, 프로젝트 폴더 이동/삭제 전)"""
+        with CaptionManager._lock:
+            for folder in list(CaptionManager._dirty):
+                CaptionManager.flush(folder)
     
     @staticmethod
     def get_caption_key(image_path, image_type):
@@ -819,7 +1305,8 @@ class CaptionDialog(tk.Toplevel):
         preview_frame = tk.Frame(self, bg=ModernStyle.BG_LIGHT)
         preview_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
         
-        thumb = ImageOptimizer.create_thumbnail(self.image_path, size=(150, 150))
+        thumb = ImageOptimizer.create_thumbnail(self.image_path, size=(150, 150),
+                                                resample=Image.Resampling.LANCZOS)
         if thumb:
             self._thumb = thumb  # 참조 유지
             tk.Label(preview_frame, image=thumb, bg=ModernStyle.BG_LIGHT).pack(pady=10)
@@ -910,9 +1397,21 @@ class CaptionDialog(tk.Toplevel):
         self.destroy()
 
 
+# DropZone 썸네일 디코딩용 공유 스레드 풀 (Pillow 디코더는 GIL 을 해제함)
+_THUMB_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="thumb")
+
+# 만들어 둔 썸네일 PhotoImage (inode, mtime, size) -> PhotoImage
+# 카테고리 간 이동이나 편집창을 다시 열 때 디코딩 없이 재사용
+_THUMB_PHOTO_LRU = OrderedDict()
+_THUMB_PHOTO_LRU_SIZE = 256
+
+
 class DropZone(tk.Frame):
     """드래그앤드롭 가능한 이미지 등록 영역"""
     
+    # 마지막으로 이미지를 고른 폴더 (모든 DropZone 이 공유)
+    _last_dir = None
+    
     def __init__(self, parent, image_type, title, project_folder, on_change=None, drag_manager=None, **kwargs):
         super().__init__(parent, **kwargs)
         
@@ -929,6 +1428,14 @@ class DropZone(tk.Frame):
         
         self.item_frames = {}
         self.reorder_preview_key = None
+        self._thumb_futures = []  # [(경로 문자열, Future)] 디코딩 중인 썸네일
+        self._thumb_poll_id = None
+        self._pending_display = None  # 예약된 _update_display (after_idle id)
+        self._pending_scrollregion = None  # 예약된 scrollregion 갱신 (after_idle id)
+        self._items = {}  # 항목 키(_item_signature) -> 위젯 묶음, 다시 그릴 때 재사용
+        self._item_order = []
+        self._batch_cancel = None  # add_images 백그라운드 처리 취소용 Event
+        self._deleting = False  # delete_selected 백그라운드 삭제 진행 중
         self.configure(bg=ModernStyle.BG_WHITE, relief='solid', borderwidth=1)
         self.create_ui()
         self.load_images()
@@ -994,6 +1501,12 @@ class DropZone(tk.Frame):
         self.empty_label.bind('<Button-1>', lambda e: self.add_images())
     
     def _on_container_configure(self, event):
+        # 항목을 여러 개 pack 하는 동안 <Configure> 가 연달아 오므로 idle 시점에 한 번만 계산
+        if self._pending_scrollregion is None:
+            self._pending_scrollregion = self.after_idle(self._apply_scrollregion)
+    
+    def _apply_scrollregion(self):
+        self._pending_scrollregion = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
     def _on_canvas_configure(self, event):
@@ -1001,6 +1514,8 @@ class DropZone(tk.Frame):
     
     def _on_mousewheel(self, event):
         self.canvas.xview_scroll(int(-1*(event.delta/120)), "units")
+        # 바깥 스크롤 영역의 전역 휠 핸들러까지 전달되지 않도록 중단
+        return "break"
     
     def _get_slide_folder(self):
         """슬라이드 이미지 폴더 반환 (별도 폴더 사용)"""
@@ -1021,64 +1536,88 @@ class DropZone(tk.Frame):
         self.check_vars.clear()
         
         if not self.project_folder.exists():
-            self._update_display()
+            self._schedule_display()
             return
         
-        if self.image_type == 'thumb':
-            # 썸네일 이미지 (그리드용 정사각형): thumb.jpg
-            for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                thumb = self.project_folder / f"thumb{ext}"
-                if thumb.exists():
-                    self.images = [thumb]
-                    break
-            # fallback: cover.jpg (하위 호환성)
-            if not self.images:
-                for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                    cover = self.project_folder / f"cover{ext}"
-                    if cover.exists():
-                        self.images = [cover]
-                        break
-        
-        elif self.image_type == 'main':
-            # 메인 이미지 (상세페이지용): main.jpg
-            for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                main = self.project_folder / f"main{ext}"
-                if main.exists():
-                    self.images = [main]
+        if self.image_type in ('thumb', 'main'):
+            # 썸네일(그리드용 정사각형): thumb.jpg, 없으면 cover.jpg (하위 호환성)
+            # 메인(상세페이지용): main.jpg
+            # 확장자별로 exists() 를 반복하지 않고 scandir 한 번으로 찾음
+            names = _THUMB_IMAGE_NAMES if self.image_type == 'thumb' else _MAIN_IMAGE_NAMES
+            try:
+                with os.scandir(self.project_folder) as entries:
+                    present = {entry.name.lower(): entry.path for entry in entries}
+            except OSError:
+                present = {}
+            for name in names:
+                if name in present:
+                    self.images = [Path(present[name])]
                     break
         
         elif self.image_type == 'sub':
             # 서브 이미지: 01.jpg, 02.jpg, ... (두 자리 숫자)
-            for f in sorted(self.project_folder.glob("[0-9][0-9].*")):
-                if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                    self.images.append(f)
+            self.images = self._scan_images(self.project_folder, _RE_SUB_IMAGE_NAME)
         
         elif self.image_type == 'model':
-            model_folder = self.project_folder / "model_images"
-            if model_folder.exists():
-                for f in sorted(model_folder.glob("*.*"), key=lambda x: self._sort_key(x)):
-                    if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                        self.images.append(f)
+            self.images = self._scan_images(self.project_folder / "model_images")
         
         elif self.image_type == 'slide':
             # 슬라이드 이미지: slide_images 폴더에서 로드
-            slide_folder = self._get_slide_folder()
-            if slide_folder.exists():
-                for f in sorted(slide_folder.glob("*.*"), key=lambda x: self._sort_key(x)):
-                    if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                        self.images.append(f)
+            self.images = self._scan_images(self._get_slide_folder())
         
+        self._schedule_display()
+    
+    def _scan_images(self, folder, pattern=None):
+        """
+        os.scandir 한 번으로 이미지 파일만 골라 번호순으로 정렬
+        
+        pattern 이 있으면 파일명이 일치하는 것만 포함
+        """
+        found = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot <= 0 or name[dot:].lower() not in _VALID_IMAGE_EXTS:
+                        continue
+                    if pattern is not None and not pattern.match(name):
+                        continue
+                    if entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            return []
+        return sorted(found, key=lambda p: (self._sort_key(p), p.name))
+    
+    def _schedule_display(self):
+        """
+        화면 갱신을 idle 시점으로 미뤄 한 번으로 합침
+        
+        self.images 는 load_images 에서 바로 갱신되므로 호출 측은 그대로 사용 가능하고,
+        삭제/순서 변경/이동처럼 load_images 가 연달아 불려도 위젯은 한 번만 다시 만듦
+        """
+        if self._pending_display is None:
+            self._pending_display = self.after_idle(self._do_display)
+    
+    def _do_display(self):
+        self._pending_display = None
         self._update_display()
     
     def _sort_key(self, path):
-        """숫자 기반 정렬 키"""
+        """숫자 기반 정렬 키 (파일명의 첫 번째 숫자)"""
+        m = _RE_DIGITS.search(path.stem)
+        return int(m.group()) if m else 0
+    
+    def _item_signature(self, img_path):
+        """항목 재사용 판단용 키 (순서 변경 후 같은 이름에 다른 파일이 올 수 있으므로 inode/mtime 포함)"""
         try:
-            return int(''.join(filter(str.isdigit, path.stem)) or 0)
-        except:
-            return 0
+            st = img_path.stat()
+            return (str(img_path), st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return (str(img_path), None, None, None)
     
     def _update_display(self):
-        """화면 업데이트"""
+        """화면 업데이트 (바뀐 항목만 새로 만들고 나머지는 재배치)"""
         # 위젯이 유효한지 확인
         try:
             if not self.winfo_exists() or not self.image_container.winfo_exists():
@@ -1086,17 +1625,31 @@ class DropZone(tk.Frame):
         except:
             return
         
-        # 기존 위젯 제거
+        self.clear_reorder_preview()
+        wanted = [(img_path, self._item_signature(img_path)) for img_path in self.images]
+        wanted_keys = {sig for _, sig in wanted}
+        
+        # 사라진 항목 제거
         try:
-            for widget in self.image_container.winfo_children():
-                widget.destroy()
+            for sig in [sig for sig in self._items if sig not in wanted_keys]:
+                self._items.pop(sig)['frame'].destroy()
+            if self.empty_label is not None:
+                self.empty_label.destroy()
+                self.empty_label = None
         except Exception:
             return
+        pending = []
+        for sig, future in self._thumb_futures:
+            if sig in wanted_keys:
+                pending.append((sig, future))
+            else:
+                future.cancel()
+        self._thumb_futures = pending
         
         self.check_vars.clear()
         self.image_labels.clear()
         self.item_frames.clear()
-        self.reorder_preview_key = None
+        self.thumbnails.clear()
         
         if not self.images:
             self.empty_label = tk.Label(self.image_container,
@@ -1105,61 +1658,162 @@ class DropZone(tk.Frame):
                                        fg=ModernStyle.TEXT_SUBTLE, justify='center')
             self.empty_label.pack(expand=True, pady=30)
             self.empty_label.bind('<Button-1>', lambda e: self.add_images())
+            self._item_order = []
             return
         
-        # 이미지 썸네일 표시
-        for i, img_path in enumerate(self.images):
-            frame = tk.Frame(self.image_container, bg=ModernStyle.BG_WHITE)
-            frame.pack(side=tk.LEFT, padx=5, pady=5)
-            self.item_frames[str(img_path)] = frame
-            
-            # 체크박스 (다중 선택용)
-            var = tk.BooleanVar(value=False)
-            self.check_vars[str(img_path)] = var
-            cb = tk.Checkbutton(frame, variable=var, bg=ModernStyle.BG_WHITE,
-                               activebackground=ModernStyle.BG_WHITE)
-            cb.pack()
-            
-            # 썸네일
-            thumb = ImageOptimizer.create_thumbnail(img_path)
-            if thumb:
-                self.thumbnails[str(img_path)] = thumb
-                img_label = tk.Label(frame, image=thumb, bg=ModernStyle.BG_WHITE,
-                                    relief='solid', borderwidth=1, cursor='fleur')
-                img_label.pack()
-                self.image_labels[str(img_path)] = img_label
-                
-                # 드래그 앤 드롭 이벤트 바인딩
-                self._bind_drag_events(img_label, img_path, thumb)
-                # 더블클릭으로 캡션 편집
-                img_label.bind('<Double-Button-1>', lambda e, p=img_path: self._open_caption_dialog(p))
+        # 이미지 썸네일 표시 (새 항목은 플레이스홀더로 배치하고 디코딩은 백그라운드에서)
+        new_items = []
+        for i, (img_path, sig) in enumerate(wanted):
+            item = self._items.get(sig)
+            if item is None:
+                item = self._build_item(img_path)
+                self._items[sig] = item
+                new_items.append((img_path, sig))
             else:
-                img_label = tk.Label(frame, text="📷", font=ModernStyle.get_font(20),
-                                    bg=ModernStyle.BG_LIGHT, width=8, height=4, cursor='fleur')
-                img_label.pack()
-                self.image_labels[str(img_path)] = img_label
-                # 플레이스홀더도 드래그 가능
-                self._bind_drag_events(img_label, img_path, None)
-                # 더블클릭으로 캡션 편집
-                img_label.bind('<Double-Button-1>', lambda e, p=img_path: self._open_caption_dialog(p))
-            
-            # 파일명
-            name_label = tk.Label(frame, text=img_path.name, font=ModernStyle.get_font(8),
-                                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_MUTED)
-            name_label.pack()
-            
-            # 순서 변경 버튼
-            if len(self.images) > 1:
-                order_frame = tk.Frame(frame, bg=ModernStyle.BG_WHITE)
-                order_frame.pack()
-                if i > 0:
-                    tk.Button(order_frame, text="◀", font=ModernStyle.get_font(7),
-                             bg=ModernStyle.BG_WHITE, relief='flat',
-                             command=lambda idx=i: self.move_image(idx, -1)).pack(side=tk.LEFT)
-                if i < len(self.images) - 1:
-                    tk.Button(order_frame, text="▶", font=ModernStyle.get_font(7),
-                             bg=ModernStyle.BG_WHITE, relief='flat',
-                             command=lambda idx=i: self.move_image(idx, 1)).pack(side=tk.LEFT)
+                item['var'].set(False)
+            self._update_order_buttons(item, i)
+            
+            key = sig[0]  # str(img_path)
+            self.item_frames[key] = item['frame']
+            self.check_vars[key] = item['var']
+            self.image_labels[key] = item['label']
+            if item['thumb'] is not None:
+                self.thumbnails[key] = item['thumb']
+        
+        # 순서가 바뀐 경우에만 다시 pack
+        order = [sig for _, sig in wanted]
+        if order != self._item_order:
+            for sig in order:
+                self._items[sig]['frame'].pack_forget()
+            for sig in order:
+                self._items[sig]['frame'].pack(side=tk.LEFT, padx=5, pady=5)
+            self._item_order = order
+        
+        self._start_thumbnail_jobs(new_items)
+    
+    def _build_item(self, img_path):
+        """
+        이미지 한 장의 체크박스/썸네일 위젯 생성
+        
+        항목당 위젯 수를 줄이기 위해 파일명은 체크박스 텍스트로 표시하고,
+        순서 변경 버튼 줄은 필요할 때만 만듦
+        """
+        frame = tk.Frame(self.image_container, bg=ModernStyle.BG_WHITE)
+        
+        # 체크박스 (다중 선택용) + 파일명
+        var = tk.BooleanVar(value=False)
+        cb = tk.Checkbutton(frame, variable=var, text=img_path.name, font=ModernStyle.get_font(8),
+                           bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_MUTED,
+                           activebackground=ModernStyle.BG_WHITE)
+        cb.pack()
+        
+        # 썸네일 (디코딩이 끝나면 _install_thumbnail 에서 이미지로 교체)
+        img_label = tk.Label(frame, text="📷", font=ModernStyle.get_font(20),
+                            bg=ModernStyle.BG_LIGHT, width=8, height=4, cursor='fleur')
+        img_label.pack()
+        # 플레이스홀더도 드래그 가능
+        self._bind_drag_events(img_label, img_path, None)
+        # 더블클릭으로 캡션 편집
+        img_label.bind('<Double-Button-1>', lambda e, p=img_path: self._open_caption_dialog(p))
+        
+        # 순서 변경 버튼 줄은 _update_order_buttons 에서 필요할 때 생성
+        return {'frame': frame, 'var': var, 'label': img_label, 'thumb': None,
+                'order_frame': None, 'prev': None, 'next': None}
+    
+    def _update_order_buttons(self, item, idx):
+        """◀ ▶ 버튼을 현재 위치에 맞게 표시/숨김하고 command 만 갱신"""
+        last = len(self.images) - 1
+        for name, text, direction, visible in (('prev', "◀", -1, idx > 0), ('next', "▶", 1, idx < last)):
+            button = item[name]
+            if button is None:
+                if not visible:
+                    continue
+                if item['order_frame'] is None:
+                    item['order_frame'] = tk.Frame(item['frame'], bg=ModernStyle.BG_WHITE)
+                    item['order_frame'].pack()
+                button = item[name] = tk.Button(item['order_frame'], text=text, font=ModernStyle.get_font(7),
+                                                bg=ModernStyle.BG_WHITE, relief='flat')
+            # ◀ 가 항상 ▶ 보다 왼쪽에 오도록 매번 순서대로 다시 pack
+            button.pack_forget()
+            if visible:
+                button.configure(command=partial(self.move_image, idx, direction))
+                button.pack(side=tk.LEFT)
+    
+    @staticmethod
+    def _photo_cache_key(sig):
+        # 이름이 바뀌어도 같은 파일이면 같은 키 (inode 를 못 얻으면 경로 포함)
+        return sig[1:] if sig[1] else sig
+    
+    def _start_thumbnail_jobs(self, items):
+        """썸네일 디코딩을 스레드 풀에 맡기고 완료된 것부터 메인 스레드에서 표시"""
+        for p, sig in items:
+            key = self._photo_cache_key(sig)
+            thumb = _THUMB_PHOTO_LRU.get(key)
+            if thumb is not None:
+                _THUMB_PHOTO_LRU.move_to_end(key)
+                self._apply_thumbnail(sig, thumb)
+            else:
+                self._thumb_futures.append(
+                    (sig, _THUMB_POOL.submit(ImageOptimizer._thumbnail_png, p, THUMBNAIL_SIZE))
+                )
+        if self._thumb_futures and self._thumb_poll_id is None:
+            self._thumb_poll_id = self.after(15, self._poll_thumbnails)
+    
+    def _cancel_thumbnail_jobs(self):
+        """대기 중인 썸네일 작업 취소"""
+        for _, future in self._thumb_futures:
+            future.cancel()
+        self._thumb_futures = []
+    
+    def _poll_thumbnails(self):
+        self._thumb_poll_id = None
+        pending = []
+        for sig, future in self._thumb_futures:
+            if not future.done():
+                pending.append((sig, future))
+            elif not future.cancelled():
+                self._install_thumbnail(sig, future.result())
+        self._thumb_futures = pending
+        if pending:
+            self._thumb_poll_id = self.after(15, self._poll_thumbnails)
+    
+    def _install_thumbnail(self, sig, data):
+        """플레이스홀더 라벨을 썸네일로 교체 (Tk 제약상 메인 스레드에서만)"""
+        item = self._items.get(sig)
+        if data is None or item is None or not item['label'].winfo_exists():
+            return
+        try:
+            thumb = tk.PhotoImage(master=self, data=data)
+        except tk.TclError:
+            ImageOptimizer._discard_thumbnail_cache(sig[0], THUMBNAIL_SIZE)
+            return
+        key = self._photo_cache_key(sig)
+        _THUMB_PHOTO_LRU[key] = thumb
+        if len(_THUMB_PHOTO_LRU) > _THUMB_PHOTO_LRU_SIZE:
+            _THUMB_PHOTO_LRU.popitem(last=False)
+        self._apply_thumbnail(sig, thumb)
+    
+    def _apply_thumbnail(self, sig, thumb):
+        item = self._items[sig]
+        item['thumb'] = thumb
+        self.thumbnails[sig[0]] = thumb
+        item['label'].configure(image=thumb, text="", width=0, height=0, bg=ModernStyle.BG_WHITE,
+                                relief='solid', borderwidth=1)
+    
+    def destroy(self):
+        if self._batch_cancel is not None:
+            self._batch_cancel.set()
+        if self._pending_display is not None:
+            self.after_cancel(self._pending_display)
+            self._pending_display = None
+        if self._pending_scrollregion is not None:
+            self.after_cancel(self._pending_scrollregion)
+            self._pending_scrollregion = None
+        if self._thumb_poll_id is not None:
+            self.after_cancel(self._thumb_poll_id)
+            self._thumb_poll_id = None
+        self._cancel_thumbnail_jobs()
+        super().destroy()
     
     def can_reorder_images(self):
         return self.image_type in ['sub', 'model', 'slide'] and len(self.images) > 1
@@ -1178,9 +1832,9 @@ class DropZone(tk.Frame):
         best_idx = None
         best_distance = None
 
-        for idx, img_path in enumerate(self.images):
-            frame = self.item_frames.get(str(img_path))
-            if not frame or not frame.winfo_exists():
+        # item_frames 는 화면 순서(= self.images 순서)대로 채워지므로 경로 문자열 조회 없이 순회
+        for idx, frame in enumerate(self.item_frames.values()):
+            if not frame.winfo_exists():
                 continue
             center_x = frame.winfo_rootx() + (frame.winfo_width() / 2)
             center_y = frame.winfo_rooty() + (frame.winfo_height() / 2)
@@ -1217,9 +1871,11 @@ class DropZone(tk.Frame):
         self.clear_reorder_preview()
         if not self.can_reorder_images():
             return False
+        if self._refuse_if_busy():
+            return False
 
-        source_key = str(Path(image_path))
-        source_idx = next((idx for idx, path in enumerate(self.images) if str(path) == source_key), None)
+        source_path = Path(image_path)
+        source_idx = next((idx for idx, path in enumerate(self.images) if path == source_path), None)
         target_idx = self._get_reorder_target_index(x_root, y_root)
 
         if source_idx is None or target_idx is None or source_idx == target_idx:
@@ -1241,11 +1897,13 @@ class DropZone(tk.Frame):
 
     def _bind_drag_events(self, widget, img_path, thumbnail):
         """드래그 앤 드롭 이벤트 바인딩"""
+        path_key = str(img_path)
+        
         def on_press(event):
             # 드래그 시작
             if self.drag_manager:
                 # 썸네일이 없으면 새로 생성
-                thumb = thumbnail
+                thumb = thumbnail or self.thumbnails.get(path_key)
                 if not thumb:
                     thumb = ImageOptimizer.create_thumbnail(img_path)
                 if thumb:
@@ -1294,6 +1952,18 @@ class DropZone(tk.Frame):
             self.drop_frame.configure(bg=ModernStyle.BG_WHITE)
             self.canvas.configure(bg=ModernStyle.BG_WHITE)
     
+    def is_busy(self):
+        """백그라운드에서 이미지를 추가하거나 지우는 중이면 True (파일 번호가 아직 바뀌는 중)"""
+        return self._batch_cancel is not None or self._deleting
+    
+    def _refuse_if_busy(self):
+        """처리 중이면 안내하고 True 를 돌려줌 - 파일을 옮기거나 지우는 작업 앞에서 사용"""
+        if not self.is_busy():
+            return False
+        messagebox.showinfo("알림", "이미지를 아직 처리 중입니다. 끝난 뒤 다시 시도하세요.",
+                            parent=self.winfo_toplevel())
+        return True
+    
     def select_all(self):
         """전체 선택/해제"""
         # 현재 모두 선택되어 있으면 해제, 아니면 전체 선택
@@ -1303,6 +1973,9 @@ class DropZone(tk.Frame):
     
     def delete_selected(self):
         """선택된 이미지들 삭제"""
+        if self._refuse_if_busy():
+            return
+        
         selected = [path for path, var in self.check_vars.items() if var.get()]
         
         if not selected:
@@ -1312,109 +1985,102 @@ class DropZone(tk.Frame):
         if not messagebox.askyesno("확인", f"{len(selected)}개 이미지를 삭제하시겠습니까?"):
             return
         
-        for path_str in selected:
-            path = Path(path_str)
-            if path.exists():
-                os.remove(str(path))
+        # 느린 디스크에서 여러 장을 지울 때 UI 가 멈추지 않도록 삭제는 백그라운드 스레드에서 처리
+        def delete_worker():
+            for path_str in selected:
+                try:
+                    os.remove(path_str)
+                except OSError:
+                    pass
         
-        try:
-            if self.winfo_exists():
+        worker = threading.Thread(target=delete_worker, daemon=True)
+        self._deleting = True
+        worker.start()
+        
+        def wait_for_delete():
+            try:
+                if not self.winfo_exists():
+                    return
+                if worker.is_alive():
+                    self.after(50, wait_for_delete)
+                    return
+                self._deleting = False
                 self.load_images()
                 self._renumber_images()
+                # 번호를 다시 매긴 파일명으로 목록을 다시 읽음 (화면 갱신은 idle 때 한 번)
+                self.load_images()
                 if self.on_change:
                     self.on_change()
-        except Exception:
-            pass
+            except Exception:
+                pass
+        
+        self.after(50, wait_for_delete)
     
     def add_images(self):
         """이미지 추가"""
+        if self._refuse_if_busy():
+            return
+        
         files = filedialog.askopenfilenames(
+            parent=self.winfo_toplevel(),
             title=f"{self.title} 이미지 선택",
+            initialdir=str(DropZone._last_dir or Path.home()),
             filetypes=[("이미지 파일", "*.jpg *.jpeg *.png *.webp *.bmp *.gif")]
         )
         
         if not files:
             return
+        DropZone._last_dir = Path(files[0]).parent
         
-        # 폴더 생성
+        # 폴더 생성 (model/slide 하위 폴더는 process_batch 에서 생성)
         self.project_folder.mkdir(parents=True, exist_ok=True)
-        if self.image_type == 'model':
-            (self.project_folder / "model_images").mkdir(exist_ok=True)
-        if self.image_type == 'slide':
-            self._get_slide_folder().mkdir(exist_ok=True)
         
-        # 최적화 설정
-        max_sizes = {
-            'thumb': THUMB_MAX_SIZE,
-            'main': MAIN_MAX_SIZE,
-            'sub': SUB_MAX_SIZE,
-            'model': MODEL_MAX_SIZE,
-            'slide': SLIDE_MAX_SIZE
-        }
-        max_size = max_sizes.get(self.image_type, 1400)
-        
-        total_reduction = 0
-        processed = 0
-        
-        for file_path in files:
-            src = Path(file_path)
-            
-            # 대상 폴더 및 파일명 결정
-            if self.image_type == 'thumb':
-                target_folder = self.project_folder
-                new_name = f"thumb{src.suffix}"
-            elif self.image_type == 'main':
-                target_folder = self.project_folder
-                new_name = f"main{src.suffix}"
-            elif self.image_type == 'sub':
-                target_folder = self.project_folder
-                idx = len(self.images) + processed + 1
-                new_name = f"{str(idx).zfill(2)}{src.suffix}"
-            elif self.image_type == 'model':
-                target_folder = self.project_folder / "model_images"
-                idx = len(self.images) + processed + 1
-                new_name = f"{idx}{src.suffix}"
-            elif self.image_type == 'slide':
-                # 슬라이드는 별도 폴더에 저장
-                target_folder = self._get_slide_folder()
-                idx = len(self.images) + processed + 1
-                new_name = f"{idx}{src.suffix}"
-            else:
-                continue
+        # 진행 표시줄
+        progress = ttk.Progressbar(self, mode='determinate', maximum=len(files))
+        progress.pack(fill=tk.X, padx=10, before=self.drop_frame)
+        
+        def on_progress(done, total, _reduction):
+            if progress.winfo_exists():
+                progress['value'] = done
+        
+        def on_done(processed_files, avg_reduction):
+            self._batch_cancel = None
+            # 처리 중에 편집창이 닫혔으면 조용히 종료
+            if not progress.winfo_exists():
+                return
+            progress.destroy()
             
-            # 파일 복사
-            dst = target_folder / new_name
-            shutil.copy(str(src), str(dst))
+            # 결과 표시
+            if processed_files:
+                msg = f"{len(processed_files)}개 이미지 추가됨"
+                if avg_reduction > 0:
+                    msg += f"\n평균 {avg_reduction:.1f}% 용량 감소"
+                messagebox.showinfo("완료", msg)
             
-            # 최적화
-            optimized_path, reduction = ImageOptimizer.optimize_for_web(dst, max_size)
-            total_reduction += reduction
-            processed += 1
-        
-        # 결과 표시
-        avg_reduction = total_reduction / processed if processed > 0 else 0
-        if processed > 0:
-            msg = f"{processed}개 이미지 추가됨"
-            if avg_reduction > 0:
-                msg += f"\n평균 {avg_reduction:.1f}% 용량 감소"
-            messagebox.showinfo("완료", msg)
+            # 위젯이 유효한 경우에만 업데이트
+            try:
+                if self.winfo_exists():
+                    self.load_images()
+                    if self.on_change:
+                        self.on_change()
+                    # 파일 다이얼로그 후 팝업이 뒤로 가는 문제 해결 - Toplevel 창을 앞으로
+                    toplevel = self.winfo_toplevel()
+                    if toplevel and toplevel.winfo_exists():
+                        toplevel.lift()
+                        toplevel.focus_force()
+            except Exception:
+                pass
         
-        # 위젯이 유효한 경우에만 업데이트
-        try:
-            if self.winfo_exists():
-                self.load_images()
-                if self.on_change:
-                    self.on_change()
-                # 파일 다이얼로그 후 팝업이 뒤로 가는 문제 해결 - Toplevel 창을 앞으로
-                toplevel = self.winfo_toplevel()
-                if toplevel and toplevel.winfo_exists():
-                    toplevel.lift()
-                    toplevel.focus_force()
-        except Exception:
-            pass
+        # 복사 + 최적화를 백그라운드 스레드 풀에서 병렬 처리 (UI 는 계속 응답)
+        self._batch_cancel = ImageOptimizer.process_batch_async(
+            self, [Path(f) for f in files], self.project_folder, self.image_type,
+            on_progress=on_progress, on_done=on_done,
+        )
     
     def delete_image(self, img_path):
         """이미지 삭제 (단일)"""
+        if self._refuse_if_busy():
+            return
         if messagebox.askyesno("확인", f"'{img_path.name}'을(를) 삭제하시겠습니까?"):
             if img_path.exists():
                 os.remove(str(img_path))
@@ -1422,6 +2088,8 @@ class DropZone(tk.Frame):
                 if self.winfo_exists():
                     self.load_images()
                     self._renumber_images()
+                    # 번호를 다시 매긴 파일명으로 목록을 다시 읽음 (화면 갱신은 idle 때 한 번)
+                    self.load_images()
                     if self.on_change:
                         self.on_change()
             except Exception:
@@ -1429,6 +2097,8 @@ class DropZone(tk.Frame):
     
     def move_image(self, idx, direction):
         """이미지 순서 변경"""
+        if self._refuse_if_busy():
+            return
         new_idx = idx + direction
         if 0 <= new_idx < len(self.images):
             self.images[idx], self.images[new_idx] = self.images[new_idx], self.images[idx]
@@ -1442,70 +2112,82 @@ class DropZone(tk.Frame):
                 pass
     
     def _renumber_images(self):
-        """이미지 파일명 재정렬"""
+        """
+        이미지 파일명 재정렬
+        
+        현재 순서(self.images)대로 번호를 다시 매기되, 이미 제자리인 파일은 건드리지 않음.
+        파일은 추가할 때 최적화되었으므로 이름만 바꾸고, 최적화에 실패해 원본 그대로
+        들어온 파일만 이번에 웹용 포맷으로 다시 저장함.
+        """
         if self.image_type == 'cover' or self.image_type == 'thumb' or self.image_type == 'main':
             return
         
         if not self.images:
             return
         
-        # 확장자 결정 (WebP 또는 JPG)
-        ext = '.webp' if USE_WEBP else '.jpg'
-        
         if self.image_type == 'sub':
-            temp_files = []
-            for i, img in enumerate(self.images):
-                if img.exists():
-                    temp_path = self.project_folder / f"_temp_sub_{i}{img.suffix}"
-                    shutil.move(str(img), str(temp_path))
-                    temp_files.append(temp_path)
-            
-            for i, temp_path in enumerate(temp_files):
-                new_path = self.project_folder / f"{str(i+1).zfill(2)}{ext}"
-                if temp_path.exists():
-                    # 최적화 후 반환된 경로 사용
-                    optimized_path, _ = ImageOptimizer.optimize_for_web(temp_path, SUB_MAX_SIZE)
-                    if optimized_path.exists() and optimized_path != new_path:
-                        shutil.move(str(optimized_path), str(new_path))
-        
+            folder = self.project_folder
+            max_size = SUB_MAX_SIZE
+            make_name = lambda i: str(i + 1).zfill(2)
         elif self.image_type == 'model':
-            model_folder = self.project_folder / "model_images"
-            temp_files = []
-            for i, img in enumerate(self.images):
-                if img.exists():
-                    temp_path = model_folder / f"_temp_model_{i}{img.suffix}"
-                    shutil.move(str(img), str(temp_path))
-                    temp_files.append(temp_path)
-            
-            for i, temp_path in enumerate(temp_files):
-                new_path = model_folder / f"{i+1}{ext}"
-                if temp_path.exists():
-                    optimized_path, _ = ImageOptimizer.optimize_for_web(temp_path, MODEL_MAX_SIZE)
-                    if optimized_path.exists() and optimized_path != new_path:
-                        shutil.move(str(optimized_path), str(new_path))
-        
+            folder = self.project_folder / "model_images"
+            max_size = MODEL_MAX_SIZE
+            make_name = lambda i: str(i + 1)
         elif self.image_type == 'slide':
-            slide_folder = self._get_slide_folder()
-            if not slide_folder.exists():
+            folder = self._get_slide_folder()
+            if not folder.exists():
                 return
-            temp_files = []
-            for i, img in enumerate(self.images):
-                if img.exists():
-                    temp_path = slide_folder / f"_temp_slide_{i}{img.suffix}"
-                    shutil.move(str(img), str(temp_path))
-                    temp_files.append(temp_path)
-            
-            for i, temp_path in enumerate(temp_files):
-                new_path = slide_folder / f"{i+1}{ext}"
-                if temp_path.exists():
-                    optimized_path, _ = ImageOptimizer.optimize_for_web(temp_path, SLIDE_MAX_SIZE)
-                    if optimized_path.exists() and optimized_path != new_path:
-                        shutil.move(str(optimized_path), str(new_path))
+            max_size = SLIDE_MAX_SIZE
+            make_name = lambda i: str(i + 1)
+        else:
+            return
+        
+        ext = '.webp' if USE_WEBP else '.jpg'
+        
+        # 실제로 이름이 바뀌거나 다시 최적화해야 하는 파일만 추림
+        moves = []
+        needs_optimize = set()
+        for i, img in enumerate(self.images):
+            if not img.exists():
+                continue
+            if ImageOptimizer.is_web_ready(img, max_size):
+                target = folder / f"{make_name(i)}{img.suffix.lower()}"
+                if img != target:
+                    moves.append((img, target))
+            else:
+                needs_optimize.add(len(moves))
+                moves.append((img, folder / f"{make_name(i)}{ext}"))
+        if not moves:
+            return
+        
+        # 다른 파일의 목적지를 차지하고 있는 파일만 임시 이름으로 비켜둠
+        targets = {target for _, target in moves}
+        staged = []
+        for i, (src, target) in enumerate(moves):
+            if src in targets:
+                temp_path = folder / f"_temp_{self.image_type}_{i}{src.suffix}"
+                os.replace(src, temp_path)
+                src = temp_path
+            staged.append((src, target))
+        
+        for i, (src, target) in enumerate(staged):
+            if i not in needs_optimize:
+                os.replace(src, target)
+                continue
+            optimized_path, _ = ImageOptimizer.optimize_for_web(src, max_size, output_path=target)
+            if optimized_path == src:
+                # 최적화 실패 시 원래 확장자 그대로 번호만 맞춤
+                os.replace(src, target.with_suffix(src.suffix.lower()))
+            elif src != optimized_path:
+                os.remove(src)
 
 
 class ProjectEditorDialog(tk.Toplevel):
     """프로젝트 편집 다이얼로그"""
     
+    # 'CustomFieldEntry' 바인드태그의 우클릭 바인딩 등록 여부 (인터프리터 전체에서 한 번)
+    _custom_field_tag_bound = False
+    
     def __init__(self, parent, project, mode='projects', on_save=None):
         super().__init__(parent)
         
@@ -1846,16 +2528,7 @@ class ProjectEditorDialog(tk.Toplevel):
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        scrollable.bind("<MouseWheel>", _on_mousewheel)
-        
-        # 탭 전환 시 바인딩 해제
-        def on_destroy(event):
-            try:
-                canvas.unbind_all("<MouseWheel>")
-            except:
-                pass
-        parent.bind("<Destroy>", on_destroy)
+        _register_wheel_area(canvas, _on_mousewheel)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -2062,21 +2735,46 @@ class ProjectEditorDialog(tk.Toplevel):
         except tk.TclError:
             pass
     
-    def _add_link_to_entry(self, entry_widget, selected_text):
-        """Entry 위젯의 선택된 텍스트에 링크 추가"""
-        popup = tk.Toplevel(self)
-        popup.title("🔗 선택 텍스트에 링크 추가")
-        popup.geometry("480x360")
-        popup.configure(bg=ModernStyle.BG_WHITE)
-        popup.transient(self)
-        popup.grab_set()
+    def _build_link_popup(self, selected_text, on_apply):
+        """
+        선택 텍스트 링크 추가 팝업 (Entry/Text 공용)
+        
+        팝업은 처음 한 번만 만들고 이후에는 숨겨두었다가 내용만 바꿔 다시 띄움
+        
+        Args:
+            selected_text: 링크를 걸 텍스트
+            on_apply: 확인 시 (url, style) 로 호출. 위젯 내용 갱신은 호출 측이 담당
+        """
+        popup = getattr(self, '_link_popup', None)
+        if popup is None or not popup.winfo_exists():
+            popup = self._create_link_popup()
+        
+        # 이전 사용 흔적 초기화
+        popup.selected_label.config(text=selected_text)
+        popup.url_entry.delete(0, tk.END)
+        popup.url_entry.insert(0, "https://")
+        popup.style_var.set(0)
+        popup.on_apply = on_apply
         
-        popup.update_idletasks()
         x = (popup.winfo_screenwidth() - 480) // 2
         y = (popup.winfo_screenheight() - 360) // 2
-        popup.geometry(f"+{x}+{y}")
+        popup.geometry(f"480x360+{x}+{y}")
         
-        current_text = entry_widget.get()
+        popup.deiconify()
+        popup.lift()
+        popup.grab_set()
+        popup.url_entry.focus_set()
+        return popup
+    
+    def _create_link_popup(self):
+        """링크 추가 팝업 위젯 구성 (숨김 상태로 반환, _build_link_popup 에서 재사용)"""
+        popup = tk.Toplevel(self)
+        # 위젯을 다 만든 뒤 한 번에 배치/표시되도록 숨겨둔 채로 구성
+        popup.withdraw()
+        popup.title("🔗 선택 텍스트에 링크 추가")
+        popup.configure(bg=ModernStyle.BG_WHITE)
+        popup.transient(self)
+        popup.on_apply = None
         
         # 헤더
         tk.Label(popup, text="선택한 텍스트에 링크 추가", font=ModernStyle.get_font(14, 'bold'),
@@ -2088,15 +2786,16 @@ class ProjectEditorDialog(tk.Toplevel):
         
         selected_frame = tk.Frame(popup, bg=ModernStyle.BG_LIGHT, relief='solid', borderwidth=1)
         selected_frame.pack(fill=tk.X, padx=20, pady=(3, 10))
-        tk.Label(selected_frame, text=selected_text, font=ModernStyle.get_font(10, 'bold'),
-                bg=ModernStyle.BG_LIGHT, fg=ModernStyle.ACCENT, wraplength=380).pack(padx=10, pady=8)
+        popup.selected_label = tk.Label(selected_frame, font=ModernStyle.get_font(10, 'bold'),
+                                        bg=ModernStyle.BG_LIGHT, fg=ModernStyle.ACCENT, wraplength=380)
+        popup.selected_label.pack(padx=10, pady=8)
         
         # URL 입력
         tk.Label(popup, text="URL 주소", font=ModernStyle.get_font(9),
                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_SUBTLE).pack(anchor=tk.W, padx=20)
         url_entry = tk.Entry(popup, font=ModernStyle.get_font(10), relief='solid', borderwidth=1)
-        url_entry.insert(0, "https://")
         url_entry.pack(fill=tk.X, padx=20, pady=(3, 10), ipady=6)
+        popup.url_entry = url_entry
         
         # 스타일 선택
         tk.Label(popup, text="링크 스타일", font=ModernStyle.get_font(9),
@@ -2105,32 +2804,37 @@ class ProjectEditorDialog(tk.Toplevel):
         style_frame = tk.Frame(popup, bg=ModernStyle.BG_WHITE)
         style_frame.pack(fill=tk.X, padx=20, pady=(5, 15))
         
-        style_var = tk.StringVar(value="highlight")
+        style_var = tk.IntVar(popup, value=0)  # _LINK_STYLES 의 인덱스
+        popup.style_var = style_var
         
         highlight_frame = tk.Frame(style_frame, bg=ModernStyle.BG_WHITE)
         highlight_frame.pack(side=tk.LEFT, padx=(0, 20))
-        tk.Radiobutton(highlight_frame, text="", variable=style_var, value="highlight",
+        tk.Radiobutton(highlight_frame, text="", variable=style_var, value=0,
                       bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
         tk.Label(highlight_frame, text=" 하이라이트 ", font=ModernStyle.get_font(10),
                 bg=ModernStyle.ACCENT, fg="white").pack(side=tk.LEFT)
         
         underline_frame = tk.Frame(style_frame, bg=ModernStyle.BG_WHITE)
         underline_frame.pack(side=tk.LEFT)
-        tk.Radiobutton(underline_frame, text="", variable=style_var, value="underline",
+        tk.Radiobutton(underline_frame, text="", variable=style_var, value=1,
                       bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(underline_frame, text="밑줄", font=('Segoe UI', 10, 'underline'),
+        tk.Label(underline_frame, text="밑줄", font=ModernStyle.get_font(10, 'underline'),
                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
         
+        def hide_popup():
+            popup.grab_release()
+            popup.withdraw()
+            popup.on_apply = None
+        
         def apply_link():
             url = url_entry.get().strip()
-            style = style_var.get()
+            style = _LINK_STYLES[style_var.get()]
             
             if url and url != "https://":
-                markdown_link = f"[{selected_text}]({url}|{style})"
-                new_text = current_text.replace(selected_text, markdown_link, 1)
-                entry_widget.delete(0, tk.END)
-                entry_widget.insert(0, new_text)
-                popup.destroy()
+                on_apply = popup.on_apply
+                hide_popup()
+                if on_apply:
+                    on_apply(url, style)
             else:
                 messagebox.showwarning("URL 필요", "URL을 입력해주세요.", parent=popup)
         
@@ -2143,10 +2847,25 @@ class ProjectEditorDialog(tk.Toplevel):
                  relief='flat', padx=20, pady=6, command=apply_link).pack(side=tk.LEFT, padx=(0, 10))
         tk.Button(btn_frame, text="취소", font=ModernStyle.get_font(10),
                  bg=ModernStyle.BG_WHITE, relief='solid', borderwidth=1,
-                 padx=15, pady=6, command=popup.destroy).pack(side=tk.LEFT)
+                 padx=15, pady=6, command=hide_popup).pack(side=tk.LEFT)
         
         popup.bind('<Return>', lambda e: apply_link())
-        url_entry.focus_set()
+        popup.protocol("WM_DELETE_WINDOW", hide_popup)
+        
+        self._link_popup = popup
+        return popup
+    
+    def _add_link_to_entry(self, entry_widget, selected_text):
+        """Entry 위젯의 선택된 텍스트에 링크 추가"""
+        current_text = entry_widget.get()
+        
+        def apply_link(url, style):
+            markdown_link = _make_markdown_link(selected_text, url, style)
+            new_text = current_text.replace(selected_text, markdown_link, 1)
+            entry_widget.delete(0, tk.END)
+            entry_widget.insert(0, new_text)
+        
+        self._build_link_popup(selected_text, apply_link)
     
     def _show_text_selection_menu(self, event, text_widget):
         """Text 위젯에서 텍스트 선택 시 컨텍스트 메뉴 표시"""
@@ -2170,10 +2889,17 @@ class ProjectEditorDialog(tk.Toplevel):
             text_widget.delete(sel_start, sel_end)
             text_widget.insert(sel_start, wrapped_text)
         except tk.TclError:
-            current = text_widget.get("1.0", tk.END)
-            new_text = current.replace(selected_text, wrapped_text, 1)
-            text_widget.delete("1.0", tk.END)
-            text_widget.insert("1.0", new_text.rstrip())
+            self._replace_first_in_text(text_widget, selected_text, wrapped_text)
+
+    @staticmethod
+    def _replace_first_in_text(text_widget, old, new):
+        """Text 위젯에서 처음 나오는 old 구간만 new 로 교체 (전체 내용을 다시 쓰지 않음)"""
+        if not old:
+            return
+        idx = text_widget.search(old, "1.0", tk.END)
+        if idx:
+            text_widget.delete(idx, f"{idx}+{len(old)}c")
+            text_widget.insert(idx, new)
 
     def _add_text_size_to_text(self, text_widget, selected_text):
         popup = tk.Toplevel(self)
@@ -2251,98 +2977,18 @@ class ProjectEditorDialog(tk.Toplevel):
     
     def _add_link_to_text(self, text_widget, selected_text):
         """Text 위젯의 선택된 텍스트에 링크 추가"""
-        popup = tk.Toplevel(self)
-        popup.title("🔗 선택 텍스트에 링크 추가")
-        popup.geometry("480x360")
-        popup.configure(bg=ModernStyle.BG_WHITE)
-        popup.transient(self)
-        popup.grab_set()
-        
-        popup.update_idletasks()
-        x = (popup.winfo_screenwidth() - 480) // 2
-        y = (popup.winfo_screenheight() - 360) // 2
-        popup.geometry(f"+{x}+{y}")
-        
-        # 헤더
-        tk.Label(popup, text="선택한 텍스트에 링크 추가", font=ModernStyle.get_font(14, 'bold'),
-                bg=ModernStyle.BG_WHITE).pack(anchor=tk.W, padx=20, pady=(15, 10))
-        
-        # 선택된 텍스트 표시
-        tk.Label(popup, text="선택된 텍스트:", font=ModernStyle.get_font(9),
-                bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_SUBTLE).pack(anchor=tk.W, padx=20)
-        
-        selected_frame = tk.Frame(popup, bg=ModernStyle.BG_LIGHT, relief='solid', borderwidth=1)
-        selected_frame.pack(fill=tk.X, padx=20, pady=(3, 10))
-        tk.Label(selected_frame, text=selected_text, font=ModernStyle.get_font(10, 'bold'),
-                bg=ModernStyle.BG_LIGHT, fg=ModernStyle.ACCENT, wraplength=380).pack(padx=10, pady=8)
-        
-        # URL 입력
-        tk.Label(popup, text="URL 주소", font=ModernStyle.get_font(9),
-                bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_SUBTLE).pack(anchor=tk.W, padx=20)
-        url_entry = tk.Entry(popup, font=ModernStyle.get_font(10), relief='solid', borderwidth=1)
-        url_entry.insert(0, "https://")
-        url_entry.pack(fill=tk.X, padx=20, pady=(3, 10), ipady=6)
-        
-        # 스타일 선택
-        tk.Label(popup, text="링크 스타일", font=ModernStyle.get_font(9),
-                bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_SUBTLE).pack(anchor=tk.W, padx=20)
-        
-        style_frame = tk.Frame(popup, bg=ModernStyle.BG_WHITE)
-        style_frame.pack(fill=tk.X, padx=20, pady=(5, 15))
-        
-        style_var = tk.StringVar(value="highlight")
-        
-        highlight_frame = tk.Frame(style_frame, bg=ModernStyle.BG_WHITE)
-        highlight_frame.pack(side=tk.LEFT, padx=(0, 20))
-        tk.Radiobutton(highlight_frame, text="", variable=style_var, value="highlight",
-                      bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(highlight_frame, text=" 하이라이트 ", font=ModernStyle.get_font(10),
-                bg=ModernStyle.ACCENT, fg="white").pack(side=tk.LEFT)
-        
-        underline_frame = tk.Frame(style_frame, bg=ModernStyle.BG_WHITE)
-        underline_frame.pack(side=tk.LEFT)
-        tk.Radiobutton(underline_frame, text="", variable=style_var, value="underline",
-                      bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(underline_frame, text="밑줄", font=('Segoe UI', 10, 'underline'),
-                bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
-        
-        def apply_link():
-            url = url_entry.get().strip()
-            style = style_var.get()
-            
-            if url and url != "https://":
-                # Text 위젯의 현재 내용에서 선택된 텍스트를 링크로 대체
-                try:
-                    sel_start = text_widget.index(tk.SEL_FIRST)
-                    sel_end = text_widget.index(tk.SEL_LAST)
-                    markdown_link = f"[{selected_text}]({url}|{style})"
-                    text_widget.delete(sel_start, sel_end)
-                    text_widget.insert(sel_start, markdown_link)
-                    popup.destroy()
-                except tk.TclError:
-                    # 선택이 해제된 경우 전체 텍스트에서 대체
-                    current = text_widget.get("1.0", tk.END)
-                    markdown_link = f"[{selected_text}]({url}|{style})"
-                    new_text = current.replace(selected_text, markdown_link, 1)
-                    text_widget.delete("1.0", tk.END)
-                    text_widget.insert("1.0", new_text.strip())
-                    popup.destroy()
-            else:
-                messagebox.showwarning("URL 필요", "URL을 입력해주세요.", parent=popup)
-        
-        # 버튼
-        btn_frame = tk.Frame(popup, bg=ModernStyle.BG_WHITE)
-        btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=12)
-        
-        tk.Button(btn_frame, text="✓ 링크 적용", font=ModernStyle.get_font(10, 'bold'),
-                 bg=ModernStyle.ACCENT, fg=ModernStyle.BG_WHITE,
-                 relief='flat', padx=20, pady=6, command=apply_link).pack(side=tk.LEFT, padx=(0, 10))
-        tk.Button(btn_frame, text="취소", font=ModernStyle.get_font(10),
-                 bg=ModernStyle.BG_WHITE, relief='solid', borderwidth=1,
-                 padx=15, pady=6, command=popup.destroy).pack(side=tk.LEFT)
+        def apply_link(url, style):
+            markdown_link = _make_markdown_link(selected_text, url, style)
+            try:
+                sel_start = text_widget.index(tk.SEL_FIRST)
+                sel_end = text_widget.index(tk.SEL_LAST)
+                text_widget.delete(sel_start, sel_end)
+                text_widget.insert(sel_start, markdown_link)
+            except tk.TclError:
+                # 선택이 해제된 경우 처음 나오는 같은 텍스트 구간만 교체
+                self._replace_first_in_text(text_widget, selected_text, markdown_link)
         
-        popup.bind('<Return>', lambda e: apply_link())
-        url_entry.focus_set()
+        self._build_link_popup(selected_text, apply_link)
     
     def _add_custom_field_click(self):
         """+ 버튼 클릭 시 커스텀 필드 추가"""
@@ -2397,7 +3043,11 @@ class ProjectEditorDialog(tk.Toplevel):
                               relief='solid', borderwidth=1, wrap=tk.WORD)
         value_entry.insert('1.0', value)
         value_entry.pack(fill=tk.X, pady=(2, 0))
-        value_entry.bind('<Button-3>', lambda e, txt=value_entry: self._show_text_selection_menu(e, txt))
+        # 우클릭 메뉴는 필드마다 바인딩하지 않고 공용 바인드태그 하나로 처리
+        if not ProjectEditorDialog._custom_field_tag_bound:
+            self.bind_class('CustomFieldEntry', '<Button-3>', ProjectEditorDialog._on_custom_field_menu)
+            ProjectEditorDialog._custom_field_tag_bound = True
+        value_entry.bindtags(('CustomFieldEntry',) + value_entry.bindtags())
         
         # 구분선
         tk.Frame(frame, bg=ModernStyle.BORDER, height=1).pack(fill=tk.X, pady=(10, 0))
@@ -2415,6 +3065,13 @@ class ProjectEditorDialog(tk.Toplevel):
         
         return field_data
     
+    @staticmethod
+    def _on_custom_field_menu(event):
+        """커스텀 필드 값 위젯 공용 우클릭 핸들러 - 위젯이 속한 편집 창으로 전달"""
+        dialog = event.widget.winfo_toplevel()
+        if isinstance(dialog, ProjectEditorDialog):
+            dialog._show_text_selection_menu(event, event.widget)
+    
     def create_image_tab(self, parent):
         """이미지 관리 탭"""
         # 스크롤 캔버스
@@ -2438,12 +3095,19 @@ class ProjectEditorDialog(tk.Toplevel):
         # 마우스 휠
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        scrollable.bind("<MouseWheel>", _on_mousewheel)
+        _register_wheel_area(canvas, _on_mousewheel)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        # 드롭존/자르기 캔버스는 탭이 처음 화면에 보일 때 구성
+        def on_first_map(event):
+            parent.unbind('<Map>', map_id)
+            self._populate_image_tab(scrollable)
+        map_id = parent.bind('<Map>', on_first_map)
+    
+    def _populate_image_tab(self, scrollable):
+        """이미지 관리 탭 내용 구성 (드롭존, 메인 이미지 자르기 캔버스)"""
         # 프로젝트 폴더
         project_type = self.mode if self.mode in ['drawings', 'graphics'] else 'projects'
         slug = self.project.get('slug', 'new-project')
@@ -2494,7 +3158,7 @@ class ProjectEditorDialog(tk.Toplevel):
         # 썸네일 이미지 (그리드용 정사각형)
         thumb_zone = DropZone(scrollable, 'thumb', 
                              '🖼️ 썸네일 이미지 (thumb.jpg) - 프로젝트 목록 그리드에 표시되는 정사각형 이미지',
-                             project_folder, on_change=self._on_image_change)
+                             project_folder, on_change=lambda: self._on_image_change('thumb'))
         thumb_zone.pack(fill=tk.X, padx=20, pady=5)
         self.drop_zones.append(thumb_zone)
         self.drag_manager.register_zone(thumb_zone)
@@ -2502,7 +3166,7 @@ class ProjectEditorDialog(tk.Toplevel):
         # 메인 이미지 (상세페이지 첫 이미지)
         main_zone = DropZone(scrollable, 'main',
                             '📷 메인 이미지 (main.jpg) - 프로젝트 상세페이지 맨 위에 표시되는 대표 이미지',
-                            project_folder, on_change=self._on_image_change)
+                            project_folder, on_change=lambda: self._on_image_change('main'))
         main_zone.pack(fill=tk.X, padx=20, pady=5)
         self.drop_zones.append(main_zone)
         self.drag_manager.register_zone(main_zone)
@@ -2529,9 +3193,10 @@ class ProjectEditorDialog(tk.Toplevel):
         tk.Label(ratio_frame, text="비율:", font=ModernStyle.get_font(9),
                 bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT, padx=5)
         
-        # 비율 옵션
-        current_ratio = self.project.get('cover_ratio', '16:9')
-        self.cover_ratio_var = tk.StringVar(value=current_ratio)
+        # 비율 옵션 (레이아웃 탭에서 이미 만든 변수가 있으면 같이 사용)
+        if not hasattr(self, 'cover_ratio_var'):
+            self.cover_ratio_var = tk.StringVar(value=self.project.get('cover_ratio', '16:9'))
+        current_ratio = self.cover_ratio_var.get()
         
         ratio_options = [
             ('16:9', '16:9'),
@@ -2547,18 +3212,16 @@ class ProjectEditorDialog(tk.Toplevel):
             is_selected = (ratio_val == current_ratio) and not self._is_custom_ratio(current_ratio)
             btn = tk.Button(ratio_frame, text=ratio_text, 
                            font=ModernStyle.get_font(8),
-                           bg=ModernStyle.ACCENT if is_selected else ModernStyle.BG_WHITE,
-                           fg='white' if is_selected else ModernStyle.TEXT_PRIMARY,
+                           **(ModernStyle.SELECTED_STYLE if is_selected else ModernStyle.UNSELECTED_STYLE),
                            relief='solid', borderwidth=1, padx=6, pady=2,
-                           command=lambda r=ratio_val: self._set_cover_ratio(r))
+                           command=partial(self._set_cover_ratio, ratio_val))
             btn.pack(side=tk.LEFT, padx=1)
             self.ratio_buttons.append((btn, ratio_val))
         
         # 원본 비율 버튼
         self.original_ratio_btn = tk.Button(ratio_frame, text="📐 원본", 
                             font=ModernStyle.get_font(8),
-                            bg=ModernStyle.BG_WHITE,
-                            fg=ModernStyle.TEXT_PRIMARY,
+                            **ModernStyle.UNSELECTED_STYLE,
                             relief='solid', borderwidth=1, padx=6, pady=2,
                             command=self._set_original_ratio)
         self.original_ratio_btn.pack(side=tk.LEFT, padx=(5, 1))
@@ -2567,8 +3230,8 @@ class ProjectEditorDialog(tk.Toplevel):
         self.free_ratio_mode = tk.BooleanVar(value=self._is_custom_ratio(current_ratio))
         free_btn = tk.Button(ratio_frame, text="✋ 자유", 
                             font=ModernStyle.get_font(8),
-                            bg=ModernStyle.ACCENT if self.free_ratio_mode.get() else ModernStyle.BG_WHITE,
-                            fg='white' if self.free_ratio_mode.get() else ModernStyle.TEXT_PRIMARY,
+                            **(ModernStyle.SELECTED_STYLE if self.free_ratio_mode.get()
+                               else ModernStyle.UNSELECTED_STYLE),
                             relief='solid', borderwidth=1, padx=6, pady=2,
                             command=self._toggle_free_ratio)
         free_btn.pack(side=tk.LEFT, padx=(5, 1))
@@ -2579,32 +3242,8 @@ class ProjectEditorDialog(tk.Toplevel):
         
         # 현재 값 로드 (키워드 또는 백분율 지원)
         current_pos = self.project.get('cover_position', 'center center')
-        pos_map = {
-            'left': 0, 'center': 50, 'right': 100,
-            'top': 0, 'bottom': 100
-        }
-        parts = current_pos.split()
-        
-        # 백분율 또는 키워드 파싱
-        if len(parts) >= 1:
-            if '%' in parts[0]:
-                x_pos = float(parts[0].replace('%', ''))
-            else:
-                x_pos = pos_map.get(parts[0], 50)
-        else:
-            x_pos = 50
-        
-        if len(parts) >= 2:
-            if '%' in parts[1]:
-                y_pos = float(parts[1].replace('%', ''))
-            else:
-                y_pos = pos_map.get(parts[1], 50)
-        else:
-            y_pos = 50
-        
         self.cover_pos_var = tk.StringVar(value=current_pos)
-        self.cover_pos_x = x_pos
-        self.cover_pos_y = y_pos
+        self.cover_pos_x, self.cover_pos_y = _parse_cover_position(current_pos)
         
         # === 이미지 미리보기 캔버스 ===
         canvas_frame = tk.Frame(pos_frame, bg=ModernStyle.BG_WHITE)
@@ -2685,21 +3324,21 @@ class ProjectEditorDialog(tk.Toplevel):
         
         # 서브 이미지
         sub_zone = DropZone(scrollable, 'sub', '📄 서브 이미지 (01.jpg, 02.jpg, ...) - 상세페이지 본문 이미지들',
-                           project_folder, on_change=self._on_image_change)
+                           project_folder, on_change=lambda: self._on_image_change('sub'))
         sub_zone.pack(fill=tk.X, padx=20, pady=5)
         self.drop_zones.append(sub_zone)
         self.drag_manager.register_zone(sub_zone)
         
         # 모델 이미지
         model_zone = DropZone(scrollable, 'model', '🏗 모델 이미지 (model_images/) - 3열 그리드로 표시',
-                             project_folder, on_change=self._on_image_change)
+                             project_folder, on_change=lambda: self._on_image_change('model'))
         model_zone.pack(fill=tk.X, padx=20, pady=5)
         self.drop_zones.append(model_zone)
         self.drag_manager.register_zone(model_zone)
         
         # 슬라이드 이미지
         slide_zone = DropZone(scrollable, 'slide', '📑 슬라이드 이미지 (slide_images/) - 하단 추가 이미지',
-                             project_folder, on_change=self._on_image_change)
+                             project_folder, on_change=lambda: self._on_image_change('slide'))
         slide_zone.pack(fill=tk.X, padx=20, pady=5)
         self.drop_zones.append(slide_zone)
         self.drag_manager.register_zone(slide_zone)
@@ -2721,96 +3360,139 @@ class ProjectEditorDialog(tk.Toplevel):
         if not hasattr(self, 'pos_photo') or self.pos_photo is None:
             return
         
-        # 캔버스 초기화
-        self.pos_canvas.delete('all')
-        
-        # 이미 계산된 뷰포트 크기 사용
-        viewport_w = getattr(self, 'viewport_w', int(self.pos_canvas_width * 0.7))
-        viewport_h = getattr(self, 'viewport_h', int(self.pos_canvas_height * 0.7))
-        display_w, display_h = self.pos_display_size
-        
-        # 이동 가능 범위
-        max_offset_x = getattr(self, 'max_offset_x', max(0, display_w - viewport_w))
-        max_offset_y = getattr(self, 'max_offset_y', max(0, display_h - viewport_h))
+        vp_left, vp_top, vp_right, vp_bottom, max_offset_x, max_offset_y = self._pos_viewport_geometry()
         
         # 현재 위치에 따른 오프셋
-        offset_x = int(self.cover_pos_x / 100 * max_offset_x) if max_offset_x > 0 else 0
-        offset_y = int(self.cover_pos_y / 100 * max_offset_y) if max_offset_y > 0 else 0
-        
-        # 캔버스 중앙
-        canvas_center_x = self.pos_canvas_width // 2
-        canvas_center_y = self.pos_canvas_height // 2
-        
-        # 뷰포트 위치 (캔버스 중앙에 고정)
-        vp_left = canvas_center_x - viewport_w // 2
-        vp_top = canvas_center_y - viewport_h // 2
-        vp_right = canvas_center_x + viewport_w // 2
-        vp_bottom = canvas_center_y + viewport_h // 2
+        offset_x, offset_y = self._pos_image_offset(max_offset_x, max_offset_y)
+        self._last_pos_offset = (offset_x, offset_y)
         
         # 이미지 위치 (뷰포트를 기준으로 오프셋 적용)
         img_x = vp_left - offset_x
         img_y = vp_top - offset_y
         
-        # 이미지 표시
-        self.pos_img_id = self.pos_canvas.create_image(img_x, img_y, 
-                                                       image=self.pos_photo, anchor='nw')
-        
-        # 어두운 오버레이 (뷰포트 밖 영역) - 반투명 검정
-        # 상단
-        self.pos_canvas.create_rectangle(0, 0, self.pos_canvas_width, vp_top,
-                                        fill='#000000', stipple='gray50', outline='')
-        # 하단
-        self.pos_canvas.create_rectangle(0, vp_bottom, self.pos_canvas_width, self.pos_canvas_height,
-                                        fill='#000000', stipple='gray50', outline='')
-        # 좌측
-        self.pos_canvas.create_rectangle(0, vp_top, vp_left, vp_bottom,
-                                        fill='#000000', stipple='gray50', outline='')
-        # 우측
-        self.pos_canvas.create_rectangle(vp_right, vp_top, self.pos_canvas_width, vp_bottom,
-                                        fill='#000000', stipple='gray50', outline='')
+        # 캔버스 아이템은 처음 한 번만 만들고 이후에는 좌표/속성만 갱신
+        items = getattr(self, '_pos_items', None)
+        if items is None:
+            self.pos_canvas.delete('all')
+            items = self._pos_items = self._create_pos_items()
+        canvas = self.pos_canvas
         
-        # 뷰포트 테두리 (녹색)
-        self.pos_canvas.create_rectangle(vp_left, vp_top, vp_right, vp_bottom,
-                                        outline='#00ff00', width=2)
+        # 이미지 표시
+        canvas.coords(items['image'], img_x, img_y)
+        if items['photo'] is not self.pos_photo:
+            canvas.itemconfigure(items['image'], image=self.pos_photo)
+            items['photo'] = self.pos_photo
+        self.pos_img_id = items['image']
+        
+        # 뷰포트가 바뀐 경우에만 오버레이/테두리/핸들 이동 (위치 드래그 중에는 그대로)
+        rect = (vp_left, vp_top, vp_right, vp_bottom)
+        if items['rect'] != rect:
+            # 어두운 오버레이 (뷰포트 밖 영역)
+            items['overlay_photo'] = self._make_pos_overlay(rect)
+            canvas.itemconfigure(items['overlay'], image=items['overlay_photo'])
+            # 뷰포트 테두리
+            canvas.coords(items['frame'], vp_left, vp_top, vp_right, vp_bottom)
+            canvas.coords(items['label'], vp_right - 5, vp_top + 5)
+            # 리사이즈 핸들 (우하단, 좌하단, 우상단, 좌상단)
+            handle_size = 10
+            br, bl, tr, tl = items['handles']
+            canvas.coords(br, vp_right - handle_size, vp_bottom - handle_size, vp_right, vp_bottom)
+            canvas.coords(bl, vp_left, vp_bottom - handle_size, vp_left + handle_size, vp_bottom)
+            canvas.coords(tr, vp_right - handle_size, vp_top, vp_right, vp_top + handle_size)
+            canvas.coords(tl, vp_left, vp_top, vp_left + handle_size, vp_top + handle_size)
+            items['rect'] = rect
         
         # 비율 텍스트 표시
         ratio_text = self.cover_ratio_var.get() if hasattr(self, 'cover_ratio_var') else '16:9'
-        self.pos_canvas.create_text(vp_right - 5, vp_top + 5, text=ratio_text,
-                                   fill='#00ff00', anchor='ne', font=('Arial', 10, 'bold'))
+        if items['ratio_text'] != ratio_text:
+            canvas.itemconfigure(items['label'], text=ratio_text)
+            items['ratio_text'] = ratio_text
         
-        # 자유 비율 모드일 때 리사이즈 핸들 표시
-        if hasattr(self, 'free_ratio_mode') and self.free_ratio_mode.get():
-            handle_size = 10
-            # 우하단 핸들
-            self.pos_canvas.create_rectangle(
-                vp_right - handle_size, vp_bottom - handle_size,
-                vp_right, vp_bottom,
-                fill='#00ff00', outline='white', width=1
-            )
-            # 좌하단 핸들
-            self.pos_canvas.create_rectangle(
-                vp_left, vp_bottom - handle_size,
-                vp_left + handle_size, vp_bottom,
-                fill='#00ff00', outline='white', width=1
-            )
-            # 우상단 핸들
-            self.pos_canvas.create_rectangle(
-                vp_right - handle_size, vp_top,
-                vp_right, vp_top + handle_size,
-                fill='#00ff00', outline='white', width=1
-            )
-            # 좌상단 핸들
-            self.pos_canvas.create_rectangle(
-                vp_left, vp_top,
-                vp_left + handle_size, vp_top + handle_size,
-                fill='#00ff00', outline='white', width=1
-            )
+        # 자유 비율 모드일 때만 리사이즈 핸들 표시
+        free_mode = hasattr(self, 'free_ratio_mode') and self.free_ratio_mode.get()
+        if items['free_mode'] != free_mode:
+            for handle in items['handles']:
+                canvas.itemconfigure(handle, state='normal' if free_mode else 'hidden')
+            items['free_mode'] = free_mode
+        
+        # 뷰포트 좌표 저장
+        self.vp_left = vp_left
+        self.vp_top = vp_top
+        self.vp_right = vp_right
+        self.vp_bottom = vp_bottom
+    
+    def _make_pos_overlay(self, rect):
+        """뷰포트 밖을 50% 검정으로 덮는 캔버스 크기 오버레이 (stipple 사각형 4개 대신)"""
+        vp_left, vp_top, vp_right, vp_bottom = rect
+        overlay = Image.new('RGBA', (self.pos_canvas_width, self.pos_canvas_height), (0, 0, 0, 128))
+        ImageDraw.Draw(overlay).rectangle((vp_left, vp_top, vp_right - 1, vp_bottom - 1),
+                                          fill=(0, 0, 0, 0))
+        return ImageTk.PhotoImage(overlay)
+    
+    def _create_pos_items(self):
+        """위치 조절 캔버스 아이템 생성 (좌표는 _update_pos_canvas 에서 설정)"""
+        canvas = self.pos_canvas
+        image = canvas.create_image(0, 0, image=self.pos_photo, anchor='nw')
+        # 어두운 오버레이 (뷰포트 부분만 뚫린 반투명 이미지 한 장)
+        overlay = canvas.create_image(0, 0, anchor='nw')
+        # 뷰포트 테두리 (녹색)
+        frame = canvas.create_rectangle(0, 0, 0, 0, outline='#00ff00', width=2)
+        label = canvas.create_text(0, 0, text='', fill='#00ff00', anchor='ne',
+                                   font=('Arial', 10, 'bold'))
+        # 자유 비율 리사이즈 핸들 (우하단, 좌하단, 우상단, 좌상단)
+        handles = tuple(
+            canvas.create_rectangle(0, 0, 0, 0, fill='#00ff00', outline='white', width=1,
+                                    state='hidden')
+            for _ in range(4)
+        )
+        return {
+            'image': image, 'photo': self.pos_photo, 'overlay': overlay, 'overlay_photo': None,
+            'frame': frame,
+            'label': label, 'handles': handles, 'rect': None, 'ratio_text': '', 'free_mode': False,
+        }
+    
+    def _pos_image_offset(self, max_offset_x, max_offset_y):
+        """cover_pos_x/y(%) 에 해당하는 이미지 이동량 (픽셀)"""
+        offset_x = int(self.cover_pos_x / 100 * max_offset_x) if max_offset_x > 0 else 0
+        offset_y = int(self.cover_pos_y / 100 * max_offset_y) if max_offset_y > 0 else 0
+        return offset_x, offset_y
+    
+    def _pos_viewport_geometry(self):
+        """
+        뷰포트 사각형과 이동 가능 범위 (vp_left, vp_top, vp_right, vp_bottom, max_offset_x, max_offset_y)
+        
+        드래그 중에는 위치만 바뀌므로, 뷰포트/이미지 크기가 그대로면 이전 계산 결과를 재사용
+        """
+        # 이미 계산된 뷰포트 크기 사용
+        viewport_w = getattr(self, 'viewport_w', int(self.pos_canvas_width * 0.7))
+        viewport_h = getattr(self, 'viewport_h', int(self.pos_canvas_height * 0.7))
+        display_w, display_h = self.pos_display_size
+        
+        # 이동 가능 범위
+        max_offset_x = getattr(self, 'max_offset_x', max(0, display_w - viewport_w))
+        max_offset_y = getattr(self, 'max_offset_y', max(0, display_h - viewport_h))
         
-        # 뷰포트 좌표 저장
-        self.vp_left = vp_left
-        self.vp_top = vp_top
-        self.vp_right = vp_right
-        self.vp_bottom = vp_bottom
+        key = (viewport_w, viewport_h, max_offset_x, max_offset_y,
+               self.pos_canvas_width, self.pos_canvas_height)
+        cached = getattr(self, '_pos_vp_cache', None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # 캔버스 중앙
+        canvas_center_x = self.pos_canvas_width // 2
+        canvas_center_y = self.pos_canvas_height // 2
+        
+        # 뷰포트 위치 (캔버스 중앙에 고정)
+        geometry = (
+            canvas_center_x - viewport_w // 2,
+            canvas_center_y - viewport_h // 2,
+            canvas_center_x + viewport_w // 2,
+            canvas_center_y + viewport_h // 2,
+            max_offset_x,
+            max_offset_y,
+        )
+        self._pos_vp_cache = (key, geometry)
+        return geometry
     
     def _on_canvas_click(self, event):
         """캔버스 클릭 - 리사이즈 또는 드래그 시작"""
@@ -2848,7 +3530,21 @@ class ProjectEditorDialog(tk.Toplevel):
         self._pos_drag_start(event)
     
     def _on_canvas_drag(self, event):
-        """캔버스 드래그 - 리사이즈 또는 위치 이동"""
+        """캔버스 드래그 - 연달아 오는 이벤트는 모아서 idle 때 마지막 것만 처리"""
+        self._last_drag_event = event
+        if getattr(self, '_drag_job', None) is None:
+            self._drag_job = self.after_idle(self._flush_drag)
+    
+    def _flush_drag(self):
+        """모아둔 마지막 드래그 이벤트로 리사이즈 또는 위치 이동"""
+        job = getattr(self, '_drag_job', None)
+        if job is not None:
+            self.after_cancel(job)
+            self._drag_job = None
+        event = getattr(self, '_last_drag_event', None)
+        if event is None:
+            return
+        self._last_drag_event = None
         if getattr(self, 'resizing_frame', False):
             self._do_frame_resize(event)
         else:
@@ -2856,6 +3552,9 @@ class ProjectEditorDialog(tk.Toplevel):
     
     def _on_canvas_release(self, event):
         """캔버스 릴리즈"""
+        # 마지막 드래그 위치가 바로 그려지도록 남은 이벤트와 예약된 갱신을 즉시 실행
+        self._flush_drag()
+        self._flush_pos_redraw()
         if getattr(self, 'resizing_frame', False):
             self.resizing_frame = False
         else:
@@ -2879,12 +3578,14 @@ class ProjectEditorDialog(tk.Toplevel):
                 (abs(event.x - vp_left) < handle_size and abs(event.y - vp_top) < handle_size)
             )
             
-            if on_corner:
-                self.pos_canvas.config(cursor='sizing')
-            else:
-                self.pos_canvas.config(cursor='fleur')
+            cursor = 'sizing' if on_corner else 'fleur'
         else:
-            self.pos_canvas.config(cursor='fleur')
+            cursor = 'fleur'
+        
+        # 상태가 바뀔 때만 커서 변경
+        if cursor != getattr(self, '_cursor_state', None):
+            self._cursor_state = cursor
+            self.pos_canvas.config(cursor=cursor)
     
     def _do_frame_resize(self, event):
         """프레임 리사이즈 처리"""
@@ -2937,8 +3638,8 @@ class ProjectEditorDialog(tk.Toplevel):
         self.cover_ratio_var.set(custom_ratio)
         self.project['cover_ratio'] = custom_ratio
         
-        # 캔버스 업데이트
-        self._update_pos_canvas()
+        # 캔버스 업데이트 (프레임당 한 번)
+        self._schedule_pos_redraw()
     
     def _pos_drag_start(self, event):
         """드래그 시작"""
@@ -2974,12 +3675,28 @@ class ProjectEditorDialog(tk.Toplevel):
         self.cover_pos_x = max(0, min(100, new_x))
         self.cover_pos_y = max(0, min(100, new_y))
         
-        # 캔버스 업데이트
-        self._update_pos_canvas()
+        # 캔버스 업데이트 (프레임당 한 번), 화면상 1px 도 안 움직였으면 다시 그리지 않음
+        max_offset_x, max_offset_y = self._pos_viewport_geometry()[4:]
+        if self._pos_image_offset(max_offset_x, max_offset_y) != getattr(self, '_last_pos_offset', None):
+            self._schedule_pos_redraw()
         
         # 위치 문자열 업데이트
         self._update_position_string()
     
+    def _schedule_pos_redraw(self):
+        """드래그 중 캔버스 갱신을 약 16ms(한 프레임)에 한 번으로 합침"""
+        if getattr(self, '_pos_redraw_job', None) is None:
+            self._pos_redraw_job = self.after(16, self._flush_pos_redraw)
+    
+    def _flush_pos_redraw(self):
+        """예약된 캔버스 갱신이 있으면 지금 실행"""
+        job = getattr(self, '_pos_redraw_job', None)
+        if job is None:
+            return
+        self.after_cancel(job)
+        self._pos_redraw_job = None
+        self._update_pos_canvas()
+    
     def _pos_drag_end(self, event):
         """드래그 종료"""
         self._update_position_string()
@@ -3016,7 +3733,11 @@ class ProjectEditorDialog(tk.Toplevel):
         self.cover_pos_var.set(position)
     
     def _load_main_image_preview(self):
-        """메인 이미지 미리보기 로드"""
+        """
+        메인 이미지 미리보기 로드
+        
+        디코딩/축소는 백그라운드 스레드에서 하고, 끝나면 메인 스레드에서 캔버스에 표시
+        """
         self.pos_image = None
         self.pos_photo = None
         self.pos_img_id = None
@@ -3036,32 +3757,65 @@ class ProjectEditorDialog(tk.Toplevel):
         if not main_img_path.exists():
             main_img_path = self.project_folder / "main.webp"
         
+        # 이전 로드가 아직 진행 중이면 그 결과는 버림
+        self._pos_load_seq = getattr(self, '_pos_load_seq', 0) + 1
+        
         if main_img_path.exists():
-            try:
-                from PIL import Image, ImageTk
-                img = Image.open(main_img_path)
-                self.pos_original_size = img.size
-                self.pos_pil_image = img.copy()  # PIL 이미지 저장
-                
-                self._update_zoomed_image()
-                
-            except Exception as e:
-                self.pos_canvas.delete('all')
-                self.pos_canvas.create_text(self.pos_canvas_width // 2, self.pos_canvas_height // 2,
-                                           text=f"이미지 로드 실패: {e}", fill='white')
+            future = _THUMB_POOL.submit(self._decode_pos_preview, main_img_path)
+            self._pos_poll_job = self.after(15, self._poll_pos_preview, future, self._pos_load_seq)
         else:
-            self.pos_canvas.delete('all')
-            self.pos_canvas.create_text(self.pos_canvas_width // 2, self.pos_canvas_height // 2,
-                                       text="메인 이미지 없음\n(이미지를 먼저 추가하세요)", 
-                                       fill='white', justify='center')
+            self._show_pos_message("메인 이미지 없음\n(이미지를 먼저 추가하세요)")
+    
+    @staticmethod
+    def _decode_pos_preview(path):
+        """미리보기용 축소 이미지 디코딩 (워커 스레드에서 실행, Tk 객체는 만들지 않음)"""
+        with Image.open(path) as img:
+            original_size = img.size
+            # 미리보기용이므로 원본 해상도 대신 축소본만 보관 (JPEG 는 디코딩 단계에서 축소)
+            preview_box = (HOME_PREVIEW_MAX_SIZE, HOME_PREVIEW_MAX_SIZE)
+            img.draft('RGB', preview_box)
+            img.thumbnail(preview_box, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            preview = img.copy()
+        st = path.stat()
+        return original_size, preview, (str(path), st.st_mtime_ns, st.st_size)
+    
+    def _poll_pos_preview(self, future, seq):
+        self._pos_poll_job = None
+        if seq != self._pos_load_seq:
+            return
+        if not future.done():
+            self._pos_poll_job = self.after(15, self._poll_pos_preview, future, seq)
+            return
+        try:
+            if not self.pos_canvas.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        try:
+            self.pos_original_size, self.pos_pil_image, source_key = future.result()
+        except Exception as e:
+            self._show_pos_message(f"이미지 로드 실패: {e}")
+            return
+        
+        # 같은 파일을 다시 읽은 경우가 아니면 확대 이미지 캐시 비움
+        if getattr(self, '_pos_photo_source', None) != source_key:
+            self._pos_photo_source = source_key
+            self._pos_photo_cache = OrderedDict()
+        
+        self._update_zoomed_image()
+    
+    def _show_pos_message(self, text):
+        """위치 조절 캔버스에 이미지 대신 안내 문구 표시"""
+        self.pos_canvas.delete('all')
+        self._pos_items = None
+        self.pos_canvas.create_text(self.pos_canvas_width // 2, self.pos_canvas_height // 2,
+                                    text=text, fill='white', justify='center')
     
     def _update_zoomed_image(self):
         """확대/축소된 이미지 업데이트"""
         if not hasattr(self, 'pos_pil_image') or self.pos_pil_image is None:
             return
         
-        from PIL import Image, ImageTk
-        
         img = self.pos_pil_image
         img_ratio = img.width / img.height
         
@@ -3104,9 +3858,19 @@ class ProjectEditorDialog(tk.Toplevel):
         
         self.pos_display_size = (display_width, display_height)
         
-        # 이미지 리사이즈
-        img_resized = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
-        self.pos_photo = ImageTk.PhotoImage(img_resized)
+        # 이미지 리사이즈 (이전에 만든 크기면 리샘플링 없이 재사용)
+        # 확대/축소할 때마다 바뀌는 미리보기라 BILINEAR 로 충분 (저장용 최적화는 LANCZOS 유지)
+        cache = self._pos_photo_cache
+        key = (display_width, display_height)
+        photo = cache.get(key)
+        if photo is None:
+            img_resized = img.resize((display_width, display_height), Image.Resampling.BILINEAR)
+            photo = cache[key] = ImageTk.PhotoImage(img_resized)
+            if len(cache) > POS_PREVIEW_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        self.pos_photo = photo
         
         # 이동 가능 범위 계산
         self.max_offset_x = max(0, display_width - viewport_w)
@@ -3130,6 +3894,7 @@ class ProjectEditorDialog(tk.Toplevel):
             self.zoom_label.config(text=f"{int(self.pos_zoom * 100)}%")
         
         self._update_zoomed_image()
+        return "break"
     
     def _zoom_in(self):
         """확대"""
@@ -3160,16 +3925,16 @@ class ProjectEditorDialog(tk.Toplevel):
         
         if self.free_ratio_mode.get():
             # 자유 비율 버튼 활성화
-            self.free_ratio_btn.configure(bg=ModernStyle.ACCENT, fg='white')
+            self.free_ratio_btn.configure(**ModernStyle.SELECTED_STYLE)
             # 다른 버튼 비활성화 스타일
             for btn, _ in self.ratio_buttons:
-                btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+                btn.configure(**ModernStyle.UNSELECTED_STYLE)
             # 원본 비율 버튼도 비활성화 스타일
             if hasattr(self, 'original_ratio_btn'):
-                self.original_ratio_btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+                self.original_ratio_btn.configure(**ModernStyle.UNSELECTED_STYLE)
         else:
             # 16:9로 복귀
-            self.free_ratio_btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+            self.free_ratio_btn.configure(**ModernStyle.UNSELECTED_STYLE)
             self._set_cover_ratio('16:9')
     
     def _on_frame_resize_start(self, event):
@@ -3250,18 +4015,18 @@ class ProjectEditorDialog(tk.Toplevel):
         if hasattr(self, 'free_ratio_mode'):
             self.free_ratio_mode.set(False)
         if hasattr(self, 'free_ratio_btn'):
-            self.free_ratio_btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+            self.free_ratio_btn.configure(**ModernStyle.UNSELECTED_STYLE)
         # 원본 비율 버튼 비활성화 스타일
         if hasattr(self, 'original_ratio_btn'):
-            self.original_ratio_btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+            self.original_ratio_btn.configure(**ModernStyle.UNSELECTED_STYLE)
         
         # 버튼 스타일 업데이트
         if hasattr(self, 'ratio_buttons'):
             for btn, ratio_val in self.ratio_buttons:
                 if ratio_val == ratio:
-                    btn.configure(bg=ModernStyle.ACCENT, fg='white')
+                    btn.configure(**ModernStyle.SELECTED_STYLE)
                 else:
-                    btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+                    btn.configure(**ModernStyle.UNSELECTED_STYLE)
         
         # 이미지 크기 재계산
         if hasattr(self, 'pos_pil_image') and self.pos_pil_image:
@@ -3275,8 +4040,8 @@ class ProjectEditorDialog(tk.Toplevel):
             messagebox.showwarning("알림", "먼저 메인 이미지를 첨부해주세요.")
             return
         
-        # 원본 이미지 크기에서 비율 계산
-        img_width, img_height = self.pos_pil_image.size
+        # 원본 이미지 크기에서 비율 계산 (pos_pil_image 는 미리보기용 축소본)
+        img_width, img_height = self.pos_original_size
         
         # 최대공약수로 간단한 비율 만들기
         from math import gcd
@@ -3297,15 +4062,15 @@ class ProjectEditorDialog(tk.Toplevel):
         # 모든 비율 버튼 비활성화 스타일로
         if hasattr(self, 'ratio_buttons'):
             for btn, ratio_val in self.ratio_buttons:
-                btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+                btn.configure(**ModernStyle.UNSELECTED_STYLE)
         if hasattr(self, 'free_ratio_btn'):
-            self.free_ratio_btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+            self.free_ratio_btn.configure(**ModernStyle.UNSELECTED_STYLE)
         if hasattr(self, 'free_ratio_mode'):
             self.free_ratio_mode.set(False)
         
         # 원본 비율 버튼 활성화 스타일
         if hasattr(self, 'original_ratio_btn'):
-            self.original_ratio_btn.configure(bg=ModernStyle.ACCENT, fg='white')
+            self.original_ratio_btn.configure(**ModernStyle.SELECTED_STYLE)
         
         # 캔버스 업데이트
         if hasattr(self, 'pos_pil_image') and self.pos_pil_image:
@@ -3322,9 +4087,9 @@ class ProjectEditorDialog(tk.Toplevel):
         if hasattr(self, 'ratio_buttons'):
             for btn, ratio_val in self.ratio_buttons:
                 if ratio_val == ratio:
-                    btn.configure(bg=ModernStyle.ACCENT, fg='white')
+                    btn.configure(**ModernStyle.SELECTED_STYLE)
                 else:
-                    btn.configure(bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY)
+                    btn.configure(**ModernStyle.UNSELECTED_STYLE)
         
         # 캔버스 업데이트
         if hasattr(self, 'pos_photo') and self.pos_photo:
@@ -3332,6 +4097,7 @@ class ProjectEditorDialog(tk.Toplevel):
     
     def _refresh_main_image(self):
         """메인 이미지 새로고침"""
+        self._main_refresh_job = None
         self._load_main_image_preview()
     
     def _reset_cover_position(self):
@@ -3348,30 +4114,37 @@ class ProjectEditorDialog(tk.Toplevel):
         self.project['cover_position'] = position
         
         # 위치 문자열을 백분율로 변환
-        pos_map = {
-            'left': 0, 'center': 50, 'right': 100,
-            'top': 0, 'bottom': 100
-        }
-        parts = position.split()
-        if len(parts) >= 2:
-            if '%' in parts[0]:
-                self.cover_pos_x = float(parts[0].replace('%', ''))
-            else:
-                self.cover_pos_x = pos_map.get(parts[0], 50)
-            
-            if '%' in parts[1]:
-                self.cover_pos_y = float(parts[1].replace('%', ''))
-            else:
-                self.cover_pos_y = pos_map.get(parts[1], 50)
+        self.cover_pos_x, self.cover_pos_y = _parse_cover_position(position)
         
         if hasattr(self, 'pos_canvas'):
             self._update_pos_canvas()
     
-    def _on_image_change(self):
-        """이미지 변경 시 - 메인 이미지 미리보기 업데이트"""
-        # 잠시 후 이미지 새로고침 (파일 저장 완료 대기)
-        if hasattr(self, 'pos_canvas'):
-            self.after(500, self._refresh_main_image)
+    def _on_image_change(self, kind=None):
+        """
+        이미지 변경 시 - 메인 이미지가 바뀐 경우에만 위치 조절 미리보기 업데이트
+        
+        각 DropZone 은 자기 목록을 스스로 다시 읽으므로, 썸네일/서브/모델/슬라이드 변경에는
+        메인 이미지를 다시 디코딩하지 않음
+        """
+        if kind not in (None, 'main') or not hasattr(self, 'pos_canvas'):
+            return
+        # 잠시 후 이미지 새로고침 (파일 저장 완료 대기), 연달아 바뀌면 마지막 한 번만
+        job = getattr(self, '_main_refresh_job', None)
+        if job is not None:
+            self.after_cancel(job)
+        self._main_refresh_job = self.after(500, self._refresh_main_image)
+    
+    def destroy(self):
+        """창을 닫을 때 예약해 둔 캔버스 갱신/미리보기 작업을 취소 (닫힌 뒤 실행되지 않도록)"""
+        for name in ('_pos_redraw_job', '_drag_job', '_main_refresh_job', '_pos_poll_job'):
+            job = getattr(self, name, None)
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except tk.TclError:
+                    pass
+                setattr(self, name, None)
+        super().destroy()
     
     def create_caption_tab(self, parent):
         """캡션 관리 탭 - 홈페이지 미리보기 스타일"""
@@ -3395,8 +4168,7 @@ class ProjectEditorDialog(tk.Toplevel):
         
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-        scrollable.bind("<MouseWheel>", _on_mousewheel)
+        _register_wheel_area(canvas, _on_mousewheel)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -3445,11 +4217,11 @@ class ProjectEditorDialog(tk.Toplevel):
         if folder.exists():
             if is_slide:
                 for f in sorted(folder.glob("*.*"), key=lambda x: self._sort_key_num(x)):
-                    if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
+                    if f.suffix.lower() in _VALID_IMAGE_EXTS:
                         images.append(f)
             else:
                 for f in sorted(folder.glob("[0-9][0-9].*")):
-                    if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
+                    if f.suffix.lower() in _VALID_IMAGE_EXTS:
                         images.append(f)
         
         # 이미지 수 표시
@@ -3551,14 +4323,14 @@ class ProjectEditorDialog(tk.Toplevel):
         tk.Button(btn_frame, text="저장", font=ModernStyle.get_font(9),
                  bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY,
                  relief='solid', borderwidth=1, padx=12, cursor='hand2',
-                 command=lambda k=caption_key, e=caption_entry: self._save_inline_caption(k, e)).pack(side=tk.LEFT, padx=(0, 5))
+                 command=partial(self._save_inline_caption, caption_key, caption_entry)).pack(side=tk.LEFT, padx=(0, 5))
         
         # 삭제 버튼
         if has_caption:
             tk.Button(btn_frame, text="삭제", font=ModernStyle.get_font(9),
                      bg=ModernStyle.BG_WHITE, fg=ModernStyle.DANGER,
                      relief='solid', borderwidth=1, padx=8, cursor='hand2',
-                     command=lambda k=caption_key: self._delete_caption(k)).pack(side=tk.LEFT)
+                     command=partial(self._delete_caption, caption_key)).pack(side=tk.LEFT)
         
         # 레이블 참조 저장
         self.caption_labels[caption_key] = (caption_entry, container)
@@ -3574,6 +4346,8 @@ class ProjectEditorDialog(tk.Toplevel):
             del captions[caption_key]
         
         CaptionManager.save_captions(self.caption_project_folder, captions)
+        # 저장 완료를 알리기 전에 파일에 바로 기록
+        CaptionManager.flush(self.caption_project_folder)
         messagebox.showinfo("저장", "캡션이 저장되었습니다.\n브라우저에서 Ctrl+Shift+R로 새로고침하세요.")
         self._refresh_caption_tab()
     
@@ -3668,7 +4442,7 @@ class ProjectEditorDialog(tk.Toplevel):
         underline_frame.pack(side=tk.LEFT)
         tk.Radiobutton(underline_frame, text="", variable=style_var, value="underline",
                       bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(underline_frame, text="밑줄", font=('Segoe UI', 10, 'underline'),
+        tk.Label(underline_frame, text="밑줄", font=ModernStyle.get_font(10, 'underline'),
                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
         
         def apply_link():
@@ -3677,7 +4451,7 @@ class ProjectEditorDialog(tk.Toplevel):
             
             if url and url != "https://":
                 # 마크다운 형식으로 변환: [텍스트](URL|스타일)
-                markdown_link = f"[{selected_text}]({url}|{style})"
+                markdown_link = _make_markdown_link(selected_text, url, style)
                 new_text = current_text.replace(selected_text, markdown_link, 1)
                 text_widget.delete('1.0', tk.END)
                 text_widget.insert('1.0', new_text)
@@ -3818,10 +4592,16 @@ class ProjectEditorDialog(tk.Toplevel):
         # slug이 변경되었거나 새 프로젝트인 경우 폴더 이동/생성
         project_type = self.mode if self.mode in ['drawings', 'graphics'] else 'projects'
         if old_slug and old_slug != new_slug:
+            # 이미지를 추가하는 중에 폴더를 옮기면 작업 스레드가 옛 경로에 파일을 쓰게 됨
+            if any(zone.is_busy() for zone in getattr(self, 'drop_zones', [])):
+                messagebox.showinfo("알림", "이미지를 아직 처리 중입니다. 끝난 뒤 다시 저장하세요.", parent=self)
+                return
             old_folder = IMAGES_DIR / project_type / old_slug
             new_folder = IMAGES_DIR / project_type / new_slug
             
             if old_folder.exists() and not new_folder.exists():
+                # 아직 기록되지 않은 캡션이 옮겨지기 전 폴더에 남아 사라지지 않도록 먼저 기록
+                CaptionManager.flush_all()
                 try:
                     shutil.move(str(old_folder), str(new_folder))
                 except Exception as e:
@@ -3845,9 +4625,10 @@ class ProjectEditorDialog(tk.Toplevel):
             'visible': self.visible_var.get(),
             'model_cols': self.model_cols.get(),
             'show_slides': self.show_slides.get(),
-            'cover_ratio': self.cover_ratio_var.get() if hasattr(self, 'cover_ratio_var') else '16:9',
-            'cover_position': self.cover_pos_var.get() if hasattr(self, 'cover_pos_var') else 'center center',
-            'cover_zoom': self.pos_zoom if hasattr(self, 'pos_zoom') else 1.5,
+            # 이미지 탭을 열지 않았으면 기존 값 유지
+            'cover_ratio': self.cover_ratio_var.get() if hasattr(self, 'cover_ratio_var') else self.project.get('cover_ratio', '16:9'),
+            'cover_position': self.cover_pos_var.get() if hasattr(self, 'cover_pos_var') else self.project.get('cover_position', 'center center'),
+            'cover_zoom': self.pos_zoom if hasattr(self, 'pos_zoom') else self.project.get('cover_zoom', 1.5),
             'custom_fields': custom_fields,
         }
         self.result.update({
@@ -4047,16 +4828,16 @@ class TabManagerDialog(tk.Toplevel):
             if i > 0:
                 tk.Button(order_frame, text="▲", font=ModernStyle.get_font(8),
                          bg=ModernStyle.BG_WHITE, relief='flat',
-                         command=lambda idx=i: self.move_tab(idx, -1)).pack(side=tk.LEFT)
+                         command=partial(self.move_tab, i, -1)).pack(side=tk.LEFT)
             if i < len(self.tabs) - 1:
                 tk.Button(order_frame, text="▼", font=ModernStyle.get_font(8),
                          bg=ModernStyle.BG_WHITE, relief='flat',
-                         command=lambda idx=i: self.move_tab(idx, 1)).pack(side=tk.LEFT)
+                         command=partial(self.move_tab, i, 1)).pack(side=tk.LEFT)
             
             # 삭제 버튼
             tk.Button(row, text="✕", font=ModernStyle.get_font(9),
                      bg=ModernStyle.DANGER, fg=ModernStyle.BG_WHITE, relief='flat',
-                     padx=8, command=lambda idx=i: self.delete_tab(idx)).pack(side=tk.RIGHT, padx=5)
+                     padx=8, command=partial(self.delete_tab, i)).pack(side=tk.RIGHT, padx=5)
             
             self.tab_widgets.append({
                 'name_var': name_var,
@@ -5178,7 +5959,7 @@ class AboutEditorDialog(tk.Toplevel):
         
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        _register_wheel_area(canvas, _on_mousewheel)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -5331,7 +6112,7 @@ class AboutEditorDialog(tk.Toplevel):
         add_btn = tk.Button(container, text="+ 항목 추가", font=ModernStyle.get_font(9),
                            bg=ModernStyle.BG_WHITE, fg=ModernStyle.ACCENT,
                            relief='flat', cursor='hand2',
-                           command=lambda c=container, k=section_key: self._add_section_item(c, k, '', ''))
+                           command=partial(self._add_section_item, container, section_key, '', ''))
         add_btn.pack(anchor=tk.W, pady=5)
         
         setattr(self, f'{section_key}_container', container)
@@ -5375,7 +6156,7 @@ class AboutEditorDialog(tk.Toplevel):
         del_btn = tk.Button(frame, text="✕", font=ModernStyle.get_font(8),
                            bg=ModernStyle.BG_WHITE, fg=ModernStyle.DANGER,
                            relief='flat', cursor='hand2',
-                           command=lambda f=frame, k=section_key: self._remove_section_item(f, k))
+                           command=partial(self._remove_section_item, frame, section_key))
         del_btn.pack(side=tk.LEFT)
         
         widget_data = {'frame': frame, 'date': date_entry, 'content': content_entry}
@@ -5462,7 +6243,7 @@ class AboutEditorDialog(tk.Toplevel):
         underline_frame.pack(side=tk.LEFT)
         tk.Radiobutton(underline_frame, text="", variable=style_var, value="underline",
                       bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(underline_frame, text="밑줄", font=('Segoe UI', 10, 'underline'),
+        tk.Label(underline_frame, text="밑줄", font=ModernStyle.get_font(10, 'underline'),
                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
         
         def apply_link():
@@ -5470,7 +6251,7 @@ class AboutEditorDialog(tk.Toplevel):
             style = style_var.get()
             
             if url and url != "https://":
-                markdown_link = f"[{selected_text}]({url}|{style})"
+                markdown_link = _make_markdown_link(selected_text, url, style)
                 new_text = current_text.replace(selected_text, markdown_link, 1)
                 entry_widget.delete(0, tk.END)
                 entry_widget.insert(0, new_text)
@@ -5658,7 +6439,7 @@ class AboutEditorDialog(tk.Toplevel):
         underline_frame.pack(side=tk.LEFT)
         tk.Radiobutton(underline_frame, text="", variable=style_var, value="underline",
                       bg=ModernStyle.BG_WHITE).pack(side=tk.LEFT)
-        tk.Label(underline_frame, text="밑줄", font=('Segoe UI', 10, 'underline'),
+        tk.Label(underline_frame, text="밑줄", font=ModernStyle.get_font(10, 'underline'),
                 bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
         
         def save_link():
@@ -5922,8 +6703,7 @@ class FooterEditorDialog(tk.Toplevel):
         # 마우스 휠 바인딩
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        self.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        _register_wheel_area(canvas, on_mousewheel)
         
         self.entries = {}
         
@@ -6774,7 +7554,7 @@ class PortfolioAdminApp:
                            font=ModernStyle.get_font(10),
                            bg=ModernStyle.BG_WHITE, fg=ModernStyle.TEXT_PRIMARY,
                            relief='flat', padx=15, pady=8,
-                           command=lambda m=mode, f=tab['file']: self.switch_mode(m, f))
+                           command=partial(self.switch_mode, mode, tab['file']))
             btn.pack(side=tk.LEFT, padx=(0, 5))
             self.nav_buttons[mode] = btn
         
@@ -7149,7 +7929,7 @@ class PortfolioAdminApp:
             try:
                 # 서브 이미지 재정렬 (01.jpg, 02.jpg, ...)
                 sub_images = sorted([f for f in folder.glob("[0-9][0-9].*") 
-                                    if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']])
+                                    if f.suffix.lower() in _VALID_IMAGE_EXTS])
                 for i, img in enumerate(sub_images, 1):
                     new_name = f"{str(i).zfill(2)}{img.suffix}"
                     new_path = folder / new_name
@@ -7166,7 +7946,7 @@ class PortfolioAdminApp:
                 model_folder = folder / "model_images"
                 if model_folder.exists():
                     model_images = sorted([f for f in model_folder.glob("*.*") 
-                                          if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']],
+                                          if f.suffix.lower() in _VALID_IMAGE_EXTS],
                                          key=lambda x: int(''.join(filter(str.isdigit, x.stem)) or 0))
                     for i, img in enumerate(model_images, 1):
                         new_name = f"{i}{img.suffix}"
@@ -7252,6 +8032,9 @@ class PortfolioAdminApp:
         errors = 0
         removed_folders = []
 
+        # 폴더를 정리/삭제하기 전에 대기 중인 캡션을 먼저 기록
+        CaptionManager.flush_all()
+
         for project in self.projects:
             slug = str(project.get('slug', '')).strip()
             if not slug:
@@ -7264,7 +8047,7 @@ class PortfolioAdminApp:
             try:
                 sub_images = sorted(
                     [f for f in folder.glob("[0-9][0-9].*")
-                     if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']]
+                     if f.suffix.lower() in _VALID_IMAGE_EXTS]
                 )
                 for i, img in enumerate(sub_images, 1):
                     new_name = f"{str(i).zfill(2)}{img.suffix}"
@@ -7281,7 +8064,7 @@ class PortfolioAdminApp:
                 if model_folder.exists():
                     model_images = sorted(
                         [f for f in model_folder.glob("*.*")
-                         if f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']],
+                         if f.suffix.lower() in _VALID_IMAGE_EXTS],
                         key=lambda x: int(''.join(filter(str.isdigit, x.stem)) or 0)
                     )
                     for i, img in enumerate(model_images, 1):
@@ -7939,6 +8722,7 @@ class PortfolioAdminApp:
             
             # 2. 로컬에 데이터 저장
             self.save_data()
+            CaptionManager.flush_all()
             self.status_var.set("✅ 로컬 저장 완료. Git 푸시 중...")
             self.root.update()
             
@@ -8155,6 +8939,7 @@ def main():
     root = tk.Tk()
     PortfolioAdminApp(root)
     root.mainloop()
+    CaptionManager.flush_all()
 
 
 class MagazineEditorDialog(tk.Toplevel):
@@ -8287,12 +9072,12 @@ class MagazineEditorDialog(tk.Toplevel):
             # 삭제 버튼
             tk.Button(row, text="✕", font=ModernStyle.get_font(9),
                      bg=ModernStyle.DANGER, fg=ModernStyle.BG_WHITE, relief='flat',
-                     padx=8, command=lambda idx=i: self.delete_article(idx)).pack(side=tk.RIGHT, padx=5)
+                     padx=8, command=partial(self.delete_article, i)).pack(side=tk.RIGHT, padx=5)
             
             # 링크 편집 버튼
             tk.Button(row, text="🔗", font=ModernStyle.get_font(9),
                      bg=ModernStyle.BG_LIGHT, relief='flat',
-                     padx=8, command=lambda idx=i: self.edit_link(idx)).pack(side=tk.RIGHT, padx=2)
+                     padx=8, command=partial(self.edit_link, i)).pack(side=tk.RIGHT, padx=2)
             
             self.article_widgets.append({
                 'category_var': cat_var,
@@ -9115,6 +9900,10 @@ def _install_home_editor_korean_labels():
 
 _install_home_editor_korean_labels()
 
+# 소문자 16진수 문자 집합 (bytes.translate 의 delete 인자로 사용)
+_HEX_DIGITS = b"0123456789abcdef"
+
+
 def _install_home_editor_final_v2():
     """Final HomeManagerDialog override."""
 
@@ -9156,9 +9945,11 @@ def _install_home_editor_final_v2():
         }
 
     def _hex(value, fallback):
-        text = str(value or "").strip()
-        if text.startswith("#") and len(text) in {4, 7} and all(c in "0123456789abcdefABCDEF" for c in text[1:]):
-            return text.lower()
+        text = str(value or "").strip().lower()
+        digits = text[1:]
+        if text[:1] == "#" and len(text) in (4, 7) and digits.isascii():
+            if not digits.encode("ascii").translate(None, _HEX_DIGITS):
+                return text
         return fallback
 
     def _clamp_i(value, lo, hi, default):
@@ -9724,13 +10515,150 @@ def _install_home_editor_final_v2():
 _install_home_editor_final_v2()
 
 
+Slogan = namedtuple("Slogan", ["text", "font_family", "size_rem", "color"])
+DEFAULT_SLOGAN = Slogan("DESIGN ANYTHING", "Cormorant Garamond, Georgia, serif", 1.0, "#ffffff")
+
+# index.html 홈 히어로 영역 치환 패턴 (한 번의 스캔으로 모든 대상 위치를 찾음)
+_RE_HOME_HERO_PARTS = re.compile(
+    r'(?P<style><style id="homeEditorDynamicStyle">[\s\S]*?</style>\s*)'
+    r'|(?P<head></head>)'
+    r'|(?P<img><img[^>]*class="split-hero-img"[^>]*>)'
+    r'|(?P<title>(?P<title_open><h1 class="split-hero-title"[^>]*>\s*)<a[^>]*class="split-hero-title-link"[^>]*>[\s\S]*?</a>(?P<title_close>\s*</h1>))'
+    r'|(?P<h1><h1 class="split-hero-title"[^>]*>[\s\S]*?</h1>)'
+    r'|(?P<slogans><div class="split-hero-slogans"[^>]*>[\s\S]*?</div>)'
+    r'|(?P<slogan_p><p class="split-hero-slogan"[^>]*>[\s\S]*?</p>)',
+    re.DOTALL,
+)
+
+
+# index.html 에 삽입하는 홈 편집기 동적 스타일 (str.format_map 템플릿)
+_HOME_STYLE_TEMPLATE = (
+    '<style id="homeEditorDynamicStyle">'
+    ".split-header{{background:{bg}!important;min-height:{desktop[header_min_height_vh]}vh!important;}}"
+    ".split-hero-image{{justify-content:{desktop[hero_image_position]}!important;}}"
+    ".split-hero-img{{max-width:{desktop[hero_image_size]}%!important;"
+    "max-height:{desktop[hero_image_max_height_vh]}vh!important;opacity:{opacity:.2f}!important;}}"
+    ".split-hero-text{{margin-top:{desktop[hero_text_margin_top]}px!important;"
+    "gap:{desktop[hero_text_gap]}px!important;"
+    "align-items:{desktop_align}!important;"
+    "text-align:{desktop[text_align]}!important;}}"
+    ".split-hero-title-link{{color:{fg}!important;font-size:{desktop[title_size_rem]:.2f}rem!important;{title_display}}}"
+    ".split-hero-slogans{{display:flex;flex-direction:column;align-items:inherit;gap:{desktop_gap}px;margin:0;{slogan_display}}}"
+    ".split-hero-slogan-item{{margin:0;line-height:1.25;text-transform:uppercase;}}"
+    ".split-hero-slogan{{display:none!important;}}"
+    "@media (max-width: 768px){{"
+    ".split-header{{min-height:{mobile[header_min_height_vh]}vh!important;}}"
+    ".split-hero-image{{justify-content:{mobile[hero_image_position]}!important;}}"
+    ".split-hero-img{{max-width:{mobile[hero_image_size]}%!important;"
+    "max-height:{mobile[hero_image_max_height_vh]}vh!important;}}"
+    ".split-hero-text{{margin-top:{mobile[hero_text_margin_top]}px!important;"
+    "gap:{mobile[hero_text_gap]}px!important;"
+    "align-items:{mobile_align}!important;"
+    "text-align:{mobile[text_align]}!important;}}"
+    ".split-hero-title-link{{font-size:{mobile[title_size_rem]:.2f}rem!important;}}"
+    ".split-hero-slogans{{gap:{mobile_gap}px;}}"
+    "}}</style>"
+)
+
+
+def _splice_home_hero(html_text, style, img_tag, link_tag, slogans_html):
+    """index.html 의 홈 히어로 영역을 한 번의 스캔으로 교체한 문자열을 돌려준다."""
+    pieces = []
+    first = {}
+    pos = 0
+    for m in _RE_HOME_HERO_PARTS.finditer(html_text):
+        kind = m.lastgroup
+        pieces.append(html_text[pos:m.start()])
+        pos = m.end()
+        if kind == "style":
+            continue
+        seen = kind in first or (kind == "h1" and "title" in first)
+        if kind == "head" and not seen:
+            pieces.append(f"{style}\n")
+        elif kind == "img" and not seen:
+            pieces.append(img_tag)
+            first[kind] = len(pieces) - 1
+            continue
+        elif kind == "title" and not seen:
+            pieces.append(m.group("title_open") + link_tag + m.group("title_close"))
+            first[kind] = len(pieces) - 1
+            continue
+        if not seen:
+            first[kind] = len(pieces)
+        pieces.append(m.group())
+    pieces.append(html_text[pos:])
+
+    if "slogans" in first:
+        pieces[first["slogans"]] = slogans_html
+    elif "slogan_p" in first:
+        pieces[first["slogan_p"]] = slogans_html
+    else:
+        blocks = [first[k] for k in ("title", "h1") if k in first]
+        if blocks:
+            pieces[min(blocks)] += f"\n        {slogans_html}"
+    return "".join(pieces)
+
+
+class _ScaleController:
+    """홈 편집기 슬라이더, 옆 숫자 입력칸, 연결된 변수 값을 함께 맞춰 주는 컨트롤러"""
+
+    __slots__ = ("var", "number_var", "frm", "to", "whole", "int_var", "callback", "owner")
+
+    def __init__(self, var, number_var, frm, to, resolution, callback, owner):
+        self.var = var
+        self.number_var = number_var
+        self.frm = float(frm)
+        self.to = float(to)
+        self.whole = float(resolution) >= 1.0
+        self.int_var = isinstance(var, tk.IntVar) and self.whole
+        self.callback = callback
+        self.owner = owner
+
+    def _format(self, value):
+        if self.whole:
+            return str(int(round(value)))
+        return f"{value:.2f}".rstrip("0").rstrip(".")
+
+    def set_value(self, raw_value):
+        try:
+            numeric = float(raw_value)
+        except Exception:
+            try:
+                numeric = float(self.var.get())
+            except Exception:
+                numeric = self.frm
+        numeric = max(self.frm, min(self.to, numeric))
+        if self.int_var:
+            numeric = int(round(numeric))
+        else:
+            numeric = float(round(numeric, 2))
+        self.var.set(numeric)
+        self.number_var.set(self._format(numeric))
+
+    def notify(self, *_args):
+        if callable(self.callback):
+            self.callback()
+        else:
+            self.owner.update_preview()
+
+    def apply(self, *_args):
+        self.set_value(self.number_var.get())
+        self.notify()
+
+    def sync(self, *_args):
+        try:
+            current_value = float(self.var.get())
+        except Exception:
+            current_value = self.frm
+        self.number_var.set(self._format(current_value))
+
+
 def _install_home_editor_final_v3():
     """Add multi-slogan editor, per-slogan style, and color picker UX."""
     prev_load_home_data = HomeManagerDialog.load_home_data
     prev_create_image_tab = HomeManagerDialog.create_image_tab
     prev_load_image = HomeManagerDialog.load_image
     prev_remove_image = HomeManagerDialog.remove_image
-    prev_load_preview_image = HomeManagerDialog.load_preview_image
 
     font_options = {
         "Inter": "Inter, sans-serif",
@@ -9741,17 +10669,28 @@ def _install_home_editor_final_v3():
         "Verdana": "Verdana, sans-serif",
     }
 
-    def _safe_css_font(value, fallback):
-        text = str(value or "").replace("\n", " ").replace("\r", " ")
-        text = re.sub(r"[{};]", "", text).strip()
+    # 아래 파서들은 미리보기/저장 때마다 불리는 순수 문자열 함수라 입력의 str() 기준으로 캐시
+    # (JSON 원본 값은 해시할 수 없을 수도 있음)
+    @lru_cache(maxsize=128)
+    def _css_font_text(text, fallback):
+        text = re.sub(r"[{};]", "", text.replace("\n", " ").replace("\r", " ")).strip()
         return text or fallback
 
-    def _hex(value, fallback):
-        text = str(value or "").strip()
-        if text.startswith("#") and len(text) in {4, 7} and all(c in "0123456789abcdefABCDEF" for c in text[1:]):
-            return text.lower()
+    def _safe_css_font(value, fallback):
+        return _css_font_text(str(value or ""), fallback)
+
+    @lru_cache(maxsize=128)
+    def _hex_text(text, fallback):
+        text = text.strip().lower()
+        digits = text[1:]
+        if text[:1] == "#" and len(text) in (4, 7) and digits.isascii():
+            if not digits.encode("ascii").translate(None, _HEX_DIGITS):
+                return text
         return fallback
 
+    def _hex(value, fallback):
+        return _hex_text(str(value or ""), fallback)
+
     def _clamp_i(value, lo, hi, default):
         try:
             num = int(float(value))
@@ -9766,42 +10705,69 @@ def _install_home_editor_final_v3():
             num = default
         return max(lo, min(hi, num))
 
+    # (모드 키, Tk 변수 속성명, 범위 제한 함수, 최솟값, 최댓값, 기본값, UI 배율)
+    mode_fields = (
+        ("hero_image_size", "size_var", _clamp_i, 20, 130, 85, 1),
+        ("hero_image_max_height_vh", "height_var", _clamp_i, 20, 95, 50, 1),
+        ("hero_text_margin_top", "text_margin_var", _clamp_i, 0, 180, 50, 1),
+        ("hero_text_gap", "text_gap_var", _clamp_i, 0, 80, 12, 1),
+        ("title_size_rem", "title_size_var", _clamp_f, 0.7, 4.0, 1.5, 10.0),
+        ("header_min_height_vh", "min_height_var", _clamp_i, 45, 120, 100, 1),
+    )
+    mode_choices = (
+        ("hero_image_position", "position_var"),
+        ("text_align", "text_align_var"),
+    )
+
     def _sanitize_slogans(raw_items, fallback_text="DESIGN ANYTHING"):
+        """
+        슬로건 원본 dict 목록을 Slogan 레코드로 정리
+
+        Slogan 인스턴스는 이미 정리된 값으로만 만들어지므로 필드를 다시 검사하지 않고 그대로 사용
+        """
         items = []
         if isinstance(raw_items, list):
             for item in raw_items:
+                if isinstance(item, Slogan):
+                    if item.text:
+                        items.append(item)
+                    continue
                 if not isinstance(item, dict):
                     continue
                 text = str(item.get("text", "")).strip()
                 if not text:
                     continue
                 items.append(
-                    {
-                        "text": text,
-                        "font_family": _safe_css_font(
-                            item.get("font_family"),
-                            "Cormorant Garamond, Georgia, serif",
-                        ),
-                        "size_rem": _clamp_f(item.get("size_rem"), 0.6, 3.0, 1.0),
-                        "color": _hex(item.get("color"), "#ffffff"),
-                    }
+                    Slogan(
+                        text,
+                        _safe_css_font(item.get("font_family"), "Cormorant Garamond, Georgia, serif"),
+                        _clamp_f(item.get("size_rem"), 0.6, 3.0, 1.0),
+                        _hex(item.get("color"), "#ffffff"),
+                    )
                 )
         if not items:
             text = str(fallback_text or "DESIGN ANYTHING").strip() or "DESIGN ANYTHING"
-            items = [
-                {
-                    "text": text,
-                    "font_family": "Cormorant Garamond, Georgia, serif",
-                    "size_rem": 1.0,
-                    "color": "#ffffff",
-                }
-            ]
+            items = [DEFAULT_SLOGAN._replace(text=text)]
         return items[:12]
 
-    def _tk_font_from_css(css_family):
-        name = str(css_family or "").split(",")[0].strip().strip("'\"")
+    def _slogan_label(text):
+        return text[:28] + "..." if len(text) > 28 else text
+
+    # image_preview 는 항상 RGBA 로 변환되므로 알파 밴드는 8비트 "L" 이고,
+    # point() 가 이 표를 C 에서 적용하므로 픽셀 단위 Python/NumPy 처리가 필요 없음
+    @lru_cache(maxsize=None)
+    def _alpha_lut(percent):
+        alpha = percent / 100.0
+        return tuple(int(i * alpha) for i in range(256))
+
+    @lru_cache(maxsize=128)
+    def _tk_font_name(css_family):
+        name = css_family.split(",")[0].strip().strip("'\"")
         return name or "Segoe UI"
 
+    def _tk_font_from_css(css_family):
+        return _tk_font_name(str(css_family or ""))
+
     def load_home_data(self):
         data = prev_load_home_data(self)
         if not isinstance(data, dict):
@@ -9810,7 +10776,7 @@ def _install_home_editor_final_v3():
 
         legacy_slogan = str(merged.get("hero_slogan", "")).strip()
         merged["hero_slogans"] = _sanitize_slogans(merged.get("hero_slogans"), legacy_slogan or "DESIGN ANYTHING")
-        merged["hero_slogan"] = merged["hero_slogans"][0]["text"]
+        merged["hero_slogan"] = merged["hero_slogans"][0].text
         merged["header_bg_color"] = _hex(merged.get("header_bg_color"), "#000000")
         merged["text_color"] = _hex(merged.get("text_color"), "#ffffff")
         merged["hero_image_opacity"] = _clamp_i(merged.get("hero_image_opacity"), 10, 100, 100)
@@ -9822,37 +10788,64 @@ def _install_home_editor_final_v3():
         if not color:
             return
         target_var.set(color.lower())
-        if swatch_widget is not None and swatch_widget.winfo_exists():
-            swatch_widget.configure(bg=target_var.get())
+        self._apply_swatches((swatch_widget, target_var.get()))
         if callable(callback):
             callback()
         else:
             self.update_preview()
 
+    def _apply_swatches(self, *pairs):
+        for widget, color in pairs:
+            if widget is None:
+                continue
+            try:
+                if widget.cget("bg") != color:
+                    widget.configure(bg=color)
+            except tk.TclError:
+                pass
+
+    def _rebuild_slogan_labels(self):
+        self._slogan_labels = [_slogan_label(item.text) for item in self.slogan_items]
+
     def _refresh_slogan_list(self):
         if not hasattr(self, "slogan_listbox"):
             return
         self.slogan_listbox.delete(0, tk.END)
-        for idx, item in enumerate(self.slogan_items, start=1):
-            label = item.get("text", "").strip() or f"SLOGAN {idx}"
-            if len(label) > 28:
-                label = label[:28] + "..."
-            self.slogan_listbox.insert(tk.END, f"{idx}. {label}")
+        for idx, label in enumerate(self._slogan_labels, start=1):
+            self.slogan_listbox.insert(tk.END, f"{idx}. {label or f'SLOGAN {idx}'}")
+
+    def _select_slogan(self, idx):
+        lb = self.slogan_listbox
+        current = lb.curselection()
+        if len(current) == 1 and int(current[0]) == idx:
+            return
+        lb.selection_clear(0, tk.END)
+        lb.selection_set(idx)
+        lb.activate(idx)
+        lb.see(idx)
+
+    @contextmanager
+    def _suspend_slogan_sync(self):
+        self._slogan_syncing = True
+        try:
+            yield
+        finally:
+            self._slogan_syncing = False
 
     def _load_slogan_editor(self, idx):
         if not (0 <= idx < len(self.slogan_items)):
             return
         item = self.slogan_items[idx]
-        self._slogan_syncing = True
-        self.slogan_text_var.set(item.get("text", ""))
-        css_font = item.get("font_family", "Cormorant Garamond, Georgia, serif")
-        font_key = next((k for k, v in self.font_options.items() if v == css_font), "Cormorant")
-        self.slogan_font_key_var.set(font_key)
-        self.slogan_size_var.set(float(item.get("size_rem", 1.0)) * 10.0)
-        self.slogan_color_var.set(_hex(item.get("color"), "#ffffff"))
-        if hasattr(self, "slogan_color_swatch") and self.slogan_color_swatch.winfo_exists():
-            self.slogan_color_swatch.configure(bg=self.slogan_color_var.get())
-        self._slogan_syncing = False
+        font_key = next((k for k, v in self.font_options.items() if v == item.font_family), "Cormorant")
+        color = item.color
+        text_name, font_name, size_name, color_name = self._slogan_var_names
+        call = self.tk.call
+        with self._suspend_slogan_sync():
+            call("set", text_name, item.text)
+            call("set", font_name, font_key)
+            call("set", size_name, item.size_rem * 10.0)
+            call("set", color_name, color)
+            self._apply_swatches((getattr(self, "slogan_color_swatch", None), color))
 
     def _on_slogan_select(self, _event=None):
         if not hasattr(self, "slogan_listbox"):
@@ -9875,32 +10868,21 @@ def _install_home_editor_final_v3():
         size_rem = _clamp_f(float(self.slogan_size_var.get()) / 10.0, 0.6, 3.0, 1.0)
         color = _hex(self.slogan_color_var.get(), "#ffffff")
 
-        self.slogan_items[idx] = {
-            "text": text,
-            "font_family": font_css,
-            "size_rem": size_rem,
-            "color": color,
-        }
-        self._refresh_slogan_list()
-        self.slogan_listbox.selection_clear(0, tk.END)
-        self.slogan_listbox.selection_set(idx)
-        self.slogan_listbox.activate(idx)
+        self.slogan_items[idx] = Slogan(text, font_css, size_rem, color)
+        label = _slogan_label(text)
+        if self._slogan_labels[idx] != label:
+            self._slogan_labels[idx] = label
+            self._refresh_slogan_list()
+        self._select_slogan(idx)
         self.update_preview()
 
     def _add_slogan_item(self):
-        self.slogan_items.append(
-            {
-                "text": f"NEW SLOGAN {len(self.slogan_items) + 1}",
-                "font_family": "Cormorant Garamond, Georgia, serif",
-                "size_rem": 1.0,
-                "color": "#ffffff",
-            }
-        )
+        item = DEFAULT_SLOGAN._replace(text=f"NEW SLOGAN {len(self.slogan_items) + 1}")
+        self.slogan_items.append(item)
+        self._slogan_labels.append(_slogan_label(item.text))
         self._refresh_slogan_list()
         new_idx = len(self.slogan_items) - 1
-        self.slogan_listbox.selection_clear(0, tk.END)
-        self.slogan_listbox.selection_set(new_idx)
-        self.slogan_listbox.activate(new_idx)
+        self._select_slogan(new_idx)
         self.current_slogan_index = new_idx
         self._load_slogan_editor(new_idx)
         self.update_preview()
@@ -9910,20 +10892,15 @@ def _install_home_editor_final_v3():
         if not (0 <= idx < len(self.slogan_items)):
             return
         if len(self.slogan_items) == 1:
-            self.slogan_items[0] = {
-                "text": "DESIGN ANYTHING",
-                "font_family": "Cormorant Garamond, Georgia, serif",
-                "size_rem": 1.0,
-                "color": "#ffffff",
-            }
+            self.slogan_items[0] = DEFAULT_SLOGAN
+            self._slogan_labels[0] = _slogan_label(DEFAULT_SLOGAN.text)
             self.current_slogan_index = 0
         else:
             self.slogan_items.pop(idx)
+            self._slogan_labels.pop(idx)
             self.current_slogan_index = max(0, idx - 1)
         self._refresh_slogan_list()
-        self.slogan_listbox.selection_clear(0, tk.END)
-        self.slogan_listbox.selection_set(self.current_slogan_index)
-        self.slogan_listbox.activate(self.current_slogan_index)
+        self._select_slogan(self.current_slogan_index)
         self._load_slogan_editor(self.current_slogan_index)
         self.update_preview()
 
@@ -9955,54 +10932,9 @@ def _install_home_editor_final_v3():
         row.pack(fill=tk.X, pady=(2, 6))
 
         number_var = tk.StringVar()
-
-        def _set_var_value(raw_value):
-            try:
-                numeric = float(raw_value)
-            except Exception:
-                try:
-                    numeric = float(var.get())
-                except Exception:
-                    numeric = float(frm)
-            numeric = max(float(frm), min(float(to), numeric))
-            if isinstance(var, tk.IntVar) and float(resolution) >= 1.0:
-                numeric = int(round(numeric))
-                var.set(int(numeric))
-                number_var.set(str(int(numeric)))
-            else:
-                numeric = round(numeric, 2)
-                var.set(float(numeric))
-                if float(resolution) >= 1.0:
-                    number_var.set(str(int(round(numeric))))
-                else:
-                    number_var.set(f"{numeric:.2f}".rstrip("0").rstrip("."))
-
-        def _notify(*_args):
-            if callable(callback):
-                callback()
-            else:
-                self.update_preview()
-
-        def _apply_from_spinbox(*_args):
-            _set_var_value(number_var.get())
-            _notify()
-
-        def _sync_from_var(*_args):
-            try:
-                current_value = var.get()
-            except Exception:
-                current_value = frm
-            if isinstance(var, tk.IntVar) and float(resolution) >= 1.0:
-                number_var.set(str(int(round(float(current_value)))))
-            else:
-                value = float(current_value)
-                if float(resolution) >= 1.0:
-                    number_var.set(str(int(round(value))))
-                else:
-                    number_var.set(f"{value:.2f}".rstrip("0").rstrip("."))
-
-        _sync_from_var()
-        var.trace_add("write", lambda *_args: _sync_from_var())
+        ctrl = _ScaleController(var, number_var, frm, to, resolution, callback, self)
+        ctrl.sync()
+        var.trace_add("write", ctrl.sync)
 
         scale = tk.Scale(
             row,
@@ -10014,9 +10946,11 @@ def _install_home_editor_final_v3():
             length=250,
             bg=ModernStyle.BG_WHITE,
             highlightthickness=0,
-            command=lambda _v: _notify(),
+            command=ctrl.notify,
         )
         scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        scale.controller = ctrl
+        scale.bind("<ButtonRelease-1>", self._flush_preview, add="+")
 
         spin = ttk.Spinbox(
             row,
@@ -10026,15 +10960,19 @@ def _install_home_editor_final_v3():
             textvariable=number_var,
             width=7,
             justify="right",
-            command=_apply_from_spinbox,
+            command=ctrl.apply,
         )
         spin.pack(side=tk.LEFT, padx=(10, 0))
-        spin.bind("<Return>", _apply_from_spinbox)
-        spin.bind("<FocusOut>", _apply_from_spinbox)
+        spin.bind("<Return>", ctrl.apply)
+        spin.bind("<FocusOut>", ctrl.apply)
 
         return scale
 
     def create_text_tab(self, parent):
+        f9 = ModernStyle.get_font(9)
+        f10 = ModernStyle.get_font(10)
+        f10b = ModernStyle.get_font(10, "bold")
+
         wrap = tk.Frame(parent, bg=ModernStyle.BG_WHITE)
         wrap.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
 
@@ -10044,10 +10982,10 @@ def _install_home_editor_final_v3():
         ]:
             row = tk.Frame(wrap, bg=ModernStyle.BG_WHITE)
             row.pack(fill=tk.X, pady=4)
-            tk.Label(row, text=label, width=14, anchor="w", font=ModernStyle.get_font(10), bg=ModernStyle.BG_WHITE).pack(
+            tk.Label(row, text=label, width=14, anchor="w", font=f10, bg=ModernStyle.BG_WHITE).pack(
                 side=tk.LEFT
             )
-            ent = tk.Entry(row, textvariable=var, font=ModernStyle.get_font(10), relief="solid", borderwidth=1)
+            ent = tk.Entry(row, textvariable=var, font=f10, relief="solid", borderwidth=1)
             ent.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=4)
             self._bind_entry(ent)
 
@@ -10079,7 +11017,7 @@ def _install_home_editor_final_v3():
 
         align = tk.Frame(wrap, bg=ModernStyle.BG_WHITE)
         align.pack(fill=tk.X, pady=(8, 0))
-        tk.Label(align, text="\ud14d\uc2a4\ud2b8 \uc815\ub82c", font=ModernStyle.get_font(10), bg=ModernStyle.BG_WHITE).pack(
+        tk.Label(align, text="\ud14d\uc2a4\ud2b8 \uc815\ub82c", font=f10, bg=ModernStyle.BG_WHITE).pack(
             side=tk.LEFT, padx=(0, 12)
         )
         for text, value in [("\uc67c\ucabd", "left"), ("\uac00\uc6b4\ub370", "center"), ("\uc624\ub978\ucabd", "right")]:
@@ -10100,7 +11038,7 @@ def _install_home_editor_final_v3():
         tk.Label(
             section,
             text="\uc11c\ube0c\ubb38\uad6c \ubaa9\ub85d (\uac01 \ubb38\uad6c\ubcc4 \ud3f0\ud2b8/\ud06c\uae30/\uc0c9\uc0c1)",
-            font=ModernStyle.get_font(10, "bold"),
+            font=f10b,
             bg=ModernStyle.BG_WHITE,
         ).pack(anchor="w", padx=10, pady=(8, 6))
 
@@ -10113,7 +11051,7 @@ def _install_home_editor_final_v3():
             left,
             height=8,
             exportselection=False,
-            font=ModernStyle.get_font(9),
+            font=f9,
             relief="solid",
             borderwidth=1,
             width=28,
@@ -10126,7 +11064,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             left_btns,
             text="+ \ubb38\uad6c \ucd94\uac00",
-            font=ModernStyle.get_font(9),
+            font=f9,
             bg=ModernStyle.BG_LIGHT,
             relief="solid",
             borderwidth=1,
@@ -10137,7 +11075,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             left_btns,
             text="\uc120\ud0dd \uc0ad\uc81c",
-            font=ModernStyle.get_font(9),
+            font=f9,
             bg=ModernStyle.BG_WHITE,
             relief="solid",
             borderwidth=1,
@@ -10151,17 +11089,17 @@ def _install_home_editor_final_v3():
 
         row = tk.Frame(right, bg=ModernStyle.BG_WHITE)
         row.pack(fill=tk.X, pady=4)
-        tk.Label(row, text="\ubb38\uad6c", width=10, anchor="w", font=ModernStyle.get_font(10), bg=ModernStyle.BG_WHITE).pack(
+        tk.Label(row, text="\ubb38\uad6c", width=10, anchor="w", font=f10, bg=ModernStyle.BG_WHITE).pack(
             side=tk.LEFT
         )
-        ent = tk.Entry(row, textvariable=self.slogan_text_var, font=ModernStyle.get_font(10), relief="solid", borderwidth=1)
+        ent = tk.Entry(row, textvariable=self.slogan_text_var, font=f10, relief="solid", borderwidth=1)
         ent.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=4)
         ent.bind("<KeyRelease>", self._apply_slogan_editor)
         ent.bind("<FocusOut>", self._apply_slogan_editor)
 
         row = tk.Frame(right, bg=ModernStyle.BG_WHITE)
         row.pack(fill=tk.X, pady=4)
-        tk.Label(row, text="\ud3f0\ud2b8", width=10, anchor="w", font=ModernStyle.get_font(10), bg=ModernStyle.BG_WHITE).pack(
+        tk.Label(row, text="\ud3f0\ud2b8", width=10, anchor="w", font=f10, bg=ModernStyle.BG_WHITE).pack(
             side=tk.LEFT
         )
         combo = ttk.Combobox(
@@ -10190,7 +11128,7 @@ def _install_home_editor_final_v3():
             text="\ubb38\uad6c \uc0c9\uc0c1",
             width=10,
             anchor="w",
-            font=ModernStyle.get_font(10),
+            font=f10,
             bg=ModernStyle.BG_WHITE,
         ).pack(side=tk.LEFT)
         self.slogan_color_swatch = tk.Label(color_row, bg="#ffffff", width=3, relief="solid", borderwidth=1)
@@ -10198,7 +11136,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             color_row,
             text="\uc0c9\uc0c1 \uc120\ud0dd",
-            font=ModernStyle.get_font(9),
+            font=f9,
             bg=ModernStyle.BG_LIGHT,
             relief="solid",
             borderwidth=1,
@@ -10220,6 +11158,16 @@ def _install_home_editor_final_v3():
         self._active_mode = "desktop"
         self._slogan_syncing = False
         self.current_slogan_index = 0
+        self._last_preview_fp = None
+        self._last_preview_image = None
+        self._preview_after_id = None
+        self._img_cache = {}
+        self._img_cache_source = None
+        self._last_payload_hash = None
+        self._save_executor = None
+        self._pending_write = None
+        self._index_cache = None
+        self._preview_items = None
 
         self.hero_title_var = tk.StringVar()
         self.hero_link_var = tk.StringVar()
@@ -10231,10 +11179,17 @@ def _install_home_editor_final_v3():
         self.text_gap_var = tk.IntVar(value=12)
 
         self.slogan_items = []
+        self._slogan_labels = []
         self.slogan_text_var = tk.StringVar()
         self.slogan_font_key_var = tk.StringVar(value="Cormorant")
         self.slogan_size_var = tk.DoubleVar(value=10)
         self.slogan_color_var = tk.StringVar(value="#ffffff")
+        self._slogan_var_names = (
+            str(self.slogan_text_var),
+            str(self.slogan_font_key_var),
+            str(self.slogan_size_var),
+            str(self.slogan_color_var),
+        )
 
         self.size_var = tk.IntVar(value=85)
         self.height_var = tk.IntVar(value=50)
@@ -10244,22 +11199,27 @@ def _install_home_editor_final_v3():
         self.text_align_var = tk.StringVar(value="center")
         self.min_height_var = tk.IntVar(value=100)
 
+        f9 = ModernStyle.get_font(9)
+        f10 = ModernStyle.get_font(10)
+        f10b = ModernStyle.get_font(10, "bold")
+        f16b = ModernStyle.get_font(16, "bold")
+
         main = tk.Frame(self, bg=ModernStyle.BG_WHITE)
         main.pack(fill=tk.BOTH, expand=True, padx=24, pady=16)
-        tk.Label(main, text="\ud648\ud654\uba74 \ud3b8\uc9d1", font=ModernStyle.get_font(16, "bold"), bg=ModernStyle.BG_WHITE).pack(
+        tk.Label(main, text="\ud648\ud654\uba74 \ud3b8\uc9d1", font=f16b, bg=ModernStyle.BG_WHITE).pack(
             anchor="w"
         )
         tk.Label(
             main,
             text="\uc2e4\uc81c \ud648\ud654\uba74 \uae30\uc900\uc73c\ub85c PC/\ubaa8\ubc14\uc77c\uc744 \ubd84\ub9ac \uc218\uc815\ud558\uace0 \uc2e4\uc2dc\uac04 \ubbf8\ub9ac\ubcf4\uae30\uc5d0 \ubc18\uc601\ud569\ub2c8\ub2e4.",
-            font=ModernStyle.get_font(10),
+            font=f10,
             bg=ModernStyle.BG_WHITE,
             fg=ModernStyle.TEXT_MUTED,
         ).pack(anchor="w", pady=(2, 10))
 
         mode_row = tk.Frame(main, bg=ModernStyle.BG_WHITE)
         mode_row.pack(fill=tk.X, pady=(0, 10))
-        tk.Label(mode_row, text="\ud3b8\uc9d1 \ub300\uc0c1", font=ModernStyle.get_font(10, "bold"), bg=ModernStyle.BG_WHITE).pack(
+        tk.Label(mode_row, text="\ud3b8\uc9d1 \ub300\uc0c1", font=f10b, bg=ModernStyle.BG_WHITE).pack(
             side=tk.LEFT, padx=(0, 10)
         )
         tk.Radiobutton(
@@ -10281,7 +11241,7 @@ def _install_home_editor_final_v3():
         tk.Label(
             mode_row,
             textvariable=self.mode_hint_var,
-            font=ModernStyle.get_font(9),
+            font=f9,
             bg=ModernStyle.BG_WHITE,
             fg=ModernStyle.TEXT_SUBTLE,
         ).pack(side=tk.LEFT)
@@ -10305,7 +11265,7 @@ def _install_home_editor_final_v3():
         tk.Label(
             preview_panel,
             text="\uc2e4\uc2dc\uac04 \ubbf8\ub9ac\ubcf4\uae30",
-            font=ModernStyle.get_font(10, "bold"),
+            font=f10b,
             bg=ModernStyle.BG_LIGHT,
             fg=ModernStyle.TEXT_MUTED,
         ).pack(pady=10)
@@ -10325,7 +11285,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             btns,
             text="\uae30\ubcf8\uac12 \ubcf5\uc6d0",
-            font=ModernStyle.get_font(10),
+            font=f10,
             bg=ModernStyle.BG_WHITE,
             relief="solid",
             borderwidth=1,
@@ -10336,7 +11296,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             btns,
             text="\ube0c\ub77c\uc6b0\uc800 \ubbf8\ub9ac\ubcf4\uae30",
-            font=ModernStyle.get_font(10),
+            font=f10,
             bg=ModernStyle.BG_LIGHT,
             relief="solid",
             borderwidth=1,
@@ -10347,7 +11307,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             btns,
             text="\ucde8\uc18c",
-            font=ModernStyle.get_font(10),
+            font=f10,
             bg=ModernStyle.BG_WHITE,
             relief="solid",
             borderwidth=1,
@@ -10358,7 +11318,7 @@ def _install_home_editor_final_v3():
         tk.Button(
             btns,
             text="\uc800\uc7a5",
-            font=ModernStyle.get_font(10, "bold"),
+            font=f10b,
             bg=ModernStyle.ACCENT,
             fg=ModernStyle.BG_WHITE,
             relief="flat",
@@ -10373,34 +11333,25 @@ def _install_home_editor_final_v3():
         if mode not in {"desktop", "mobile"}:
             mode = "desktop"
         current = self.mode_data.get(mode, {})
-        self.mode_data[mode] = {
-            **current,
-            "hero_image_size": _clamp_i(self.size_var.get(), 20, 130, 85),
-            "hero_image_max_height_vh": _clamp_i(self.height_var.get(), 20, 95, 50),
-            "hero_image_position": str(self.position_var.get()).strip().lower(),
-            "hero_text_margin_top": _clamp_i(self.text_margin_var.get(), 0, 180, 50),
-            "hero_text_gap": _clamp_i(self.text_gap_var.get(), 0, 80, 12),
-            "title_size_rem": _clamp_f(float(self.title_size_var.get()) / 10.0, 0.7, 4.0, 1.5),
-            "slogan_size_rem": _clamp_f(current.get("slogan_size_rem", 1.0), 0.6, 3.0, 1.0),
-            "text_align": str(self.text_align_var.get()).strip().lower(),
-            "header_min_height_vh": _clamp_i(self.min_height_var.get(), 45, 120, 100),
-        }
-        if self.mode_data[mode]["hero_image_position"] not in {"left", "center", "right"}:
-            self.mode_data[mode]["hero_image_position"] = "center"
-        if self.mode_data[mode]["text_align"] not in {"left", "center", "right"}:
-            self.mode_data[mode]["text_align"] = "center"
+        values = dict(current)
+        for key, attr, clamp, lo, hi, default, scale in mode_fields:
+            raw = getattr(self, attr).get()
+            if scale != 1:
+                raw = float(raw) / scale
+            values[key] = clamp(raw, lo, hi, default)
+        values["slogan_size_rem"] = _clamp_f(current.get("slogan_size_rem", 1.0), 0.6, 3.0, 1.0)
+        for key, attr in mode_choices:
+            choice = str(getattr(self, attr).get()).strip().lower()
+            values[key] = choice if choice in {"left", "center", "right"} else "center"
+        self.mode_data[mode] = values
 
     def _load_mode_values(self, mode_name):
         mode = mode_name if mode_name in {"desktop", "mobile"} else "desktop"
         values = self.mode_data.get(mode, {})
-        self.size_var.set(_clamp_i(values.get("hero_image_size"), 20, 130, 85))
-        self.height_var.set(_clamp_i(values.get("hero_image_max_height_vh"), 20, 95, 50))
-        self.position_var.set(values.get("hero_image_position", "center"))
-        self.text_margin_var.set(_clamp_i(values.get("hero_text_margin_top"), 0, 180, 50))
-        self.text_gap_var.set(_clamp_i(values.get("hero_text_gap"), 0, 80, 12))
-        self.title_size_var.set(_clamp_f(values.get("title_size_rem"), 0.7, 4.0, 1.5) * 10.0)
-        self.text_align_var.set(values.get("text_align", "center"))
-        self.min_height_var.set(_clamp_i(values.get("header_min_height_vh"), 45, 120, 100))
+        for key, attr, clamp, lo, hi, default, scale in mode_fields:
+            getattr(self, attr).set(clamp(values.get(key), lo, hi, default) * scale)
+        for key, attr in mode_choices:
+            getattr(self, attr).set(values.get(key, "center"))
 
     def _switch_mode(self):
         target = self.edit_mode_var.get()
@@ -10438,16 +11389,16 @@ def _install_home_editor_final_v3():
 
         self.slogan_items = _sanitize_slogans(self.home_data.get("hero_slogans"), self.home_data.get("hero_slogan"))
         self.current_slogan_index = 0
+        self._rebuild_slogan_labels()
         self._refresh_slogan_list()
         if self.slogan_items:
-            self.slogan_listbox.selection_set(0)
-            self.slogan_listbox.activate(0)
+            self._select_slogan(0)
             self._load_slogan_editor(0)
 
-        if hasattr(self, "bg_color_swatch") and self.bg_color_swatch.winfo_exists():
-            self.bg_color_swatch.configure(bg=self.bg_color_var.get())
-        if hasattr(self, "text_color_swatch") and self.text_color_swatch.winfo_exists():
-            self.text_color_swatch.configure(bg=self.text_color_var.get())
+        self._apply_swatches(
+            (getattr(self, "bg_color_swatch", None), self.bg_color_var.get()),
+            (getattr(self, "text_color_swatch", None), self.text_color_var.get()),
+        )
 
         hero_image = str(self.home_data.get("hero_image", "")).strip()
         if hero_image and (SCRIPT_DIR / hero_image).exists():
@@ -10471,81 +11422,175 @@ def _install_home_editor_final_v3():
             "schema": "split_home_v2",
             "hero_title": self.hero_title_var.get().strip() or "J-HR",
             "hero_link": self.hero_link_var.get().strip() or "projects.html",
-            "hero_slogans": slogans,
-            "hero_slogan": slogans[0]["text"],
+            "hero_slogans": [item._asdict() for item in slogans],
+            "hero_slogan": slogans[0].text,
             "hero_image": "",
             "header_bg_color": _hex(self.bg_color_var.get(), "#000000"),
             "text_color": _hex(self.text_color_var.get(), "#ffffff"),
             "hero_image_opacity": _clamp_i(self.opacity_var.get(), 10, 100, 100),
             "show_title": bool(self.show_title_var.get()),
             "show_slogan": bool(self.show_slogan_var.get()),
-            "desktop": dict(self.mode_data.get("desktop", {})),
-            "mobile": dict(self.mode_data.get("mobile", {})),
+            # _store_current_mode 는 항상 새 dict 로 바꿔 끼우므로 그대로 공유해도 안전
+            "desktop": self.mode_data.get("desktop") or {},
+            "mobile": self.mode_data.get("mobile") or {},
         }
         if self.image_path and Path(self.image_path).exists():
             payload["hero_image"] = str(Path(self.image_path).relative_to(SCRIPT_DIR)).replace("\\", "/")
 
-        for key, value in payload["desktop"].items():
-            payload[key] = value
-        for key, value in payload["mobile"].items():
-            payload[f"mobile_{key}"] = value
+        payload.update(payload["desktop"])
+        payload.update({f"mobile_{key}": value for key, value in payload["mobile"].items()})
         return payload
 
+    def _preview_fingerprint(self, mode, mode_data, slogans, cw, ch):
+        return (
+            mode,
+            cw,
+            ch,
+            tuple(mode_data.items()),
+            self.hero_title_var.get(),
+            self.bg_color_var.get(),
+            self.text_color_var.get(),
+            bool(self.show_title_var.get()),
+            bool(self.show_slogan_var.get()),
+            self.opacity_var.get(),
+            tuple(slogans),
+        )
+
     def update_preview(self, *_args):
-        if not hasattr(self, "preview_canvas"):
+        pending = getattr(self, "_preview_after_id", None)
+        if pending is not None:
+            self.after_cancel(pending)
+        self._preview_after_id = self.after(40, self._do_update_preview)
+
+    def _flush_preview(self, _event=None):
+        pending = getattr(self, "_preview_after_id", None)
+        if pending is not None:
+            self.after_cancel(pending)
+            self._do_update_preview()
+
+    def load_preview_image(self):
+        if not self.image_path or not Path(self.image_path).exists():
+            self.image_preview = None
+            return
+        bound = (HOME_PREVIEW_MAX_SIZE, HOME_PREVIEW_MAX_SIZE)
+        try:
+            with Image.open(self.image_path) as src:
+                src.draft(src.mode, bound)
+                img = src.convert("RGBA")
+            img.thumbnail(bound, Image.Resampling.LANCZOS)
+            self.image_preview = img
+        except Exception:
+            self.image_preview = None
+
+    def _create_preview_items(self, canvas):
+        canvas.configure(bg=ModernStyle.BG_LIGHT)
+        return {
+            "bezel": canvas.create_rectangle(0, 0, 0, 0, fill="#1b1b1b", outline=""),
+            "bezel_line": canvas.create_rectangle(0, 0, 0, 0, outline="#6f6f6f", width=2),
+            "label": canvas.create_text(0, 0, fill="#8f8f8f", font=("Segoe UI", 9)),
+            "viewport": canvas.create_rectangle(0, 0, 0, 0, outline=""),
+            "hero": canvas.create_image(0, 0),
+            "placeholder": canvas.create_rectangle(0, 0, 0, 0, outline="#757575", dash=(4, 4)),
+            "placeholder_text": canvas.create_text(0, 0, text="HERO IMAGE", fill="#999999", font=("Segoe UI", 9)),
+            "title": canvas.create_text(0, 0),
+            "slogans": [],
+        }
+
+    def _preview_photo(self, max_w, max_h, alpha):
+        if self._img_cache_source is not self.image_preview:
+            self._img_cache.clear()
+            self._img_cache_source = self.image_preview
+        percent = int(round(alpha * 100))
+        key = (max_w, max_h)
+        entry = self._img_cache.get(key)
+        if entry is not None and entry[1] == percent:
+            return entry[2]
+
+        if entry is None:
+            thumb = self.image_preview.copy()
+            thumb.thumbnail((max_w, max_h), Image.Resampling.BICUBIC)
+        else:
+            thumb = entry[0]
+        img = thumb.copy()
+        img.putalpha(thumb.getchannel("A").point(_alpha_lut(percent)))
+        if entry is not None:
+            # 크기는 같고 투명도만 바뀌었으면 기존 PhotoImage 에 그대로 덮어씀
+            entry[2].paste(img)
+            entry[1] = percent
+            return entry[2]
+
+        photo = ImageTk.PhotoImage(img)
+        if len(self._img_cache) >= 8:
+            self._img_cache.pop(next(iter(self._img_cache)))
+        self._img_cache[key] = [thumb, percent, photo]
+        return photo
+
+    def _do_update_preview(self):
+        self._preview_after_id = None
+        if not hasattr(self, "preview_canvas") or not self.winfo_exists():
             return
 
         self._store_current_mode()
         mode = self.edit_mode_var.get() if self.edit_mode_var.get() in {"desktop", "mobile"} else "desktop"
-        mode_data = dict(self.mode_data.get(mode, {}))
+        mode_data = self.mode_data.get(mode) or {}
 
-        slogans = [dict(item) for item in self.slogan_items]
+        slogans = list(self.slogan_items)
         idx = getattr(self, "current_slogan_index", -1)
         if not getattr(self, "_slogan_syncing", False) and 0 <= idx < len(slogans):
-            slogans[idx] = {
-                "text": self.slogan_text_var.get().strip() or f"SLOGAN {idx + 1}",
-                "font_family": self.font_options.get(
-                    self.slogan_font_key_var.get(), "Cormorant Garamond, Georgia, serif"
-                ),
-                "size_rem": _clamp_f(float(self.slogan_size_var.get()) / 10.0, 0.6, 3.0, 1.0),
-                "color": _hex(self.slogan_color_var.get(), "#ffffff"),
-            }
+            slogans[idx] = Slogan(
+                self.slogan_text_var.get().strip() or f"SLOGAN {idx + 1}",
+                self.font_options.get(self.slogan_font_key_var.get(), "Cormorant Garamond, Georgia, serif"),
+                _clamp_f(float(self.slogan_size_var.get()) / 10.0, 0.6, 3.0, 1.0),
+                _hex(self.slogan_color_var.get(), "#ffffff"),
+            )
         slogans = _sanitize_slogans(slogans, "DESIGN ANYTHING")
 
         canvas = self.preview_canvas
         cw = max(int(canvas.winfo_width()), 540)
         ch = max(int(canvas.winfo_height()), 410)
-        canvas.delete("all")
-        canvas.configure(bg=ModernStyle.BG_LIGHT)
+        fingerprint = self._preview_fingerprint(mode, mode_data, slogans, cw, ch)
+        if fingerprint == self._last_preview_fp and self.image_preview is self._last_preview_image:
+            return
+        self._last_preview_fp = fingerprint
+        self._last_preview_image = self.image_preview
+        items = self._preview_items
+        if items is None:
+            items = self._preview_items = self._create_preview_items(canvas)
+
+        def place(key, coords, **options):
+            canvas.coords(items[key], *coords)
+            canvas.itemconfigure(items[key], state=tk.NORMAL, **options)
+
+        def hide(*keys):
+            for key in keys:
+                canvas.itemconfigure(items[key], state=tk.HIDDEN)
 
         if mode == "mobile":
             vw = min(300, cw - 90)
             vh = min(ch - 50, int(vw * 2.0))
             vx = (cw - vw) // 2
             vy = (ch - vh) // 2 + 8
-            canvas.create_rectangle(vx - 14, vy - 14, vx + vw + 14, vy + vh + 14, fill="#1b1b1b", outline="")
-            canvas.create_rectangle(vx - 8, vy - 8, vx + vw + 8, vy + vh + 8, outline="#6f6f6f", width=2)
-            canvas.create_text(cw // 2, 14, text="\ubaa8\ubc14\uc77c \ubbf8\ub9ac\ubcf4\uae30", fill="#8f8f8f", font=("Segoe UI", 9))
+            place("bezel", (vx - 14, vy - 14, vx + vw + 14, vy + vh + 14))
+            place("bezel_line", (vx - 8, vy - 8, vx + vw + 8, vy + vh + 8))
+            place("label", (cw // 2, 14), text="\ubaa8\ubc14\uc77c \ubbf8\ub9ac\ubcf4\uae30")
         else:
             vx, vy = 14, 30
             vw, vh = cw - 28, ch - 44
-            canvas.create_text(cw // 2, 14, text="PC \ubbf8\ub9ac\ubcf4\uae30", fill="#8f8f8f", font=("Segoe UI", 9))
+            hide("bezel", "bezel_line")
+            place("label", (cw // 2, 14), text="PC \ubbf8\ub9ac\ubcf4\uae30")
 
         bg = _hex(self.bg_color_var.get(), "#000000")
         title_color = _hex(self.text_color_var.get(), "#ffffff")
-        canvas.create_rectangle(vx, vy, vx + vw, vy + vh, fill=bg, outline="")
+        place("viewport", (vx, vy, vx + vw, vy + vh), fill=bg)
 
         top_pad = 24 if mode == "mobile" else 30
         max_w = max(40, int(vw * _clamp_i(mode_data.get("hero_image_size"), 20, 130, 85) / 100.0))
         max_h = max(40, int(vh * _clamp_i(mode_data.get("hero_image_max_height_vh"), 20, 95, 50) / 100.0))
         img_bottom = vy + int(vh * 0.30)
         if self.image_preview is not None:
-            img = self.image_preview.copy()
-            img.thumbnail((max_w, max_h), Image.Resampling.LANCZOS)
             alpha = max(0.1, min(1.0, _clamp_i(self.opacity_var.get(), 10, 100, 100) / 100.0))
-            img.putalpha(img.split()[-1].point(lambda p: int(p * alpha)))
-            self.preview_scaled_image = ImageTk.PhotoImage(img)
-            iw, ih = img.size
+            self.preview_scaled_image = self._preview_photo(max_w, max_h, alpha)
+            iw, ih = self.preview_scaled_image.width(), self.preview_scaled_image.height()
             pos = str(mode_data.get("hero_image_position", "center")).lower()
             if pos == "left":
                 ix = vx + 18 + iw // 2
@@ -10555,15 +11600,17 @@ def _install_home_editor_final_v3():
                 ix = vx + vw // 2
             iy = vy + top_pad + ih // 2
             img_bottom = iy + ih // 2
-            canvas.create_image(ix, iy, image=self.preview_scaled_image)
+            place("hero", (ix, iy), image=self.preview_scaled_image)
+            hide("placeholder", "placeholder_text")
         else:
             pw = min(max_w, int(vw * 0.56))
             ph = min(max_h, int(vh * 0.24))
             px = vx + (vw - pw) // 2
             py = vy + top_pad
             img_bottom = py + ph
-            canvas.create_rectangle(px, py, px + pw, py + ph, outline="#757575", dash=(4, 4))
-            canvas.create_text(px + pw // 2, py + ph // 2, text="HERO IMAGE", fill="#999999", font=("Segoe UI", 9))
+            hide("hero")
+            place("placeholder", (px, py, px + pw, py + ph))
+            place("placeholder_text", (px + pw // 2, py + ph // 2))
 
         align = str(mode_data.get("text_align", "center")).lower()
         if align == "left":
@@ -10584,49 +11631,98 @@ def _install_home_editor_final_v3():
         y = int(img_bottom + _clamp_i(mode_data.get("hero_text_margin_top"), 0, 180, 50) * preview_scale)
 
         if self.show_title_var.get():
-            canvas.create_text(
-                tx,
-                y,
+            place(
+                "title",
+                (tx, y),
                 text=self.hero_title_var.get().strip() or "J-HR",
                 anchor=anchor,
                 fill=title_color,
                 font=(title_family, title_size, "bold"),
             )
             y += title_size + gap
-
-        if self.show_slogan_var.get():
-            for item in slogans:
-                text = item.get("text", "").strip()
-                if not text:
-                    continue
-                size_px = max(9, int(_clamp_f(item.get("size_rem"), 0.6, 3.0, 1.0) * 16 * preview_scale))
-                color = _hex(item.get("color"), title_color)
-                family = _tk_font_from_css(item.get("font_family"))
-                canvas.create_text(tx, y, text=text, anchor=anchor, fill=color, font=(family, size_px))
-                y += size_px + slogan_gap
+        else:
+            hide("title")
+
+        visible = slogans if self.show_slogan_var.get() else []
+        slogan_ids = items["slogans"]
+        while len(slogan_ids) < len(visible):
+            slogan_ids.append(canvas.create_text(0, 0))
+        while len(slogan_ids) > len(visible):
+            canvas.delete(slogan_ids.pop())
+        for item_id, item in zip(slogan_ids, visible):
+            size_px = max(9, int(item.size_rem * 16 * preview_scale))
+            family = _tk_font_from_css(item.font_family)
+            canvas.coords(item_id, tx, y)
+            canvas.itemconfigure(item_id, text=item.text, anchor=anchor, fill=item.color, font=(family, size_px))
+            y += size_px + slogan_gap
 
     def reset_defaults(self):
         self.home_data = self.load_home_data()
         self.home_data["hero_slogans"] = _sanitize_slogans([], "DESIGN ANYTHING")
-        self.home_data["hero_slogan"] = self.home_data["hero_slogans"][0]["text"]
+        self.home_data["hero_slogan"] = self.home_data["hero_slogans"][0].text
         self.load_current_values()
 
+    def _write_home_files(self, payload, digest):
+        # 저장 작업 스레드에서 실행 - 파일 I/O 만 하고 Tk 는 호출하지 않음
+        # 파일 stamp 도 비교해 디스크에서 고치거나 되돌린 경우(git checkout 등)에는 다시 씀
+        if (digest, _file_stamp(HOME_DATA_JSON)) != self._last_payload_hash:
+            _write_text_atomic(HOME_DATA_JSON, json.dumps(payload, ensure_ascii=False, indent=2))
+            self._last_payload_hash = (digest, _file_stamp(HOME_DATA_JSON))
+        self.update_index_html(payload)
+
+    def _submit_home_write(self, payload):
+        # 변경 확인은 압축 덤프의 해시로 하고, 들여쓰기된 파일 내용은 바뀌었을 때만 만듦
+        compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.blake2b(compact.encode("utf-8"), digest_size=16).digest()
+        if self._pending_write is not None:
+            self._pending_write.cancel()
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="home-save")
+        self._pending_write = self._save_executor.submit(self._write_home_files, payload, digest)
+        return self._pending_write
+
     def save(self, preview_only=False):
         try:
             payload = self._current_payload()
-            with open(HOME_DATA_JSON, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            self.update_index_html(payload)
+            future = self._submit_home_write(payload)
             self.home_data = payload
-            if not preview_only:
-                messagebox.showinfo("\uc800\uc7a5 \uc644\ub8cc", "\ud648\ud654\uba74 \uc124\uc815\uc774 \uc800\uc7a5\ub418\uc5c8\uc2b5\ub2c8\ub2e4.")
+            if preview_only:
+                return future
+            future.result()
+            messagebox.showinfo("\uc800\uc7a5 \uc644\ub8cc", "\ud648\ud654\uba74 \uc124\uc815\uc774 \uc800\uc7a5\ub418\uc5c8\uc2b5\ub2c8\ub2e4.")
         except Exception as e:
             messagebox.showerror("\uc624\ub958", f"\uc800\uc7a5 \uc2e4\ud328: {e}")
+        return None
 
-    def preview(self):
-        self.save(preview_only=True)
+    def _open_preview_when_written(self, future):
+        if future.cancelled():
+            # 시작 전에 더 새로운 저장으로 대체됐으면 그 저장을 기다림
+            future = self._pending_write
+        if not future.done():
+            self.after(50, self._open_preview_when_written, future)
+            return
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("\uc624\ub958", f"\uc800\uc7a5 \uc2e4\ud328: {error}")
+            return
         webbrowser.open(INDEX_HTML.as_uri())
 
+    def preview(self):
+        future = self.save(preview_only=True)
+        if future is not None:
+            self._open_preview_when_written(future)
+
+    def destroy(self):
+        # 남은 저장이 끝날 때까지 기다린 뒤 저장 작업 스레드를 정리하고, 실패했으면 알림
+        executor = getattr(self, "_save_executor", None)
+        if executor is not None:
+            self._save_executor = None
+            executor.shutdown(wait=True)
+            future = self._pending_write
+            if future is not None and not future.cancelled() and future.exception() is not None:
+                messagebox.showerror("\uc624\ub958", f"\uc800\uc7a5 \uc2e4\ud328: {future.exception()}", parent=self)
+        tk.Toplevel.destroy(self)
+
     def update_index_html(self, data):
         if not INDEX_HTML.exists():
             return
@@ -10652,12 +11748,17 @@ def _install_home_editor_final_v3():
             "text_align": "center",
             "header_min_height_vh": 70,
         }
-        desktop = dict(payload.get("desktop", {})) if isinstance(payload.get("desktop"), dict) else {}
-        mobile = dict(payload.get("mobile", {})) if isinstance(payload.get("mobile"), dict) else {}
-        for key, default in desktop_defaults.items():
-            desktop[key] = desktop.get(key, payload.get(key, default))
-        for key, default in mobile_defaults.items():
-            mobile[key] = mobile.get(key, payload.get(f"mobile_{key}", default))
+        # 키별 우선순위: 모드별 dict > 최상위 평면 키 > 기본값
+        desktop = {
+            **desktop_defaults,
+            **{key: payload[key] for key in desktop_defaults if key in payload},
+            **(payload["desktop"] if isinstance(payload.get("desktop"), dict) else {}),
+        }
+        mobile = {
+            **mobile_defaults,
+            **{key: payload[f"mobile_{key}"] for key in mobile_defaults if f"mobile_{key}" in payload},
+            **(payload["mobile"] if isinstance(payload.get("mobile"), dict) else {}),
+        }
 
         desktop["hero_image_size"] = _clamp_i(desktop.get("hero_image_size"), 20, 130, 85)
         desktop["hero_image_max_height_vh"] = _clamp_i(desktop.get("hero_image_max_height_vh"), 20, 95, 50)
@@ -10703,104 +11804,70 @@ def _install_home_editor_final_v3():
         title_display = "display:none!important;" if not payload.get("show_title", True) else ""
         slogan_display = "display:none!important;" if not payload.get("show_slogan", True) else ""
 
-        desktop_gap = max(4, int(_clamp_i(desktop.get("hero_text_gap"), 0, 80, 12) * 0.55))
-        mobile_gap = max(4, int(_clamp_i(mobile.get("hero_text_gap"), 0, 80, 10) * 0.55))
-
-        style = (
-            '<style id="homeEditorDynamicStyle">'
-            f".split-header{{background:{bg}!important;min-height:{_clamp_i(desktop.get('header_min_height_vh'),45,120,100)}vh!important;}}"
-            f".split-hero-image{{justify-content:{desktop.get('hero_image_position','center')}!important;}}"
-            f".split-hero-img{{max-width:{_clamp_i(desktop.get('hero_image_size'),20,130,85)}%!important;"
-            f"max-height:{_clamp_i(desktop.get('hero_image_max_height_vh'),20,95,50)}vh!important;opacity:{opacity:.2f}!important;}}"
-            f".split-hero-text{{margin-top:{_clamp_i(desktop.get('hero_text_margin_top'),0,180,50)}px!important;"
-            f"gap:{_clamp_i(desktop.get('hero_text_gap'),0,80,12)}px!important;"
-            f"align-items:{align_map.get(desktop.get('text_align','center'),'center')}!important;"
-            f"text-align:{desktop.get('text_align','center')}!important;}}"
-            f".split-hero-title-link{{color:{fg}!important;font-size:{_clamp_f(desktop.get('title_size_rem'),0.7,4.0,1.5):.2f}rem!important;{title_display}}}"
-            f".split-hero-slogans{{display:flex;flex-direction:column;align-items:inherit;gap:{desktop_gap}px;margin:0;{slogan_display}}}"
-            ".split-hero-slogan-item{margin:0;line-height:1.25;text-transform:uppercase;}"
-            ".split-hero-slogan{display:none!important;}"
-            "@media (max-width: 768px){"
-            f".split-header{{min-height:{_clamp_i(mobile.get('header_min_height_vh'),45,120,70)}vh!important;}}"
-            f".split-hero-image{{justify-content:{mobile.get('hero_image_position','center')}!important;}}"
-            f".split-hero-img{{max-width:{_clamp_i(mobile.get('hero_image_size'),20,130,90)}%!important;"
-            f"max-height:{_clamp_i(mobile.get('hero_image_max_height_vh'),20,95,46)}vh!important;}}"
-            f".split-hero-text{{margin-top:{_clamp_i(mobile.get('hero_text_margin_top'),0,180,38)}px!important;"
-            f"gap:{_clamp_i(mobile.get('hero_text_gap'),0,80,10)}px!important;"
-            f"align-items:{align_map.get(mobile.get('text_align','center'),'center')}!important;"
-            f"text-align:{mobile.get('text_align','center')}!important;}}"
-            f".split-hero-title-link{{font-size:{_clamp_f(mobile.get('title_size_rem'),0.7,4.0,1.1):.2f}rem!important;}}"
-            f".split-hero-slogans{{gap:{mobile_gap}px;}}"
-            "}</style>"
+        # desktop/mobile 값은 위에서 범위 제한/검증을 마쳤으므로 템플릿이 그대로 읽음
+        style = _HOME_STYLE_TEMPLATE.format_map(
+            {
+                "bg": bg,
+                "fg": fg,
+                "opacity": opacity,
+                "title_display": title_display,
+                "slogan_display": slogan_display,
+                "desktop": desktop,
+                "mobile": mobile,
+                "desktop_align": align_map[desktop["text_align"]],
+                "mobile_align": align_map[mobile["text_align"]],
+                "desktop_gap": max(4, int(desktop["hero_text_gap"] * 0.55)),
+                "mobile_gap": max(4, int(mobile["hero_text_gap"] * 0.55)),
+            }
         )
 
-        slogan_items_html = []
-        for item in slogans:
-            text = html.escape(item.get("text", ""))
-            family = html.escape(_safe_css_font(item.get("font_family"), "Cormorant Garamond, Georgia, serif"), quote=True)
-            size = _clamp_f(item.get("size_rem"), 0.6, 3.0, 1.0)
-            color = _hex(item.get("color"), fg)
-            slogan_items_html.append(
-                f'<p class="split-hero-slogan-item" style="font-family:{family};font-size:{size:.2f}rem;color:{color};">{text}</p>'
+        font_cache = {family: html.escape(family, quote=True) for family in {item.font_family for item in slogans}}
+        slogans_html = (
+            '<div class="split-hero-slogans">'
+            + "".join(
+                f'<p class="split-hero-slogan-item" style="font-family:{font_cache[item.font_family]};'
+                f'font-size:{item.size_rem:.2f}rem;color:{item.color};">{html.escape(item.text)}</p>'
+                for item in slogans
             )
-        slogans_html = f'<div class="split-hero-slogans">{"".join(slogan_items_html)}</div>'
+            + "</div>"
+        )
 
         image_src = html.escape(payload.get("hero_image", "").strip() or "images/home/main_page_image.png", quote=True)
         title = html.escape(payload.get("hero_title", "J-HR"))
         link = html.escape(payload.get("hero_link", "projects.html"), quote=True)
 
-        with open(INDEX_HTML, "r", encoding="utf-8") as f:
-            html_text = f.read()
-
-        html_text = re.sub(r'<style id="homeEditorDynamicStyle">[\s\S]*?</style>\s*', "", html_text, flags=re.DOTALL)
-        if "</head>" in html_text:
-            html_text = html_text.replace("</head>", f"{style}\n</head>", 1)
+        # index.html 이 디스크에서 바뀌지 않았으면 마지막으로 읽거나 쓴 내용을 재사용
+        stat = INDEX_HTML.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = getattr(self, "_index_cache", None)
+        if cached is not None and cached[0] == stamp:
+            original_html = cached[1]
+        else:
+            with open(INDEX_HTML, "r", encoding="utf-8") as f:
+                original_html = f.read()
+            self._index_cache = (stamp, original_html)
 
-        html_text = re.sub(
-            r'<img[^>]*class="split-hero-img"[^>]*>',
+        html_text = _splice_home_hero(
+            original_html,
+            style,
             f'<img src="{image_src}" alt="Hero" class="split-hero-img" onerror="this.src=\'images/home/main_page_image.png\'; this.onerror=null;">',
-            html_text,
-            count=1,
-        )
-        html_text = re.sub(
-            r'(<h1 class="split-hero-title"[^>]*>\s*)<a[^>]*class="split-hero-title-link"[^>]*>[\s\S]*?</a>(\s*</h1>)',
-            rf'\1<a href="{link}" class="split-hero-title-link">{title}</a>\2',
-            html_text,
-            flags=re.DOTALL,
-            count=1,
-        )
-
-        new_html, replaced = re.subn(
-            r'<div class="split-hero-slogans"[^>]*>[\s\S]*?</div>',
+            f'<a href="{link}" class="split-hero-title-link">{title}</a>',
             slogans_html,
-            html_text,
-            flags=re.DOTALL,
-            count=1,
         )
-        if replaced == 0:
-            new_html, replaced = re.subn(
-                r'<p class="split-hero-slogan"[^>]*>[\s\S]*?</p>',
-                slogans_html,
-                html_text,
-                flags=re.DOTALL,
-                count=1,
-            )
-        if replaced == 0:
-            new_html = re.sub(
-                r'(<h1 class="split-hero-title"[^>]*>[\s\S]*?</h1>)',
-                rf"\1\n        {slogans_html}",
-                html_text,
-                flags=re.DOTALL,
-                count=1,
-            )
-        html_text = new_html
+        if html_text == original_html:
+            return
 
-        with open(INDEX_HTML, "w", encoding="utf-8") as f:
-            f.write(html_text)
+        _write_text_atomic(INDEX_HTML, html_text)
+        stat = INDEX_HTML.stat()
+        self._index_cache = ((stat.st_mtime_ns, stat.st_size), html_text)
 
     HomeManagerDialog.load_home_data = load_home_data
     HomeManagerDialog._pick_color = _pick_color
+    HomeManagerDialog._apply_swatches = _apply_swatches
+    HomeManagerDialog._rebuild_slogan_labels = _rebuild_slogan_labels
     HomeManagerDialog._refresh_slogan_list = _refresh_slogan_list
+    HomeManagerDialog._select_slogan = _select_slogan
+    HomeManagerDialog._suspend_slogan_sync = _suspend_slogan_sync
     HomeManagerDialog._load_slogan_editor = _load_slogan_editor
     HomeManagerDialog._on_slogan_select = _on_slogan_select
     HomeManagerDialog._apply_slogan_editor = _apply_slogan_editor
@@ -10817,12 +11884,21 @@ def _install_home_editor_final_v3():
     HomeManagerDialog.load_current_values = load_current_values
     HomeManagerDialog.load_image = prev_load_image
     HomeManagerDialog.remove_image = prev_remove_image
-    HomeManagerDialog.load_preview_image = prev_load_preview_image
+    HomeManagerDialog.load_preview_image = load_preview_image
     HomeManagerDialog._current_payload = _current_payload
+    HomeManagerDialog._preview_fingerprint = _preview_fingerprint
     HomeManagerDialog.update_preview = update_preview
+    HomeManagerDialog._flush_preview = _flush_preview
+    HomeManagerDialog._do_update_preview = _do_update_preview
+    HomeManagerDialog._preview_photo = _preview_photo
+    HomeManagerDialog._create_preview_items = _create_preview_items
     HomeManagerDialog.reset_defaults = reset_defaults
+    HomeManagerDialog._write_home_files = _write_home_files
+    HomeManagerDialog._submit_home_write = _submit_home_write
     HomeManagerDialog.save = save
+    HomeManagerDialog._open_preview_when_written = _open_preview_when_written
     HomeManagerDialog.preview = preview
+    HomeManagerDialog.destroy = destroy
     HomeManagerDialog.update_index_html = update_index_html
 
 
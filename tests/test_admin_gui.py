@@ -0,0 +1,223 @@
+"""admin_gui 의 파일/문자열 헬퍼 테스트 (Tk 창은 띄우지 않음)"""
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("PIL")
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import admin_gui  # noqa: E402
+from admin_gui import (  # noqa: E402
+    CaptionManager,
+    DropZone,
+    ImageOptimizer,
+    _VALID_IMAGE_EXTS,
+    _file_stamp,
+    _make_markdown_link,
+    _next_index,
+    _parse_cover_position,
+    _splice_home_hero,
+    _write_text_atomic,
+)
+
+
+def _touch(path, data=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _make_jpeg(path, color="red", size=(40, 30)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path, "JPEG")
+    return path
+
+
+# ---------------------------------------------------------------- _next_index
+
+def test_next_index_uses_highest_number_not_count(tmp_path):
+    _touch(tmp_path / "01.webp")
+    _touch(tmp_path / "03.jpg")
+    _touch(tmp_path / "notes.txt")
+    assert _next_index(tmp_path) == 4
+
+
+def test_next_index_filters_by_extension(tmp_path):
+    _touch(tmp_path / "2.webp")
+    _touch(tmp_path / "10.txt")
+    assert _next_index(tmp_path) == 11
+    assert _next_index(tmp_path, _VALID_IMAGE_EXTS) == 3
+
+
+def test_next_index_missing_folder(tmp_path):
+    assert _next_index(tmp_path / "missing") == 1
+
+
+# ------------------------------------------------------- _parse_cover_position
+
+@pytest.mark.parametrize("value, expected", [
+    ("30% 70%", (30.0, 70.0)),
+    ("12.5% -4%", (12.5, -4.0)),
+    ("left bottom", (0, 100)),
+    ("right top", (100, 0)),
+    ("center", (50, 50)),
+    ("", (50, 50)),
+    ("bogus 20%", (50, 20.0)),
+])
+def test_parse_cover_position(value, expected):
+    assert _parse_cover_position(value) == expected
+
+
+def test_make_markdown_link():
+    assert _make_markdown_link("글", "https://a.b/c", "underline") == "[글](https://a.b/c|underline)"
+
+
+# ------------------------------------------------------------ _splice_home_hero
+
+_HERO_HTML = """<html><head><title>t</title>
+<style id="homeEditorDynamicStyle">.old{}</style>
+</head><body>
+<img src="old.png" class="split-hero-img">
+<h1 class="split-hero-title"><a href="old" class="split-hero-title-link">Old</a></h1>
+<div class="split-hero-slogans"><p>old slogan</p></div>
+</body></html>"""
+
+
+def test_splice_home_hero_replaces_every_part_once():
+    out = _splice_home_hero(
+        _HERO_HTML,
+        '<style id="homeEditorDynamicStyle">.new{}</style>',
+        '<img src="new.png" class="split-hero-img">',
+        '<a href="new" class="split-hero-title-link">New</a>',
+        '<div class="split-hero-slogans"><p>new slogan</p></div>',
+    )
+    assert out.count('id="homeEditorDynamicStyle"') == 1
+    assert ".new{}" in out and ".old{}" not in out
+    assert out.index(".new{}") < out.index("</head>")
+    assert 'src="new.png"' in out and "old.png" not in out
+    assert '<h1 class="split-hero-title"><a href="new" class="split-hero-title-link">New</a></h1>' in out
+    assert "new slogan" in out and "old slogan" not in out
+
+
+def test_splice_home_hero_adds_slogans_after_title():
+    html = '<head></head><h1 class="split-hero-title">Plain</h1><footer></footer>'
+    out = _splice_home_hero(html, "<style></style>", "", "", '<div class="split-hero-slogans"></div>')
+    assert '<h1 class="split-hero-title">Plain</h1>\n        <div class="split-hero-slogans"></div>' in out
+
+
+# ------------------------------------------------- _write_text_atomic / _file_stamp
+
+def test_write_text_atomic_keeps_mode_and_leaves_no_temp(tmp_path):
+    target = tmp_path / "data.json"
+    assert _file_stamp(target) is None
+    _write_text_atomic(target, "하나")
+    os.chmod(target, 0o640)
+    _write_text_atomic(target, "둘")
+    assert target.read_text(encoding="utf-8") == "둘"
+    assert os.stat(target).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["data.json"]
+    assert _file_stamp(target) == (os.stat(target).st_mtime_ns, os.stat(target).st_size)
+
+
+# ------------------------------------------------------------ _renumber_images
+
+def _bare_zone(image_type, project_folder, images):
+    """Tk 위젯 없이 _renumber_images 만 쓸 수 있는 DropZone"""
+    zone = DropZone.__new__(DropZone)
+    zone.image_type = image_type
+    zone.project_folder = project_folder
+    zone.images = images
+    return zone
+
+
+def test_renumber_images_swaps_through_temp_names(tmp_path):
+    # 이미지로 열 수 없는 파일은 웹용으로 취급되어 이름만 바뀜
+    first = _touch(tmp_path / "01.webp", b"first")
+    second = _touch(tmp_path / "02.webp", b"second")
+    _bare_zone("sub", tmp_path, [second, first])._renumber_images()
+    assert (tmp_path / "01.webp").read_bytes() == b"second"
+    assert (tmp_path / "02.webp").read_bytes() == b"first"
+    assert sorted(os.listdir(tmp_path)) == ["01.webp", "02.webp"]
+
+
+def test_renumber_images_closes_gaps_without_touching_settled_files(tmp_path):
+    folder = tmp_path / "model_images"
+    one = _touch(folder / "1.webp", b"one")
+    four = _touch(folder / "4.webp", b"four")
+    stamp = _file_stamp(one)
+    _bare_zone("model", tmp_path, [one, four])._renumber_images()
+    assert sorted(os.listdir(folder)) == ["1.webp", "2.webp"]
+    assert (folder / "2.webp").read_bytes() == b"four"
+    assert _file_stamp(one) == stamp
+
+
+# --------------------------------------------------------------- process_batch
+
+def test_process_batch_continues_after_existing_numbers(tmp_path, monkeypatch):
+    monkeypatch.setattr(admin_gui, "USE_WEBP", True)
+    _touch(tmp_path / "project" / "03.webp")
+    sources = [_make_jpeg(tmp_path / "src" / f"{c}.jpg", c) for c in ("red", "green", "blue")]
+    processed, _ = ImageOptimizer.process_batch(sources, tmp_path / "project", "sub")
+    assert sorted(p.name for p in processed) == ["04.webp", "05.webp", "06.webp"]
+    # 파일 순서대로 번호가 붙음
+    with Image.open(tmp_path / "project" / "04.webp") as img:
+        assert img.convert("RGB").getpixel((0, 0))[0] > 200
+
+
+def test_process_batch_model_images_go_to_subfolder(tmp_path, monkeypatch):
+    monkeypatch.setattr(admin_gui, "USE_WEBP", True)
+    sources = [_make_jpeg(tmp_path / "src" / f"{i}.jpg") for i in range(2)]
+    processed, _ = ImageOptimizer.process_batch(sources, tmp_path / "project", "model")
+    assert sorted(os.listdir(tmp_path / "project" / "model_images")) == ["1.webp", "2.webp"]
+    assert {p.parent for p in processed} == {tmp_path / "project" / "model_images"}
+
+
+# -------------------------------------------------------------- CaptionManager
+
+@pytest.fixture
+def captions(monkeypatch):
+    """기록 지연을 길게 잡아 타이머가 테스트 중에 끼어들지 않게 함"""
+    monkeypatch.setattr(CaptionManager, "FLUSH_DELAY", 60)
+    yield CaptionManager
+    with CaptionManager._lock:
+        for timer in CaptionManager._flush_timers.values():
+            timer.cancel()
+        CaptionManager._flush_timers.clear()
+        CaptionManager._dirty.clear()
+        CaptionManager._cache.clear()
+
+
+def test_caption_flush_writes_pending_captions(tmp_path, captions):
+    captions.save_captions(tmp_path, {"sub_01": "캡션"})
+    caption_file = tmp_path / CaptionManager.CAPTION_FILE
+    assert not caption_file.exists()
+    assert captions.load_captions(tmp_path) == {"sub_01": "캡션"}
+
+    captions.flush(tmp_path)
+    assert json.loads(caption_file.read_text(encoding="utf-8")) == {"sub_01": "캡션"}
+    assert tmp_path not in CaptionManager._flush_timers
+
+
+def test_caption_flush_all_writes_every_folder(tmp_path, captions):
+    folders = [tmp_path / "a", tmp_path / "b"]
+    for i, folder in enumerate(folders):
+        captions.save_captions(folder, {"k": i})
+    captions.flush_all()
+    for i, folder in enumerate(folders):
+        assert json.loads((folder / CaptionManager.CAPTION_FILE).read_text(encoding="utf-8")) == {"k": i}
+    assert not CaptionManager._dirty
+
+
+def test_caption_flush_drops_captions_of_deleted_folder(tmp_path, captions):
+    folder = tmp_path / "project"
+    captions.save_captions(folder, {"k": "v"})
+    shutil.rmtree(folder)
+    captions.flush(folder)
+    assert not folder.exists()
+    assert folder not in CaptionManager._cache